@@ -0,0 +1,240 @@
+"""
+BeaconGlyphs - relatedGlyphs Graph
+
+Directed graph over `metadata.relatedGlyphs`, with glyphs as nodes and
+"A lists B as related" as the edge A -> B. Adjacency lists and their
+reverse edges are built once per registry version (see
+`BeaconGlyphs.graph()`), so neighbor lookups are O(degree). Connected
+components and cycles are computed on first use and cached on the graph.
+
+Nodes are registry positions internally; the public methods take and
+return glyph IDs.
+"""
+
+from collections import deque
+
+
+class GlyphGraph:
+    """Adjacency, traversal and structure queries over relatedGlyphs."""
+
+    DIRECTIONS = ('out', 'in', 'both')
+
+    def __init__(self, glyphs):
+        """
+        Build the graph from a sequence of glyph objects.
+
+        References to IDs that are not in `glyphs` are not added as
+        edges; they are collected in `dangling` instead.
+        """
+        ids = [glyph['id'] for glyph in glyphs]
+        position = {glyph_id: i for i, glyph_id in enumerate(ids)}
+
+        outgoing = []
+        incoming = [[] for _ in ids]
+        dangling = []
+        for source, glyph in enumerate(glyphs):
+            targets = []
+            for related_id in glyph.get('metadata', {}).get('relatedGlyphs', ()):
+                target = position.get(related_id)
+                if target is None:
+                    dangling.append((ids[source], related_id))
+                elif target not in targets:
+                    targets.append(target)
+                    incoming[target].append(source)
+            outgoing.append(tuple(targets))
+
+        self.ids = ids
+        self.dangling = dangling
+        self._position = position
+        self._outgoing = outgoing
+        self._incoming = [tuple(sources) for sources in incoming]
+        self._components = None
+        self._component_of = None
+        self._cycles = None
+
+    def __len__(self):
+        return len(self.ids)
+
+    def __contains__(self, glyph_id):
+        return glyph_id in self._position
+
+    @property
+    def edge_count(self):
+        return sum(len(targets) for targets in self._outgoing)
+
+    def _adjacent(self, node, direction):
+        if direction == 'out':
+            return self._outgoing[node]
+        if direction == 'in':
+            return self._incoming[node]
+        return self._outgoing[node] + self._incoming[node]
+
+    def _node(self, glyph_id, direction):
+        if direction not in self.DIRECTIONS:
+            raise ValueError(f"direction must be one of {', '.join(self.DIRECTIONS)}, got: {direction}")
+        node = self._position.get(glyph_id)
+        if node is None:
+            raise KeyError(glyph_id)
+        return node
+
+    def neighbors(self, glyph_id, direction='out'):
+        """
+        Get the glyphs directly connected to a glyph.
+
+        Args:
+            glyph_id: Glyph identifier
+            direction: 'out' (glyphs it lists as related), 'in' (glyphs
+                listing it) or 'both'
+
+        Returns:
+            List of glyph IDs, without duplicates
+        """
+        node = self._node(glyph_id, direction)
+        ids = self.ids
+        return [ids[n] for n in dict.fromkeys(self._adjacent(node, direction))]
+
+    def k_hop(self, glyph_id, k, direction='both'):
+        """
+        Get every glyph within `k` hops of a glyph.
+
+        Returns:
+            Dict of glyph ID -> hop distance (1..k), nearest first and in
+            registry order within each distance
+        """
+        start = self._node(glyph_id, direction)
+        distance = {start: 0}
+        frontier = [start]
+        for hop in range(1, k + 1):
+            found = set()
+            for node in frontier:
+                for neighbor in self._adjacent(node, direction):
+                    if neighbor not in distance:
+                        distance[neighbor] = hop
+                        found.add(neighbor)
+            if not found:
+                break
+            frontier = sorted(found)
+
+        del distance[start]
+        ids = self.ids
+        return {
+            ids[node]: hop
+            for node, hop in sorted(distance.items(), key=lambda item: (item[1], item[0]))
+        }
+
+    def _compute_components(self):
+        component_of = [-1] * len(self.ids)
+        components = []
+        for root in range(len(self.ids)):
+            if component_of[root] != -1:
+                continue
+            label = len(components)
+            component_of[root] = label
+            members = [root]
+            queue = deque(members)
+            while queue:
+                node = queue.popleft()
+                for neighbor in self._outgoing[node] + self._incoming[node]:
+                    if component_of[neighbor] == -1:
+                        component_of[neighbor] = label
+                        members.append(neighbor)
+                        queue.append(neighbor)
+            components.append(sorted(members))
+        self._components = components
+        self._component_of = component_of
+
+    def components(self):
+        """
+        Get the connected components, ignoring edge direction.
+
+        Returns:
+            List of components (lists of glyph IDs in registry order),
+            ordered by their first glyph's registry position
+        """
+        if self._components is None:
+            self._compute_components()
+        ids = self.ids
+        return [[ids[n] for n in members] for members in self._components]
+
+    def component_of(self, glyph_id):
+        """Get the IDs of all glyphs in the same component as a glyph."""
+        node = self._node(glyph_id, 'both')
+        if self._components is None:
+            self._compute_components()
+        ids = self.ids
+        return [ids[n] for n in self._components[self._component_of[node]]]
+
+    def _compute_cycles(self):
+        """Tarjan's strongly connected components, iteratively."""
+        outgoing = self._outgoing
+        count = len(outgoing)
+        index = [-1] * count
+        lowlink = [0] * count
+        on_stack = [False] * count
+        stack = []
+        cycles = []
+        counter = 0
+
+        for root in range(count):
+            if index[root] != -1:
+                continue
+            work = [(root, 0)]
+            index[root] = lowlink[root] = counter
+            counter += 1
+            stack.append(root)
+            on_stack[root] = True
+
+            while work:
+                node, i = work[-1]
+                targets = outgoing[node]
+                if i < len(targets):
+                    work[-1] = (node, i + 1)
+                    target = targets[i]
+                    if index[target] == -1:
+                        index[target] = lowlink[target] = counter
+                        counter += 1
+                        stack.append(target)
+                        on_stack[target] = True
+                        work.append((target, 0))
+                    elif on_stack[target]:
+                        lowlink[node] = min(lowlink[node], index[target])
+                    continue
+
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    lowlink[parent] = min(lowlink[parent], lowlink[node])
+                if lowlink[node] == index[node]:
+                    members = []
+                    while True:
+                        member = stack.pop()
+                        on_stack[member] = False
+                        members.append(member)
+                        if member == node:
+                            break
+                    if len(members) > 1 or node in outgoing[node]:
+                        cycles.append(sorted(members))
+
+        cycles.sort()
+        self._cycles = cycles
+
+    def cycles(self):
+        """
+        Find groups of glyphs whose relatedGlyphs references form a cycle.
+
+        Returns:
+            List of strongly connected components with more than one glyph
+            (or a glyph that lists itself), as lists of glyph IDs
+        """
+        if self._cycles is None:
+            self._compute_cycles()
+        ids = self.ids
+        return [[ids[n] for n in members] for members in self._cycles]
+
+    def orphans(self):
+        """Get the IDs of glyphs with no relatedGlyphs edges in either direction."""
+        ids = self.ids
+        return [
+            ids[node] for node in range(len(ids))
+            if not self._outgoing[node] and not self._incoming[node]
+        ]
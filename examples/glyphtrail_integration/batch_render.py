@@ -0,0 +1,299 @@
+#!/usr/bin/env python3
+"""
+Render lineage reports for many sessions across a process pool.
+
+Sessions come from persisted logs (`.gtlog` paths, or every log in a
+SessionStore directory) or from in-memory GlyphtrailSessions. They are
+split into shards of `shard_size` sessions. A ProcessPoolExecutor
+renders the shards, and each worker parses the glyph registry once
+when it starts. Logs are opened with MappedSessionLog, so a worker
+never loads a whole log into memory, and the logs are never modified.
+
+The output is either:
+
+    out_dir         one `<session>.txt` lineage file per session,
+                    written by the workers themselves
+    stream          all lineages concatenated in input order, written
+                    by the parent process as shards complete
+
+A session that fails to render (an unreadable or corrupt log, say) is
+reported in the returned stats and skipped; the rest of the batch is
+still rendered. With out_dir, two sessions that would write the same
+`<session>.txt` (logs with the same name in different directories, or
+the same log given twice) are a failure too: only the first is written.
+
+At most a few shards per worker are in flight at a time. Apart from the
+set of output names used, memory in the parent therefore does not grow
+with the number of sessions.
+
+Usage:
+    python examples/glyphtrail_integration/batch_render.py STORE_DIR|LOG... [--out-dir DIR]
+                                                          [--jobs N] [--shard-size N]
+"""
+
+import argparse
+import io
+import os
+import sys
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from mapped_log import MappedSessionLog
+from session_log import LOG_SUFFIX, SessionStore
+from session_renderer import BeaconGlyphsLoader, GlyphtrailSession
+
+
+LINEAGE_SUFFIX = '.txt'
+SHARD_SIZE = 64
+
+# Set in each worker process by _init_worker
+_options = {}
+
+
+def _init_worker(format, out_dir):
+    """Load the registry once per worker process and remember the options."""
+    BeaconGlyphsLoader()
+    _options['format'] = format
+    _options['out_dir'] = out_dir and SessionStore(out_dir)
+
+
+def _name(source):
+    """Session name a source's lineage file is named after."""
+    return source[0] if isinstance(source, tuple) else Path(source).stem
+
+
+def _label(source):
+    """How a source is identified in failure reports."""
+    return source[0] if isinstance(source, tuple) else source
+
+
+def _render_one(source, stream, format):
+    """
+    Write one session's lineage followed by a newline.
+
+    Returns:
+        (session name, events rendered)
+    """
+    if isinstance(source, tuple):
+        session_id, agent_name, rows = source
+        session = GlyphtrailSession(session_id, agent_name)
+        for event_type, message, epoch, metadata in rows:
+            session.add_event(event_type, message, metadata, epoch)
+        session.write_lineage(stream, format)
+        stream.write('\n')
+        return session_id, len(rows)
+
+    with MappedSessionLog(source) as log:
+        GlyphtrailSession.from_log(log).write_lineage(stream, format)
+        stream.write('\n')
+        return Path(source).stem, len(log)
+
+
+def _render_shard(shard):
+    """
+    Render a shard of sessions in a worker.
+
+    A session that raises is left out of the output (a partly written
+    file is removed) and reported in 'failed'; the rest of the shard is
+    still rendered.
+
+    Returns:
+        Dict with the worker's 'pid', rendered 'sessions', 'events',
+        'cpu' seconds, 'failed' [(source, error message)] and, without
+        an out_dir, the concatenated 'text'
+    """
+    started = time.process_time()
+    format = _options['format']
+    store = _options['out_dir']
+    buffer = None if store else io.StringIO()
+    sessions = 0
+    events = 0
+    failed = []
+    for source in shard:
+        path = None
+        mark = None if store else buffer.tell()
+        try:
+            if store:
+                path = store.path_for(_name(source)).with_suffix(LINEAGE_SUFFIX)
+                with open(path, 'w', encoding='utf-8') as f:
+                    events += _render_one(source, f, format)[1]
+            else:
+                events += _render_one(source, buffer, format)[1]
+        except Exception as e:
+            failed.append((_label(source), f"{type(e).__name__}: {e}"))
+            if store:
+                if path is not None:
+                    try:
+                        path.unlink()
+                    except FileNotFoundError:
+                        pass
+            else:
+                buffer.seek(mark)
+                buffer.truncate()
+            continue
+        sessions += 1
+
+    return {
+        'pid': os.getpid(),
+        'sessions': sessions,
+        'events': events,
+        'cpu': time.process_time() - started,
+        'failed': failed,
+        'text': buffer and buffer.getvalue(),
+    }
+
+
+def _sources(items):
+    """Normalize sessions, logs and store directories to picklable sources."""
+    for item in items:
+        if isinstance(item, GlyphtrailSession):
+            yield item.session_id, item.agent_name, list(item.events.iter_rows())
+        elif Path(item).is_dir():
+            yield from (str(path) for path in sorted(Path(item).glob(f'*{LOG_SUFFIX}')))
+        else:
+            yield str(item)
+
+
+def _unique_names(sources, failed):
+    """Drop (and report in `failed`) sources whose output name is already taken."""
+    written = {}
+    for source in sources:
+        name = _name(source)
+        if name in written:
+            failed.append((_label(source), f"{name}{LINEAGE_SUFFIX} is already written "
+                                           f"for {written[name]}"))
+        else:
+            written[name] = _label(source)
+            yield source
+
+
+def _shards(sources, shard_size):
+    shard = []
+    for source in sources:
+        shard.append(source)
+        if len(shard) >= shard_size:
+            yield shard
+            shard = []
+    if shard:
+        yield shard
+
+
+def render_batch(items, out_dir=None, stream=None, format='unicode', jobs=None,
+                 shard_size=SHARD_SIZE):
+    """
+    Render the lineage of many sessions in parallel.
+
+    Args:
+        items: GlyphtrailSessions, `.gtlog` paths and/or SessionStore
+            directories (each expands to every log in it, sorted)
+        out_dir: Write one `<session>.txt` file per session here
+        stream: Otherwise, write all lineages to this text stream in
+            input order (default: sys.stdout)
+        format: Glyph format ('unicode', 'text' or 'emoji')
+        jobs: Worker processes (default: CPU count; 1 renders in-process)
+        shard_size: Sessions per task sent to a worker
+
+    Returns:
+        Dict with rendered 'sessions', 'events', 'elapsed' (wall
+        seconds), 'jobs', 'failed' [(session or log, error message)]
+        and 'workers' (pid -> {'sessions', 'events', 'cpu'})
+    """
+    if out_dir is not None:
+        out_dir = Path(out_dir)
+        out_dir.mkdir(parents=True, exist_ok=True)
+    elif stream is None:
+        stream = sys.stdout
+    jobs = jobs or os.cpu_count() or 1
+
+    stats = {'sessions': 0, 'events': 0, 'elapsed': 0.0, 'jobs': jobs, 'failed': [],
+             'workers': {}}
+
+    def collect(result):
+        worker = stats['workers'].setdefault(result['pid'], {'sessions': 0, 'events': 0, 'cpu': 0.0})
+        for key in ('sessions', 'events', 'cpu'):
+            worker[key] += result[key]
+            if key != 'cpu':
+                stats[key] += result[key]
+        stats['failed'].extend(result['failed'])
+        if result['text'] is not None:
+            stream.write(result['text'])
+
+    started = time.perf_counter()
+    sources = _sources(items)
+    if out_dir is not None:
+        sources = _unique_names(sources, stats['failed'])
+    shards = _shards(sources, shard_size)
+    options = (format, out_dir and str(out_dir))
+
+    if jobs == 1:
+        _init_worker(*options)
+        for shard in shards:
+            collect(_render_shard(shard))
+    else:
+        with ProcessPoolExecutor(max_workers=jobs, initializer=_init_worker,
+                                 initargs=options) as pool:
+            pending = deque()
+            for shard in shards:
+                pending.append(pool.submit(_render_shard, shard))
+                # Keep a few shards per worker in flight, collecting in order
+                if len(pending) >= jobs * 4:
+                    collect(pending.popleft().result())
+            while pending:
+                collect(pending.popleft().result())
+
+    stats['elapsed'] = time.perf_counter() - started
+    return stats
+
+
+def print_throughput(stats, stream=sys.stderr):
+    """Print overall, per-core and per-worker rendering throughput."""
+    elapsed = stats['elapsed'] or 1e-9
+    workers = len(stats['workers']) or 1
+    cores = min(workers, os.cpu_count() or 1)
+    print(f"Rendered {stats['sessions']} sessions ({stats['events']} events) "
+          f"in {elapsed:.2f}s with {workers} worker(s) on {cores} core(s)", file=stream)
+    print(f"  {stats['sessions'] / elapsed:12.1f} sessions/s  "
+          f"{stats['events'] / elapsed:12.1f} events/s", file=stream)
+    print(f"  {stats['sessions'] / elapsed / cores:12.1f} sessions/s per core  "
+          f"{stats['events'] / elapsed / cores:12.1f} events/s per core", file=stream)
+    for pid, worker in sorted(stats['workers'].items()):
+        cpu = worker['cpu'] or 1e-9
+        print(f"  worker {pid}: {worker['sessions']} sessions, {worker['events']} events, "
+              f"{worker['cpu']:.2f}s CPU ({worker['sessions'] / cpu:.1f} sessions per CPU second)",
+              file=stream)
+    if stats['failed']:
+        print(f"{len(stats['failed'])} session(s) failed:", file=stream)
+        for source, error in stats['failed']:
+            print(f"  {source}: {error}", file=stream)
+
+
+def main():
+    """Render persisted sessions in parallel and report throughput."""
+    parser = argparse.ArgumentParser(description="Render many Glyphtrail session lineages in parallel.")
+    parser.add_argument('logs', nargs='+', type=Path, help='.gtlog files or SessionStore directories')
+    parser.add_argument('--out-dir', type=Path, default=None,
+                        help='write one <session>.txt per session (default: concatenate to stdout)')
+    parser.add_argument('--format', default='unicode', choices=['unicode', 'text', 'emoji'])
+    parser.add_argument('--jobs', '-j', type=int, default=None, help='worker processes (default: CPU count)')
+    parser.add_argument('--shard-size', type=int, default=SHARD_SIZE, help='sessions per worker task')
+    args = parser.parse_args()
+
+    missing = [path for path in args.logs if not path.exists()]
+    if missing:
+        print(f"Error: not found: {', '.join(map(str, missing))}", file=sys.stderr)
+        return 1
+
+    try:
+        stats = render_batch(args.logs, args.out_dir, format=args.format, jobs=args.jobs,
+                             shard_size=args.shard_size)
+    except (OSError, ValueError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+    print_throughput(stats)
+    return 1 if stats['failed'] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,659 @@
+#!/usr/bin/env python3
+"""
+asyncio ingestion service for Glyphtrail events.
+
+Many producers (agents) send batches of events concurrently over a local
+Unix socket or TCP on localhost. The service routes each batch to its
+session. Every session has a bounded queue and one writer task that
+appends to the session's persistent log (see session_log.py). Rendering
+is available on request.
+
+Protocol: newline-delimited JSON, one request per line, answered in
+order on the same connection (requests may be pipelined):
+
+    {"op": "append", "session": "s-1", "agent": "Alice",
+     "events": [{"type": "session.start", "message": "...",
+                 "timestamp": 1763020800.0, "metadata": {...}}, ...]}
+        -> {"ok": true, "accepted": 1}
+    {"op": "lineage" | "timeline", "session": "s-1", "format": "unicode",
+     "since": ..., "until": ...}
+        -> {"chunk": "..."} ... {"ok": true, "done": true}
+           (the chunks concatenate to render_lineage()/render_timeline())
+    {"op": "flush"}     -> {"ok": true}     (everything accepted is fsynced)
+    {"op": "stats"}     -> {"ok": true, "stats": {...}}
+
+Errors are answered with {"ok": false, "error": "..."}.
+
+An append is acknowledged before it is written. If writing or syncing a
+session's log fails, the error is counted in the stats and the session
+is marked failed; batches still queued for it are dropped. The error is
+returned once: to the next append or render of that session, or to the
+next flush (which reports every failed session). The failed session is
+then closed, and the request after that reopens its log from disk, so
+a failure never blocks other sessions or later flushes.
+
+Backpressure: an append is only acknowledged once its batch is in the
+session's queue. When a session's writer falls behind, its queue fills
+and the connection stops being read. TCP/socket flow control then slows
+the producer, and memory stays bounded by `queue_size` batches of at
+most `max_batch` events per session.
+
+Writers fsync in a worker thread, every `flush_every` events or after
+`flush_interval` seconds. The event loop keeps serving other sessions
+while a disk sync is in progress.
+
+Each resident session holds two open files (its log and index). When
+opening a session would exceed `max_sessions`, the least recently used
+idle sessions (nothing queued, everything synced, not being rendered)
+are closed first. They are reopened from disk on their next request.
+
+Usage:
+    python examples/glyphtrail_integration/ingest_service.py serve --store sessions/ --socket /tmp/glyphtrail.sock
+    python examples/glyphtrail_integration/ingest_service.py loadtest --producers 32 --sessions 64
+"""
+
+import argparse
+import asyncio
+import json
+import multiprocessing
+import os
+import sys
+import tempfile
+import time
+from collections import OrderedDict
+from itertools import islice
+from pathlib import Path
+
+from session_log import SessionStore
+from session_renderer import GlyphtrailSession
+
+
+# Largest request line accepted (bytes)
+MAX_LINE = 16 << 20
+
+
+def _validate_events(events, max_batch):
+    """Check a batch of event dicts before it is queued."""
+    if not isinstance(events, list) or not events:
+        raise ValueError("'events' must be a non-empty list")
+    if len(events) > max_batch:
+        raise ValueError(f"Batch of {len(events)} events exceeds the limit of {max_batch}")
+    for event in events:
+        if not isinstance(event, dict):
+            raise ValueError("Each event must be an object")
+        if not isinstance(event.get('type'), str) or not isinstance(event.get('message'), str):
+            raise ValueError("Each event needs string 'type' and 'message' fields")
+        if len(event['type'].encode('utf-8')) > 0xFFFF:
+            raise ValueError("Event 'type' is longer than 65535 bytes")
+        timestamp = event.get('timestamp')
+        if timestamp is not None and not isinstance(timestamp, (int, float)):
+            raise ValueError("'timestamp' must be epoch seconds")
+        metadata = event.get('metadata')
+        if metadata is not None and not isinstance(metadata, dict):
+            raise ValueError("'metadata' must be an object")
+
+
+class _SessionState:
+    """A session's log, rendering view, queue and writer task."""
+
+    __slots__ = ('log', 'session', 'queue', 'lock', 'task', 'unsynced', 'events',
+                 'pending', 'users', 'error', 'retired')
+
+    def __init__(self, log, queue_size):
+        self.log = log
+        self.session = GlyphtrailSession.from_log(log)
+        self.queue = asyncio.Queue(maxsize=queue_size)
+        # Held while the log is appended to, flushed or read
+        self.lock = asyncio.Lock()
+        self.task = None
+        self.unsynced = 0
+        self.events = 0
+        # Batches queued but not yet written, and requests using the session
+        self.pending = 0
+        self.users = 0
+        # Set when writing or syncing the log failed
+        self.error = None
+        # Set once the error is reported and the session dropped
+        self.retired = False
+
+    def idle(self):
+        """True if the session can be closed without losing or blocking anything."""
+        return not (self.pending or self.users or self.unsynced or self.lock.locked()
+                    or self.error)
+
+
+class IngestService:
+    """Accepts event batches from many producers and persists them per session."""
+
+    def __init__(self, store, queue_size=64, max_batch=10000, flush_every=8192,
+                 flush_interval=0.5, max_sessions=256):
+        """
+        Args:
+            store: SessionStore (or directory) the sessions are written to
+            queue_size: Batches buffered per session before producers block
+            max_batch: Largest batch accepted in one request
+            flush_every: fsync a session after this many events...
+            flush_interval: ...or when its oldest unsynced event is this old
+            max_sessions: Sessions kept open; idle ones beyond this are
+                closed, least recently used first
+        """
+        if not isinstance(store, SessionStore):
+            # The service decides when to sync; never fsync inside append()
+            store = SessionStore(store, sync_every=float('inf'), sync_interval=float('inf'))
+        self.store = store
+        self.queue_size = queue_size
+        self.max_batch = max_batch
+        self.flush_every = flush_every
+        self.flush_interval = flush_interval
+        self.max_sessions = max_sessions
+        # Session ID -> _SessionState, least recently used first
+        self._sessions = OrderedDict()
+        self._server = None
+        self.stats = {
+            'connections': 0,
+            'batches': 0,
+            'events': 0,
+            'blocked_puts': 0,
+            'flushes': 0,
+            'errors': 0,
+            'write_errors': 0,
+            'sessions_closed': 0,
+        }
+
+    def _state(self, session_id, agent_name=None, create=True):
+        state = self._sessions.get(session_id)
+        if state is None:
+            if not create and session_id not in self.store:
+                raise KeyError(f"Unknown session: {session_id}")
+            self._close_idle(len(self._sessions) + 1 - self.max_sessions)
+            state = _SessionState(self.store.open(session_id, agent_name), self.queue_size)
+            state.task = asyncio.get_running_loop().create_task(self._writer(state))
+            self._sessions[session_id] = state
+        else:
+            self._sessions.move_to_end(session_id)
+        if state.error is not None:
+            self._report(state)
+        return state
+
+    def _report(self, state):
+        """Raise a failed session's error, dropping the session first."""
+        self._retire(state)
+        raise OSError(state.error)
+
+    def _retire(self, state):
+        """
+        Drop a failed session so its next request reopens the log.
+
+        The log is closed at once if nothing is using the session;
+        otherwise the last user (or the writer, once it has dropped the
+        batches still queued) closes it.
+        """
+        session_id = state.session.session_id
+        if self._sessions.get(session_id) is state:
+            del self._sessions[session_id]
+        state.retired = True
+        self._close_retired(state)
+
+    def _close_retired(self, state):
+        """Close a retired session's log once nothing uses it. Returns True if closed."""
+        if not state.retired or state.users or state.pending or state.lock.locked() \
+                or state.log.closed:
+            return False
+        if state.task is not asyncio.current_task():
+            state.task.cancel()
+        try:
+            state.log.close()
+        except OSError:
+            # Already reported; close() still releases the files
+            pass
+        return True
+
+    def _close_idle(self, count):
+        """
+        Close up to `count` idle sessions, least recently used first.
+
+        Idle sessions have nothing unsynced, so closing one does not wait
+        on the disk. Busy sessions are skipped; they stay open until a
+        later call finds them idle.
+        """
+        if count <= 0:
+            return
+        for session_id, state in list(self._sessions.items()):
+            if state.idle():
+                del self._sessions[session_id]
+                state.task.cancel()
+                state.log.close()
+                self.stats['sessions_closed'] += 1
+                count -= 1
+                if not count:
+                    return
+
+    def _fail(self, state, error):
+        """Mark a session failed after its log could not be written or synced."""
+        self.stats['write_errors'] += 1
+        if state.error is None:
+            state.error = f"Writing session {state.session.session_id} failed: {error}"
+
+    async def submit(self, session_id, events, agent_name=None):
+        """
+        Queue a batch of event dicts for a session.
+
+        Waits while the session's queue is full (backpressure).
+
+        Returns:
+            Number of events accepted
+        """
+        _validate_events(events, self.max_batch)
+        state = self._state(session_id, agent_name)
+        state.users += 1
+        try:
+            if state.queue.full():
+                self.stats['blocked_puts'] += 1
+            await state.queue.put(events)
+            state.pending += 1
+        finally:
+            state.users -= 1
+        if state.error is not None:
+            # The writer failed while this batch waited; it will be dropped
+            self._report(state)
+        self.stats['batches'] += 1
+        self.stats['events'] += len(events)
+        return len(events)
+
+    async def _writer(self, state):
+        """
+        Drain one session's queue into its log, syncing in batches.
+
+        Every batch taken from the queue is marked done, even if writing
+        it fails, so flush() and render() never wait forever. After a
+        failure, the session's remaining batches are dropped.
+        """
+        queue = state.queue
+        loop = asyncio.get_running_loop()
+        deadline = None
+        while True:
+            try:
+                timeout = None if deadline is None else max(deadline - loop.time(), 0)
+                batches = [await asyncio.wait_for(queue.get(), timeout)]
+            except asyncio.TimeoutError:
+                await self._flush(state)
+                deadline = None
+                continue
+
+            try:
+                # Take everything already queued in one go
+                while not queue.empty():
+                    batches.append(queue.get_nowait())
+                if state.error is not None:
+                    continue
+
+                async with state.lock:
+                    add_event = state.session.add_event
+                    for batch in batches:
+                        for event in batch:
+                            add_event(event['type'], event['message'], event.get('metadata'),
+                                      event.get('timestamp'))
+                        state.unsynced += len(batch)
+                        state.events += len(batch)
+
+                if deadline is None:
+                    deadline = loop.time() + self.flush_interval
+                if state.unsynced >= self.flush_every:
+                    await self._flush(state)
+                    deadline = None
+            except Exception as e:
+                self._fail(state, e)
+            finally:
+                for _ in batches:
+                    queue.task_done()
+                state.pending -= len(batches)
+            if self._close_retired(state):
+                return
+
+    async def _flush(self, state):
+        """fsync a session's log; a failure marks the session failed."""
+        async with state.lock:
+            if state.unsynced and state.error is None:
+                try:
+                    await asyncio.get_running_loop().run_in_executor(None, state.log.flush)
+                except Exception as e:
+                    self._fail(state, e)
+                    return
+                state.unsynced = 0
+                self.stats['flushes'] += 1
+
+    async def flush(self):
+        """
+        Wait until every accepted event is written, then fsync all sessions.
+
+        Raises:
+            OSError: if a session failed to write or sync since its error
+                was last reported (each failure is reported once)
+        """
+        for state in list(self._sessions.values()):
+            await state.queue.join()
+        await asyncio.gather(*(self._flush(state) for state in list(self._sessions.values())))
+        failed = [state for state in self._sessions.values() if state.error is not None]
+        for state in failed:
+            self._retire(state)
+        if failed:
+            raise OSError('; '.join(state.error for state in failed))
+
+    async def render(self, session_id, kind='lineage', format='unicode', since=None,
+                     until=None, chunk_lines=1024):
+        """
+        Render a session as it stands after all events accepted so far.
+
+        Yields pieces of text that concatenate to render_lineage() (or
+        render_timeline() for kind='timeline'). Each piece is rendered
+        under the session's lock, and the lock is released between
+        pieces, so ingestion continues while a long session streams out.
+        """
+        if kind not in ('lineage', 'timeline'):
+            raise ValueError(f"kind must be 'lineage' or 'timeline', got: {kind}")
+        state = self._state(session_id, create=False)
+        state.users += 1
+        try:
+            await state.queue.join()
+            if state.error is not None:
+                self._report(state)
+
+            session = state.session
+            if since is not None or until is not None:
+                session = GlyphtrailSession.from_log(state.log, since, until)
+            if kind == 'lineage':
+                parts, separator = session.iter_lineage(format), '\n'
+            else:
+                parts, separator = session.iter_timeline(format), ' '
+
+            first = True
+            while True:
+                async with state.lock:
+                    chunk = list(islice(parts, chunk_lines))
+                if not chunk:
+                    return
+                yield ('' if first else separator) + separator.join(chunk)
+                first = False
+        finally:
+            state.users -= 1
+            self._close_retired(state)
+
+    async def start(self, socket_path=None, host='127.0.0.1', port=0):
+        """
+        Start listening on a Unix socket (if `socket_path`) or TCP.
+
+        Returns:
+            The socket path, or the (host, port) actually bound
+        """
+        if socket_path is not None:
+            self._server = await asyncio.start_unix_server(
+                self._handle, path=str(socket_path), limit=MAX_LINE
+            )
+            return str(socket_path)
+        self._server = await asyncio.start_server(self._handle, host, port, limit=MAX_LINE)
+        return self._server.sockets[0].getsockname()[:2]
+
+    async def serve_forever(self):
+        async with self._server:
+            await self._server.serve_forever()
+
+    async def close(self):
+        """Stop accepting connections, persist everything and close the logs."""
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+        try:
+            await self.flush()
+        finally:
+            for state in self._sessions.values():
+                state.task.cancel()
+            await asyncio.gather(*(s.task for s in self._sessions.values()),
+                                 return_exceptions=True)
+            for state in self._sessions.values():
+                try:
+                    state.log.close()
+                except OSError:
+                    # Already reported through the failed session
+                    pass
+            self._sessions.clear()
+
+    async def _handle(self, reader, writer):
+        self.stats['connections'] += 1
+        try:
+            while True:
+                try:
+                    line = await reader.readline()
+                except ValueError:
+                    # Line longer than MAX_LINE; the stream cannot be resynchronized
+                    await self._send(writer, {'ok': False, 'error': 'Request too large'})
+                    break
+                if not line:
+                    break
+                await self._dispatch(line, writer)
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    async def _dispatch(self, line, writer):
+        try:
+            request = json.loads(line)
+            op = request.get('op')
+            if op == 'append':
+                accepted = await self.submit(request['session'], request.get('events'),
+                                             request.get('agent'))
+                await self._send(writer, {'ok': True, 'accepted': accepted})
+            elif op in ('lineage', 'timeline'):
+                async for chunk in self.render(request['session'], op,
+                                               request.get('format', 'unicode'),
+                                               request.get('since'), request.get('until')):
+                    await self._send(writer, {'chunk': chunk})
+                await self._send(writer, {'ok': True, 'done': True})
+            elif op == 'flush':
+                await self.flush()
+                await self._send(writer, {'ok': True})
+            elif op == 'stats':
+                await self._send(writer, {'ok': True, 'stats': dict(self.stats,
+                                                                    sessions=len(self._sessions))})
+            else:
+                raise ValueError(f"Unknown op: {op!r}")
+        except (ValueError, KeyError, TypeError, AttributeError, OSError) as e:
+            self.stats['errors'] += 1
+            message = e.args[0] if isinstance(e, KeyError) and e.args else str(e)
+            await self._send(writer, {'ok': False, 'error': str(message)})
+
+    @staticmethod
+    async def _send(writer, response):
+        writer.write(json.dumps(response, ensure_ascii=False).encode('utf-8') + b'\n')
+        await writer.drain()
+
+
+class IngestError(Exception):
+    """An error response from the ingestion service."""
+
+
+class IngestClient:
+    """Minimal asyncio client for the ingestion service."""
+
+    def __init__(self, reader, writer):
+        self._reader = reader
+        self._writer = writer
+
+    @classmethod
+    async def connect(cls, socket_path=None, host='127.0.0.1', port=None):
+        if socket_path is not None:
+            reader, writer = await asyncio.open_unix_connection(str(socket_path), limit=MAX_LINE)
+        else:
+            reader, writer = await asyncio.open_connection(host, port, limit=MAX_LINE)
+        return cls(reader, writer)
+
+    async def _request(self, request):
+        self._writer.write(json.dumps(request, ensure_ascii=False).encode('utf-8') + b'\n')
+        await self._writer.drain()
+        return await self._response()
+
+    async def _response(self):
+        line = await self._reader.readline()
+        if not line:
+            raise ConnectionError("Connection closed by the service")
+        response = json.loads(line)
+        if response.get('ok') is False:
+            raise IngestError(response.get('error'))
+        return response
+
+    async def append(self, session_id, events, agent_name=None):
+        """Send one batch of event dicts; returns the number accepted."""
+        request = {'op': 'append', 'session': session_id, 'events': events}
+        if agent_name is not None:
+            request['agent'] = agent_name
+        return (await self._request(request))['accepted']
+
+    async def render(self, session_id, kind='lineage', format='unicode', since=None, until=None):
+        """Render a session's lineage or timeline."""
+        response = await self._request({'op': kind, 'session': session_id, 'format': format,
+                                        'since': since, 'until': until})
+        parts = []
+        while 'chunk' in response:
+            parts.append(response['chunk'])
+            response = await self._response()
+        return ''.join(parts)
+
+    async def flush(self):
+        await self._request({'op': 'flush'})
+
+    async def stats(self):
+        return (await self._request({'op': 'stats'}))['stats']
+
+    async def close(self):
+        self._writer.close()
+        await self._writer.wait_closed()
+
+
+async def _serve(store_dir, socket_path=None, port=0, ready=None, **options):
+    service = IngestService(store_dir, **options)
+    address = await service.start(socket_path, port=port)
+    print(f"Listening on {address}, storing sessions in {store_dir}", flush=True)
+    if ready is not None:
+        ready.set()
+    try:
+        await service.serve_forever()
+    finally:
+        await service.close()
+
+
+def _serve_process(store_dir, socket_path, ready, options):
+    try:
+        asyncio.run(_serve(store_dir, socket_path, ready=ready, **options))
+    except KeyboardInterrupt:
+        pass
+
+
+async def _producer(socket_path, session_ids, batches, batch_size, latencies):
+    """Send `batches` batches round-robin over `session_ids`, waiting for each ack."""
+    client = await IngestClient.connect(socket_path)
+    types = list(GlyphtrailSession.EVENT_GLYPH_MAP)
+    try:
+        for b in range(batches):
+            session_id = session_ids[b % len(session_ids)]
+            events = [
+                {'type': types[(b + i) % len(types)], 'message': f"event {b}.{i}",
+                 'timestamp': time.time()}
+                for i in range(batch_size)
+            ]
+            start = time.perf_counter()
+            await client.append(session_id, events, agent_name=f"Agent-{session_id}")
+            latencies.append(time.perf_counter() - start)
+    finally:
+        await client.close()
+
+
+async def _load_test(socket_path, producers, sessions, events, batch_size):
+    session_ids = [f"load-{i:05d}" for i in range(sessions)]
+    batches = max(1, events // (producers * batch_size))
+    latencies = []
+
+    start = time.perf_counter()
+    await asyncio.gather(*(
+        _producer(socket_path, session_ids[p::producers] or [session_ids[p % sessions]],
+                  batches, batch_size, latencies)
+        for p in range(producers)
+    ))
+    acked = time.perf_counter() - start
+
+    client = await IngestClient.connect(socket_path)
+    await client.flush()
+    durable = time.perf_counter() - start
+    stats = await client.stats()
+    sample = await client.render(session_ids[0], 'timeline')
+    await client.close()
+
+    total = producers * batches * batch_size
+    latencies.sort()
+    print(f"{producers} producers x {batches} batches x {batch_size} events "
+          f"into {sessions} sessions = {total} events")
+    print(f"  acknowledged: {acked:.2f}s  ({total / acked:,.0f} events/s)")
+    print(f"  durable:      {durable:.2f}s  ({total / durable:,.0f} events/s)")
+    print(f"  ack latency:  p50 {latencies[len(latencies) // 2] * 1000:.1f} ms, "
+          f"p99 {latencies[int(len(latencies) * 0.99)] * 1000:.1f} ms, "
+          f"max {latencies[-1] * 1000:.1f} ms")
+    print(f"  server:       {stats['flushes']} fsync batches, "
+          f"{stats['blocked_puts']} producer waits on full queues")
+    print(f"  timeline of {session_ids[0]}: {len(sample.split())} glyphs")
+
+
+def main():
+    """Run the service, or a load test against a fresh one."""
+    parser = argparse.ArgumentParser(description="Glyphtrail event ingestion service.")
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    serve = commands.add_parser('serve', help='run the service')
+    serve.add_argument('--store', type=Path, required=True, help='session log directory')
+    serve.add_argument('--socket', type=Path, default=None, help='Unix socket path')
+    serve.add_argument('--port', type=int, default=7400, help='TCP port on localhost '
+                       '(when --socket is not given)')
+
+    load = commands.add_parser('loadtest', help='measure throughput against a fresh service')
+    load.add_argument('--producers', type=int, default=16)
+    load.add_argument('--sessions', type=int, default=64)
+    load.add_argument('--events', type=int, default=200000, help='total events to send')
+    load.add_argument('--batch', type=int, default=200, help='events per batch')
+
+    for command in (serve, load):
+        command.add_argument('--queue-size', type=int, default=64,
+                             help='batches buffered per session')
+        command.add_argument('--flush-every', type=int, default=8192,
+                             help='events per fsync batch')
+        command.add_argument('--max-sessions', type=int, default=256,
+                             help='sessions kept open (idle ones beyond this are closed)')
+    args = parser.parse_args()
+    options = {'queue_size': args.queue_size, 'flush_every': args.flush_every,
+               'max_sessions': args.max_sessions}
+
+    if args.command == 'serve':
+        try:
+            asyncio.run(_serve(args.store, args.socket, args.port, **options))
+        except KeyboardInterrupt:
+            pass
+        return 0
+
+    # The service runs in its own process so producers do not share its CPU
+    with tempfile.TemporaryDirectory() as root:
+        socket_path = os.path.join(root, 'ingest.sock')
+        ready = multiprocessing.Event()
+        server = multiprocessing.Process(
+            target=_serve_process, args=(os.path.join(root, 'sessions'), socket_path, ready, options)
+        )
+        server.start()
+        try:
+            if not ready.wait(10):
+                print("Error: service did not start")
+                return 1
+            asyncio.run(_load_test(socket_path, args.producers, args.sessions, args.events, args.batch))
+        finally:
+            server.terminate()
+            server.join()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
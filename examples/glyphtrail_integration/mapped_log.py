@@ -0,0 +1,391 @@
+#!/usr/bin/env python3
+"""
+Memory-mapped reader for archived Glyphtrail session logs.
+
+`MappedSessionLog` reads the `.gtlog` / `.gtidx` files written by
+`SessionLog` without reading them into Python objects. Both files are
+memory-mapped read-only. Record headers and index entries are
+fixed-width, so the reader walks them in place with
+`struct.unpack_from` over a `memoryview`. Nothing is copied except the
+payload bytes of fields that are actually returned, and each field is
+decoded only when it is used:
+
+    iter_types()    decodes only the event type (interned: one small
+                    slice and a dict lookup per event)
+    iter_rows()     also decodes the message and metadata
+    summarize()     counts events per type and the time span
+
+The index is searched in place too: there is no per-block list. Memory
+therefore stays the same whether a log has 10^3 or 10^8 events.
+Mapped pages that have been read are handed back to the OS
+(MADV_DONTNEED) every `release_bytes`. This keeps a full scan from
+growing the resident set to the size of the file.
+
+The reader has the same read interface as `SessionLog` (`session_id`,
+`agent_name`, `len()`, `iter_rows()`, `iter_types()`, `iter_range()`,
+`iter_range_types()`, `view()`), so
+`GlyphtrailSession.from_log()` renders it through the usual
+`write_lineage()` / `write_timeline()` streaming paths.
+
+Usage:
+    python examples/glyphtrail_integration/mapped_log.py LOG [--since T] [--until T]
+                                                        [--timeline | --summary]
+"""
+
+import argparse
+import json
+import mmap
+import sys
+import time
+import zlib
+from pathlib import Path
+
+from session_log import (
+    CRC,
+    FORMAT_VERSION,
+    HEADER,
+    INDEX_ENTRY,
+    INDEX_HEADER,
+    INDEX_MAGIC,
+    INDEX_SUFFIX,
+    MAGIC,
+    RECORD,
+    LogView,
+    _epoch,
+)
+
+
+# Return read pages to the OS after this many bytes
+RELEASE_BYTES = 64 << 20
+
+
+def _map(path):
+    with open(path, 'rb') as f:
+        return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+class MappedSessionLog:
+    """Read-only, memory-mapped view of a persisted session log."""
+
+    def __init__(self, path, release_bytes=RELEASE_BYTES):
+        self.path = Path(path)
+        self.index_path = self.path.with_suffix(INDEX_SUFFIX)
+        self.release_bytes = release_bytes
+        self._type_names = {}
+
+        self._mm = _map(self.path)
+        self._view = memoryview(self._mm)
+        size = len(self._mm)
+        if size < HEADER.size:
+            self.close()
+            raise ValueError(f"Not a session log: {self.path}")
+        magic, version, meta_len = HEADER.unpack_from(self._view, 0)
+        if magic != MAGIC or version != FORMAT_VERSION:
+            self.close()
+            raise ValueError(f"Not a session log (or unsupported version): {self.path}")
+        meta = json.loads(str(self._view[HEADER.size:HEADER.size + meta_len], 'utf-8'))
+        self.session_id = meta['session_id']
+        self.agent_name = meta.get('agent_name')
+        self._data_start = HEADER.size + meta_len
+
+        self._index_mm = None
+        self._index = None
+        self._blocks = 0
+        self._load_index(size)
+        self._scan_tail(size)
+
+        if hasattr(mmap, 'MADV_SEQUENTIAL'):
+            self._mm.madvise(mmap.MADV_SEQUENTIAL)
+
+    def _load_index(self, size):
+        """
+        Map the index and count the entries that agree with the log.
+
+        Like SessionLog, only the leading entries that continue each other
+        (each starts at the event and byte where the previous one ended)
+        and end inside the log are used. The index is never rewritten
+        here; records after the last usable entry are found by
+        _scan_tail().
+        """
+        try:
+            self._index_mm = _map(self.index_path)
+        except (FileNotFoundError, ValueError):
+            return
+        self._index = memoryview(self._index_mm)
+        if len(self._index) < INDEX_HEADER.size or \
+                INDEX_HEADER.unpack_from(self._index, 0) != (INDEX_MAGIC, FORMAT_VERSION):
+            return
+
+        entries = (len(self._index) - INDEX_HEADER.size) // INDEX_ENTRY.size
+        expected_first, expected_start = 0, self._data_start
+        blocks = 0
+        while blocks < entries:
+            first, count, start, end, _, _ = self._entry(blocks)
+            if first != expected_first or start != expected_start or end > size:
+                break
+            expected_first, expected_start = first + count, end
+            blocks += 1
+        self._blocks = blocks
+
+    def _entry(self, i):
+        return INDEX_ENTRY.unpack_from(self._index, INDEX_HEADER.size + i * INDEX_ENTRY.size)
+
+    def _scan_tail(self, size):
+        """
+        Find the complete records after the last indexed block.
+
+        These are checked against their CRC, because a writer that
+        crashed may have left a torn record. A log with no index is
+        scanned in full here, once.
+        """
+        if self._blocks:
+            first, count, _, start, _, _ = self._entry(self._blocks - 1)
+            first += count
+        else:
+            first, start = 0, self._data_start
+
+        view = self._view
+        pos = start
+        count = 0
+        low, high = float('inf'), float('-inf')
+        while size - pos >= RECORD.size:
+            crc, timestamp, type_len, message_len, meta_len = RECORD.unpack_from(view, pos)
+            end = pos + RECORD.size + type_len + message_len + meta_len
+            if end > size or zlib.crc32(view[pos + CRC.size:end]) != crc:
+                break
+            count += 1
+            low = min(low, timestamp)
+            high = max(high, timestamp)
+            pos = end
+        self._tail = (first, count, start, pos, low, high)
+
+    def close(self):
+        """Unmap the files."""
+        for name in ('_view', '_index'):
+            view = getattr(self, name, None)
+            if view is not None:
+                view.release()
+                setattr(self, name, None)
+        for mm in (self._mm, getattr(self, '_index_mm', None)):
+            if mm is not None and not mm.closed:
+                mm.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def __len__(self):
+        return self._tail[0] + self._tail[1]
+
+    def _block(self, i):
+        return self._entry(i) if i < self._blocks else self._tail
+
+    def _block_count(self):
+        return self._blocks + (1 if self._tail[1] else 0)
+
+    def _find_block(self, event):
+        """Index of the block containing an event number (binary search in place)."""
+        low, high = 0, self._block_count() - 1
+        while low < high:
+            mid = (low + high + 1) // 2
+            if self._block(mid)[0] <= event:
+                low = mid
+            else:
+                high = mid - 1
+        return low
+
+    def _release(self, released, pos):
+        """Drop mapped pages before `pos` from the resident set."""
+        if pos - released < self.release_bytes or not hasattr(mmap, 'MADV_DONTNEED'):
+            return released
+        start = released - released % mmap.PAGESIZE
+        end = pos - pos % mmap.PAGESIZE
+        if end > start:
+            self._mm.madvise(mmap.MADV_DONTNEED, start, end - start)
+        return pos
+
+    def _spans(self, start=0, stop=None):
+        """
+        Yield (offset, count) runs of consecutive records covering events
+        start..stop-1, one per block, releasing pages behind them.
+        """
+        total = len(self)
+        if stop is None or stop > total:
+            stop = total
+        if start >= stop:
+            return
+
+        i = self._find_block(start)
+        first, count, pos, _, _, _ = self._block(i)
+
+        # Skip to `start` within its block by walking headers
+        view = self._view
+        for _ in range(start - first):
+            _, _, type_len, message_len, meta_len = RECORD.unpack_from(view, pos)
+            pos += RECORD.size + type_len + message_len + meta_len
+
+        released = pos
+        event = start
+        while event < stop:
+            run = min(first + count, stop) - event
+            yield pos, run
+            event += run
+            i += 1
+            if event < stop:
+                first, count, pos, end, _, _ = self._block(i)
+                released = self._release(released, pos)
+
+    def _spans_in_range(self, since, until):
+        """Yield (offset, count) for each block whose timestamps overlap the range."""
+        released = self._data_start
+        for i in range(self._block_count()):
+            _, count, pos, end, low, high = self._block(i)
+            if high >= since and low < until:
+                yield pos, count
+                released = self._release(released, end)
+
+    def _type_name(self, key):
+        """Interned event type for its UTF-8 bytes."""
+        name = self._type_names.get(key)
+        if name is None:
+            name = self._type_names[key] = key.decode('utf-8')
+        return name
+
+    def _rows(self, spans, since=float('-inf'), until=float('inf')):
+        """Decode full rows from record runs, keeping those in [since, until)."""
+        unpack = RECORD.unpack_from
+        header_size = RECORD.size
+        view = self._view
+        mm = self._mm
+        type_name = self._type_name
+        loads = json.loads
+        for pos, count in spans:
+            for _ in range(count):
+                _, timestamp, type_len, message_len, meta_len = unpack(view, pos)
+                pos += header_size
+                if since <= timestamp < until:
+                    event_type = type_name(mm[pos:pos + type_len])
+                    pos += type_len
+                    message = mm[pos:pos + message_len].decode('utf-8')
+                    pos += message_len
+                    yield (event_type, message, timestamp,
+                           loads(mm[pos:pos + meta_len]) if meta_len else None)
+                    pos += meta_len
+                else:
+                    pos += type_len + message_len + meta_len
+
+    def _types(self, spans, since=float('-inf'), until=float('inf')):
+        """Yield (event_type, timestamp) from record runs without decoding messages."""
+        unpack = RECORD.unpack_from
+        header_size = RECORD.size
+        view = self._view
+        mm = self._mm
+        type_name = self._type_name
+        for pos, count in spans:
+            for _ in range(count):
+                _, timestamp, type_len, message_len, meta_len = unpack(view, pos)
+                pos += header_size
+                if since <= timestamp < until:
+                    yield type_name(mm[pos:pos + type_len]), timestamp
+                pos += type_len + message_len + meta_len
+
+    def iter_rows(self, start=0, stop=None):
+        """Yield raw (event_type, message, epoch_seconds, metadata) tuples."""
+        return self._rows(self._spans(start, stop))
+
+    def iter_types(self, start=0, stop=None):
+        """Yield just the event type of each event (messages are not decoded)."""
+        for event_type, _ in self._types(self._spans(start, stop)):
+            yield event_type
+
+    def iter_range(self, since=None, until=None):
+        """Yield raw rows with `since <= timestamp < until`."""
+        since = _epoch(since, float('-inf'))
+        until = _epoch(until, float('inf'))
+        return self._rows(self._spans_in_range(since, until), since, until)
+
+    def iter_range_types(self, since=None, until=None):
+        """Yield the event type of each event in a time range (messages are not decoded)."""
+        since = _epoch(since, float('-inf'))
+        until = _epoch(until, float('inf'))
+        for event_type, _ in self._types(self._spans_in_range(since, until), since, until):
+            yield event_type
+
+    def view(self, since=None, until=None):
+        """Get a read-only view of the events in a time range."""
+        return LogView(self, since, until)
+
+    def summarize(self, since=None, until=None):
+        """
+        Summarize the log (or a time range) in one pass without decoding messages.
+
+        Returns:
+            Dict with 'events', 'first' and 'last' (epoch seconds, or None)
+            and 'types' (event type -> count, most common first)
+        """
+        since = _epoch(since, float('-inf'))
+        until = _epoch(until, float('inf'))
+        counts = {}
+        events = 0
+        first = last = None
+        for event_type, timestamp in self._types(self._spans_in_range(since, until), since, until):
+            counts[event_type] = counts.get(event_type, 0) + 1
+            if first is None or timestamp < first:
+                first = timestamp
+            if last is None or timestamp > last:
+                last = timestamp
+            events += 1
+
+        return {
+            'events': events,
+            'first': first,
+            'last': last,
+            'types': dict(sorted(counts.items(), key=lambda item: -item[1])),
+        }
+
+
+def main():
+    """Stream a persisted session's lineage, timeline or summary to stdout."""
+    from session_renderer import GlyphtrailSession
+
+    parser = argparse.ArgumentParser(description="Render a persisted Glyphtrail session log.")
+    parser.add_argument('log', type=Path, help='.gtlog file')
+    parser.add_argument('--since', type=float, default=None, help='epoch seconds (inclusive)')
+    parser.add_argument('--until', type=float, default=None, help='epoch seconds (exclusive)')
+    parser.add_argument('--format', default='unicode', choices=['unicode', 'text', 'emoji'])
+    output = parser.add_mutually_exclusive_group()
+    output.add_argument('--timeline', action='store_true', help='compact timeline')
+    output.add_argument('--summary', action='store_true', help='event counts and time span')
+    args = parser.parse_args()
+
+    try:
+        log = MappedSessionLog(args.log)
+    except (OSError, ValueError) as e:
+        print(f"Error: {e}")
+        return 1
+
+    with log:
+        if args.summary:
+            summary = log.summarize(args.since, args.until)
+            print(f"Session: {log.session_id} ({log.agent_name})")
+            print(f"Events: {summary['events']}")
+            if summary['events']:
+                print(f"From: {time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(summary['first']))}")
+                print(f"To:   {time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(summary['last']))}")
+            for event_type, count in summary['types'].items():
+                print(f"  {count:12d}  {event_type}")
+            return 0
+
+        session = GlyphtrailSession.from_log(log, args.since, args.until)
+        if args.timeline:
+            session.write_timeline(sys.stdout, args.format)
+        else:
+            session.write_lineage(sys.stdout, args.format)
+        sys.stdout.write('\n')
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
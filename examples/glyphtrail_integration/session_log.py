@@ -0,0 +1,536 @@
+"""
+Persistent, append-only storage for Glyphtrail sessions.
+
+Each session is stored as a pair of files:
+
+    <session_id>.gtlog    header, then one record per event, in append order
+    <session_id>.gtidx    sparse index with one entry per block of events
+
+Record layout (little-endian):
+
+    crc32        u32   CRC-32 of the rest of the record
+    timestamp    f64   epoch seconds
+    type_len     u16   \\
+    message_len  u32    } byte lengths of the UTF-8 fields that follow
+    meta_len     u32   /  (metadata is JSON; 0 means no metadata)
+    event type, message, metadata
+
+Appends are buffered, then written and fsynced together every
+`sync_every` events, on flush() or close(), and on the first append
+after the oldest buffered event is `sync_interval` seconds old. There is
+no background timer, so a log that goes idle keeps its batch buffered
+until the next append, flush() or close(); an owner that must bound the
+delay while idle calls flush() itself. A crash therefore loses at most
+the unflushed batch. When an
+existing log is opened, the records after the last indexed block are
+checked again and a torn or corrupt tail is truncated.
+
+After every `index_interval` events, the index gets an entry for that
+block: its first event number, its byte range and its min/max timestamp.
+Replaying a range of event numbers or timestamps seeks straight to the
+matching blocks and decodes only those, one block at a time. Rendering
+part of a session therefore never reads the whole file. The index is
+derived data, so it is never fsynced. If it is missing or damaged it is
+rebuilt from the log.
+
+A log has a single writer. `SessionLog.iter_rows()` has the same
+signature as `EventStore.iter_rows()`, so a log can back a
+`GlyphtrailSession` directly (see `GlyphtrailSession.from_log()`).
+"""
+
+import bisect
+import json
+import os
+import struct
+import time
+import zlib
+from datetime import datetime
+from itertools import islice
+from pathlib import Path
+
+from event_store import GlyphtrailEvent
+
+
+MAGIC = b'BGTRAIL\x00'
+INDEX_MAGIC = b'BGTRIDX\x00'
+FORMAT_VERSION = 1
+
+LOG_SUFFIX = '.gtlog'
+INDEX_SUFFIX = '.gtidx'
+
+HEADER = struct.Struct('<8sII')         # magic, version, session JSON length
+INDEX_HEADER = struct.Struct('<8sI')    # magic, version
+RECORD = struct.Struct('<IdHII')        # crc32, timestamp, type/message/metadata lengths
+BODY = struct.Struct('<dHII')           # RECORD without the crc
+CRC = struct.Struct('<I')
+INDEX_ENTRY = struct.Struct('<QIQQdd')  # first event, count, start, end, min/max timestamp
+
+# Bytes read at a time when recovering or rebuilding the index
+SCAN_CHUNK = 1 << 20
+
+
+def _epoch(value, default):
+    if value is None:
+        return default
+    if isinstance(value, datetime):
+        return value.timestamp()
+    return float(value)
+
+
+def encode_record(event_type, message, timestamp, metadata=None):
+    """Encode one event as a log record."""
+    type_bytes = event_type.encode('utf-8')
+    if len(type_bytes) > 0xFFFF:
+        raise ValueError(f"Event type too long: {event_type[:40]}...")
+    message_bytes = message.encode('utf-8')
+    meta_bytes = json.dumps(
+        metadata, separators=(',', ':'), ensure_ascii=False, default=str
+    ).encode('utf-8') if metadata else b''
+
+    body = BODY.pack(timestamp, len(type_bytes), len(message_bytes), len(meta_bytes)) \
+        + type_bytes + message_bytes + meta_bytes
+    return CRC.pack(zlib.crc32(body)) + body
+
+
+def decode_records(data, type_names):
+    """
+    Yield (event_type, message, epoch_seconds, metadata) rows from a buffer
+    of whole records.
+
+    `type_names` caches event type bytes -> str across calls, so each
+    distinct type is decoded only once.
+    """
+    unpack = RECORD.unpack_from
+    header_size = RECORD.size
+    pos = 0
+    end = len(data)
+    while pos < end:
+        _, timestamp, type_len, message_len, meta_len = unpack(data, pos)
+        pos += header_size
+        type_bytes = data[pos:pos + type_len]
+        event_type = type_names.get(type_bytes)
+        if event_type is None:
+            event_type = type_names[type_bytes] = type_bytes.decode('utf-8')
+        pos += type_len
+        message = data[pos:pos + message_len].decode('utf-8')
+        pos += message_len
+        metadata = json.loads(data[pos:pos + meta_len]) if meta_len else None
+        pos += meta_len
+        yield event_type, message, timestamp, metadata
+
+
+def decode_types(data, type_names, since=float('-inf'), until=float('inf')):
+    """
+    Yield the event type of each record in a buffer of whole records whose
+    timestamp is in [since, until). Messages and metadata are skipped
+    without being decoded.
+    """
+    unpack = RECORD.unpack_from
+    header_size = RECORD.size
+    pos = 0
+    end = len(data)
+    while pos < end:
+        _, timestamp, type_len, message_len, meta_len = unpack(data, pos)
+        pos += header_size
+        if since <= timestamp < until:
+            type_bytes = data[pos:pos + type_len]
+            event_type = type_names.get(type_bytes)
+            if event_type is None:
+                event_type = type_names[type_bytes] = type_bytes.decode('utf-8')
+            yield event_type
+        pos += type_len + message_len + meta_len
+
+
+class SessionLog:
+    """Append-only on-disk event log for one session, with a sparse index."""
+
+    def __init__(self, path, session_id=None, agent_name=None, sync_every=1024,
+                 sync_interval=1.0, index_interval=1024):
+        """
+        Open a session log, creating it if it does not exist.
+
+        Args:
+            path: Log file (the index is stored next to it)
+            session_id: Required when creating; checked against the
+                header when opening an existing log
+            agent_name: Stored in the header when creating
+            sync_every: Write and fsync after this many buffered events
+            sync_interval: ...or on the next append once the oldest
+                buffered event is this many seconds old (checked only
+                when appending; an idle log is not flushed)
+            index_interval: Events per indexed block
+        """
+        self.path = Path(path)
+        self.index_path = self.path.with_suffix(INDEX_SUFFIX)
+        self.sync_every = sync_every
+        self.sync_interval = sync_interval
+        self.index_interval = index_interval
+
+        self._buffer = bytearray()
+        self._buffered = 0
+        self._buffered_since = None
+        self._pending_index = bytearray()
+        self._type_names = {}
+
+        # Closed blocks: (first event, count, start, end, min ts, max ts)
+        self._blocks = []
+        self._block_firsts = []
+
+        if self.path.exists():
+            self._open_existing(session_id)
+        else:
+            if session_id is None:
+                raise ValueError(f"session_id is required to create {self.path}")
+            self._create(session_id, agent_name)
+
+    def _create(self, session_id, agent_name):
+        self.session_id = session_id
+        self.agent_name = agent_name
+        meta = json.dumps({'session_id': session_id, 'agent_name': agent_name}).encode('utf-8')
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = open(self.path, 'w+b')
+        self._file.write(HEADER.pack(MAGIC, FORMAT_VERSION, len(meta)) + meta)
+        self._file.flush()
+        os.fsync(self._file.fileno())
+
+        self._index_file = open(self.index_path, 'w+b')
+        self._index_file.write(INDEX_HEADER.pack(INDEX_MAGIC, FORMAT_VERSION))
+        self._index_file.flush()
+
+        self._data_start = self._size = self._file.tell()
+        self._start_block(0, self._data_start)
+
+    def _open_existing(self, session_id):
+        self._file = open(self.path, 'r+b')
+        header = self._file.read(HEADER.size)
+        magic, version, meta_len = HEADER.unpack(header) if len(header) == HEADER.size \
+            else (None, None, 0)
+        if magic != MAGIC or version != FORMAT_VERSION:
+            self._file.close()
+            raise ValueError(f"Not a session log (or unsupported version): {self.path}")
+
+        meta = json.loads(self._file.read(meta_len))
+        if session_id is not None and meta['session_id'] != session_id:
+            self._file.close()
+            raise ValueError(f"{self.path} belongs to session {meta['session_id']}, not {session_id}")
+        self.session_id = meta['session_id']
+        self.agent_name = meta.get('agent_name')
+        self._data_start = HEADER.size + meta_len
+
+        size = self._file.seek(0, os.SEEK_END)
+        self._load_index(size)
+        if self._blocks:
+            first, count, _, end, _, _ = self._blocks[-1]
+            self._start_block(first + count, end)
+        else:
+            self._start_block(0, self._data_start)
+        self._size = self._open_start
+        self._recover(size)
+
+    def _load_index(self, size):
+        """Load index entries that agree with the log; drop the rest."""
+        try:
+            self._index_file = open(self.index_path, 'r+b')
+            header = self._index_file.read(INDEX_HEADER.size)
+            valid = len(header) == INDEX_HEADER.size and \
+                INDEX_HEADER.unpack(header) == (INDEX_MAGIC, FORMAT_VERSION)
+        except FileNotFoundError:
+            self._index_file = open(self.index_path, 'w+b')
+            valid = False
+
+        if not valid:
+            self._index_file.seek(0)
+            self._index_file.truncate()
+            self._index_file.write(INDEX_HEADER.pack(INDEX_MAGIC, FORMAT_VERSION))
+            return
+
+        data = self._index_file.read()
+        expected_first, expected_start = 0, self._data_start
+        for (first, count, start, end, low, high) in INDEX_ENTRY.iter_unpack(
+                data[:len(data) - len(data) % INDEX_ENTRY.size]):
+            if first != expected_first or start != expected_start or end > size:
+                break
+            self._blocks.append((first, count, start, end, low, high))
+            self._block_firsts.append(first)
+            expected_first, expected_start = first + count, end
+
+        self._index_file.seek(INDEX_HEADER.size + len(self._blocks) * INDEX_ENTRY.size)
+        self._index_file.truncate()
+
+    def _recover(self, size):
+        """Index the records after the last indexed block, truncating a torn tail."""
+        f = self._file
+        f.seek(self._size)
+        buffer = b''
+        buffer_start = self._size
+        pos = 0
+        corrupt = False
+        while not corrupt:
+            chunk = f.read(SCAN_CHUNK)
+            if not chunk:
+                break
+            buffer = buffer[pos:] + chunk
+            buffer_start += pos
+            pos = 0
+            while len(buffer) - pos >= RECORD.size:
+                crc, timestamp, *lengths = RECORD.unpack_from(buffer, pos)
+                end = pos + RECORD.size + sum(lengths)
+                if end > len(buffer):
+                    break
+                if zlib.crc32(buffer[pos + CRC.size:end]) != crc:
+                    corrupt = True
+                    break
+                self._size = buffer_start + end
+                self._track(timestamp)
+                pos = end
+
+        if self._size < size:
+            f.truncate(self._size)
+            f.flush()
+            os.fsync(f.fileno())
+        f.seek(self._size)
+        self._write_index()
+
+    def _start_block(self, first, start):
+        self._open_first = first
+        self._open_count = 0
+        self._open_start = start
+        self._open_min = float('inf')
+        self._open_max = float('-inf')
+
+    def _track(self, timestamp):
+        """Account for one record ending at self._size in the open block."""
+        self._open_count += 1
+        if timestamp < self._open_min:
+            self._open_min = timestamp
+        if timestamp > self._open_max:
+            self._open_max = timestamp
+
+        if self._open_count >= self.index_interval:
+            block = (self._open_first, self._open_count, self._open_start, self._size,
+                     self._open_min, self._open_max)
+            self._blocks.append(block)
+            self._block_firsts.append(self._open_first)
+            self._pending_index += INDEX_ENTRY.pack(*block)
+            self._start_block(self._open_first + self._open_count, self._size)
+
+    def __len__(self):
+        return self._open_first + self._open_count
+
+    @property
+    def closed(self):
+        return self._file.closed
+
+    def append(self, event_type, message, timestamp=None, metadata=None):
+        """
+        Append an event (same arguments as EventStore.append).
+
+        The event is buffered, and written when the current batch is
+        flushed.
+        """
+        if timestamp is None:
+            timestamp = time.time()
+        elif isinstance(timestamp, datetime):
+            timestamp = timestamp.timestamp()
+
+        record = encode_record(event_type, message, timestamp, metadata)
+        self._buffer += record
+        self._size += len(record)
+        self._track(timestamp)
+
+        self._buffered += 1
+        if self._buffered_since is None:
+            self._buffered_since = time.monotonic()
+        if self._buffered >= self.sync_every or \
+                time.monotonic() - self._buffered_since >= self.sync_interval:
+            self.flush()
+
+    def _write_buffer(self):
+        """Hand buffered records to the OS (without fsync) so readers see them."""
+        if self._buffer:
+            self._file.write(self._buffer)
+            self._file.flush()
+            self._buffer.clear()
+
+    def _write_index(self):
+        if self._pending_index:
+            self._index_file.seek(0, os.SEEK_END)
+            self._index_file.write(self._pending_index)
+            self._index_file.flush()
+            self._pending_index.clear()
+
+    def flush(self, sync=True):
+        """
+        Write buffered events, fsync the log, then write new index entries.
+
+        The index is written after the fsync, so it never points at
+        records that are not yet durable.
+        """
+        self._write_buffer()
+        if sync:
+            os.fsync(self._file.fileno())
+        self._buffered = 0
+        self._buffered_since = None
+        self._write_index()
+
+    def close(self):
+        """Flush and close the log (the files are closed even if the flush fails)."""
+        if not self._file.closed:
+            try:
+                self.flush()
+            finally:
+                self._file.close()
+                self._index_file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def _snapshot_blocks(self, i=0):
+        """Closed blocks from index i, plus the open block (if it has events)."""
+        blocks = self._blocks[i:]
+        if self._open_count:
+            blocks.append((self._open_first, self._open_count, self._open_start, self._size,
+                           self._open_min, self._open_max))
+        return blocks
+
+    def _iter_blocks(self, blocks):
+        """Yield (block, record bytes) for each block, reading one block at a time."""
+        self._write_buffer()
+        with open(self.path, 'rb') as f:
+            for block in blocks:
+                f.seek(block[2])
+                yield block, f.read(block[3] - block[2])
+
+    def _iter_events(self, decode, start, stop):
+        """Decode events start..stop-1, reading only the blocks that contain them."""
+        total = len(self)
+        if stop is None or stop > total:
+            stop = total
+        if start >= stop:
+            return
+
+        i = max(bisect.bisect_right(self._block_firsts, start) - 1, 0)
+        blocks = [
+            block for block in self._snapshot_blocks(i)
+            if block[0] < stop and block[0] + block[1] > start
+        ]
+        for (first, count, _, _, _, _), data in self._iter_blocks(blocks):
+            rows = decode(data, self._type_names)
+            if start > first:
+                rows = islice(rows, start - first, None)
+            yield from islice(rows, min(stop, first + count) - max(start, first))
+
+    def iter_rows(self, start=0, stop=None):
+        """
+        Yield raw (event_type, message, epoch_seconds, metadata) tuples for
+        events start..stop-1, reading only the blocks that contain them.
+        """
+        return self._iter_events(decode_records, start, stop)
+
+    def iter_range(self, since=None, until=None):
+        """
+        Yield raw rows with `since <= timestamp < until`, in log order.
+
+        Blocks whose timestamps all fall outside the range are skipped
+        without being read, so out-of-order timestamps are handled
+        correctly.
+
+        Args:
+            since: datetime or epoch seconds (default: beginning)
+            until: datetime or epoch seconds, exclusive (default: end)
+        """
+        since = _epoch(since, float('-inf'))
+        until = _epoch(until, float('inf'))
+        for _, data in self._iter_blocks(self._blocks_in_range(since, until)):
+            for row in decode_records(data, self._type_names):
+                if since <= row[2] < until:
+                    yield row
+
+    def _blocks_in_range(self, since, until):
+        return [
+            block for block in self._snapshot_blocks()
+            if block[5] >= since and block[4] < until
+        ]
+
+    def iter_types(self, start=0, stop=None):
+        """Yield just the event type of each event (messages are not decoded)."""
+        return self._iter_events(decode_types, start, stop)
+
+    def iter_range_types(self, since=None, until=None):
+        """Yield the event type of each event in a time range (messages are not decoded)."""
+        since = _epoch(since, float('-inf'))
+        until = _epoch(until, float('inf'))
+        for _, data in self._iter_blocks(self._blocks_in_range(since, until)):
+            yield from decode_types(data, self._type_names, since, until)
+
+    def view(self, since=None, until=None):
+        """Get a read-only view of the events in a time range."""
+        return LogView(self, since, until)
+
+    def __iter__(self):
+        for event_type, message, epoch, metadata in self.iter_rows():
+            yield GlyphtrailEvent(event_type, message, datetime.fromtimestamp(epoch), metadata)
+
+
+class LogView:
+    """
+    Read-only window onto the events of a SessionLog in a time range.
+
+    It supports the same iter_rows() as EventStore, so a GlyphtrailSession
+    can render it. Each iteration streams from disk.
+    """
+
+    def __init__(self, log, since=None, until=None):
+        self.log = log
+        self.since = since
+        self.until = until
+
+    def iter_rows(self, start=0, stop=None):
+        """Yield raw rows for events start..stop-1 of the range."""
+        return islice(self.log.iter_range(self.since, self.until), start, stop)
+
+    def iter_types(self, start=0, stop=None):
+        """Yield just the event type of each event in the range."""
+        return islice(self.log.iter_range_types(self.since, self.until), start, stop)
+
+    def __len__(self):
+        """Number of events in the range (counted with one scan)."""
+        return sum(1 for _ in self.iter_rows())
+
+    def __iter__(self):
+        for event_type, message, epoch, metadata in self.iter_rows():
+            yield GlyphtrailEvent(event_type, message, datetime.fromtimestamp(epoch), metadata)
+
+
+class SessionStore:
+    """A directory of session logs, one per session ID."""
+
+    def __init__(self, root, **log_options):
+        """
+        Args:
+            root: Directory holding the logs
+            log_options: Passed to every SessionLog (sync_every, ...)
+        """
+        self.root = Path(root)
+        self.log_options = log_options
+
+    def path_for(self, session_id):
+        """Get the log file for a session ID."""
+        if not session_id or '/' in session_id or '\\' in session_id or session_id.startswith('.'):
+            raise ValueError(f"Invalid session ID for a file name: {session_id!r}")
+        return self.root / f"{session_id}{LOG_SUFFIX}"
+
+    def __contains__(self, session_id):
+        return self.path_for(session_id).exists()
+
+    def session_ids(self):
+        """Get the IDs of every stored session, sorted."""
+        return sorted(path.stem for path in self.root.glob(f'*{LOG_SUFFIX}'))
+
+    def open(self, session_id, agent_name=None):
+        """Open a session's log, creating it if needed."""
+        return SessionLog(self.path_for(session_id), session_id, agent_name, **self.log_options)
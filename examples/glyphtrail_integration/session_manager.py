@@ -0,0 +1,295 @@
+"""
+Thread-safe manager for many Glyphtrail sessions in one process.
+
+`SessionManager` keeps sessions keyed by `session_id` and lets worker
+threads add events to them and render them concurrently. It has no
+global lock:
+
+    stripes         session IDs hash to one of `stripes` stripes. Each
+                    stripe has its own lock and its own LRU map, which
+                    are held only long enough to find, insert or evict
+                    entries
+    per-session     each session has its own lock, held while events are
+                    added or the session is rendered, so threads working
+                    on different sessions never wait for each other
+
+Memory is bounded per stripe, at `max_sessions / stripes` sessions and
+`max_events / stripes` events. Only events not yet in the SessionStore
+count: once a session's events are persisted (by an eviction or
+flush()), they are dropped from memory and read back from its log when
+the session is rendered. When a stripe goes over either bound, its
+least recently used idle sessions are evicted. Sessions whose lock is
+held are skipped. An evicted session's new events are appended to its
+log and the session is dropped. The next access opens it again without
+replaying the log, so a reloaded session holds only its new events.
+
+Eviction and loading do disk I/O while holding their stripe's lock.
+This blocks only the sessions that hash to that stripe.
+"""
+
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+
+from event_store import EventStore
+from session_log import SessionStore
+from session_renderer import GlyphtrailSession
+
+
+class _StoredEvents:
+    """
+    A resident session's events: the first `persisted` are read from its
+    log when needed, the rest are held in memory until persist().
+
+    It has the event-store methods a GlyphtrailSession uses, so it can
+    back one through GlyphtrailSession.from_log().
+    """
+
+    def __init__(self, store, session_id, agent_name, persisted):
+        self.store = store
+        self.session_id = session_id
+        self.agent_name = agent_name
+        self.persisted = persisted
+        self.tail = EventStore()
+
+    def __len__(self):
+        return self.persisted + len(self.tail)
+
+    def append(self, event_type, message, timestamp=None, metadata=None):
+        self.tail.append(event_type, message, timestamp, metadata)
+
+    def _iter(self, name, start, stop):
+        persisted = self.persisted
+        stop = len(self) if stop is None else min(stop, len(self))
+        if start < min(stop, persisted):
+            with self.store.open(self.session_id) as log:
+                yield from getattr(log, name)(start, min(stop, persisted))
+        if stop > persisted:
+            yield from getattr(self.tail, name)(max(start - persisted, 0), stop - persisted)
+
+    def iter_rows(self, start=0, stop=None):
+        """Yield raw (event_type, message, epoch_seconds, metadata) tuples."""
+        return self._iter('iter_rows', start, stop)
+
+    def iter_types(self, start=0, stop=None):
+        """Yield just the event type of each event."""
+        return self._iter('iter_types', start, stop)
+
+    def persist(self):
+        """Append the in-memory events to the log and drop them. Returns how many."""
+        count = len(self.tail)
+        if count:
+            with self.store.open(self.session_id, self.agent_name) as log:
+                for event_type, message, epoch, metadata in self.tail.iter_rows():
+                    log.append(event_type, message, epoch, metadata)
+            self.persisted += count
+            self.tail = EventStore()
+        return count
+
+
+class _Entry:
+    """A resident session and its lock."""
+
+    __slots__ = ('session', 'lock', 'evicted')
+
+    def __init__(self, session):
+        self.session = session
+        self.lock = threading.Lock()
+        self.evicted = False
+
+
+class _Stripe:
+    """One lock-protected shard of the session map."""
+
+    __slots__ = ('lock', 'entries', 'events', 'loads', 'evictions')
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        # session_id -> _Entry, least recently used first
+        self.entries = OrderedDict()
+        # Events held in memory by this stripe's sessions
+        self.events = 0
+        self.loads = 0
+        self.evictions = 0
+
+
+class SessionManager:
+    """Registry of GlyphtrailSessions with lock striping and LRU eviction."""
+
+    def __init__(self, store, stripes=64, max_sessions=4096, max_events=2_000_000):
+        """
+        Args:
+            store: SessionStore (or directory) that evicted sessions go to
+            stripes: Number of independently locked shards
+            max_sessions: Resident sessions across all stripes
+            max_events: Resident events across all stripes
+        """
+        if not isinstance(store, SessionStore):
+            store = SessionStore(store)
+        self.store = store
+        self._stripes = [_Stripe() for _ in range(stripes)]
+        self.max_sessions_per_stripe = max(1, max_sessions // stripes)
+        self.max_events_per_stripe = max(1, max_events // stripes)
+
+    def _stripe(self, session_id):
+        return self._stripes[hash(session_id) % len(self._stripes)]
+
+    def _load(self, session_id, agent_name, create):
+        """Open a stored session (without reading its events), or create it."""
+        if session_id in self.store:
+            with self.store.open(session_id) as log:
+                events = _StoredEvents(self.store, session_id, log.agent_name, len(log))
+        elif not create:
+            raise KeyError(f"Unknown session: {session_id}")
+        else:
+            events = _StoredEvents(self.store, session_id, agent_name, 0)
+        return _Entry(GlyphtrailSession.from_log(events))
+
+    def _persist(self, entry):
+        """
+        Move a session's in-memory events to its log (entry lock held).
+
+        Returns:
+            How many events left memory
+        """
+        return entry.session.events.persist()
+
+    def _evict(self, stripe, keep=None):
+        """Evict idle LRU sessions until the stripe is within bounds (stripe lock held)."""
+        entries = stripe.entries
+        if len(entries) <= self.max_sessions_per_stripe and \
+                stripe.events <= self.max_events_per_stripe:
+            return
+
+        for session_id, entry in list(entries.items()):
+            if len(entries) <= self.max_sessions_per_stripe and \
+                    stripe.events <= self.max_events_per_stripe:
+                break
+            # A held lock means the session is in use, so it is not idle
+            if entry is keep or not entry.lock.acquire(blocking=False):
+                continue
+            try:
+                stripe.events -= self._persist(entry)
+                entry.evicted = True
+            finally:
+                entry.lock.release()
+            del entries[session_id]
+            stripe.evictions += 1
+
+    def _acquire(self, session_id, agent_name=None, create=True):
+        """Get a session's entry with its lock held, loading or creating it."""
+        stripe = self._stripe(session_id)
+        while True:
+            with stripe.lock:
+                entry = stripe.entries.get(session_id)
+                if entry is None:
+                    entry = self._load(session_id, agent_name, create)
+                    stripe.entries[session_id] = entry
+                    stripe.loads += 1
+                    self._evict(stripe, keep=entry)
+                else:
+                    stripe.entries.move_to_end(session_id)
+
+            entry.lock.acquire()
+            if not entry.evicted:
+                return entry
+            # Evicted between the lookup and the lock; look it up again
+            entry.lock.release()
+
+    @contextmanager
+    def use(self, session_id, agent_name=None, create=True):
+        """
+        Hold a session for exclusive use.
+
+        Other threads can use other sessions in the meantime. Do not call
+        manager methods for the same session inside the block; its lock
+        is not reentrant.
+
+        Args:
+            session_id: Session to use
+            agent_name: Agent name if the session is created
+            create: Create the session if it is neither resident nor
+                stored (otherwise raise KeyError)
+        """
+        entry = self._acquire(session_id, agent_name, create)
+        before = len(entry.session.events)
+        try:
+            yield entry.session
+        finally:
+            try:
+                added = len(entry.session.events) - before
+                if added:
+                    stripe = self._stripe(session_id)
+                    with stripe.lock:
+                        stripe.events += added
+                        self._evict(stripe, keep=entry)
+            finally:
+                # Even if persisting an evicted session failed
+                entry.lock.release()
+
+    def add_event(self, session_id, event_type, message, metadata=None, timestamp=None,
+                  agent_name=None):
+        """Add an event to a session, creating the session if needed."""
+        with self.use(session_id, agent_name) as session:
+            session.add_event(event_type, message, metadata, timestamp)
+
+    def render_lineage(self, session_id, format='unicode'):
+        """Render a session's lineage (KeyError if it does not exist)."""
+        with self.use(session_id, create=False) as session:
+            return session.render_lineage(format)
+
+    def render_timeline(self, session_id, format='unicode'):
+        """Render a session's compact timeline (KeyError if it does not exist)."""
+        with self.use(session_id, create=False) as session:
+            return session.render_timeline(format)
+
+    def continuity_health(self, session_id):
+        """Get a session's continuity health (KeyError if it does not exist)."""
+        with self.use(session_id, create=False) as session:
+            return session.continuity_health()
+
+    def flush(self):
+        """Move every resident session's new events to the store."""
+        for stripe in self._stripes:
+            with stripe.lock:
+                entries = list(stripe.entries.values())
+            for entry in entries:
+                with entry.lock:
+                    if not entry.evicted:
+                        persisted = self._persist(entry)
+                        with stripe.lock:
+                            stripe.events -= persisted
+
+    def close(self):
+        """
+        Persist and drop every resident session.
+
+        Like an eviction, each session is persisted and marked evicted
+        while its lock is held, so a thread that looked it up before
+        it was dropped loads it again instead of using a stale copy.
+        """
+        for stripe in self._stripes:
+            with stripe.lock:
+                entries = list(stripe.entries.items())
+            for session_id, entry in entries:
+                with entry.lock:
+                    if entry.evicted:
+                        continue
+                    persisted = self._persist(entry)
+                    entry.evicted = True
+                    with stripe.lock:
+                        del stripe.entries[session_id]
+                        stripe.events -= persisted
+
+    def __len__(self):
+        """Number of resident sessions."""
+        return sum(len(stripe.entries) for stripe in self._stripes)
+
+    def stats(self):
+        """Resident sessions, in-memory events, loads and evictions (approximate while busy)."""
+        return {
+            'sessions': len(self),
+            'events': sum(stripe.events for stripe in self._stripes),
+            'loads': sum(stripe.loads for stripe in self._stripes),
+            'evictions': sum(stripe.evictions for stripe in self._stripes),
+        }
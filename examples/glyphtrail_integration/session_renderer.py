@@ -6,37 +6,73 @@ Demonstrates how Glyphtrail would use BeaconGlyphs to render
 interaction lineages with consistent visual symbols.
 """
 
-import json
-from datetime import datetime
+import sys
+import tempfile
+import time
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from render_glyphs import BeaconGlyphs  # noqa: E402
+from event_store import EventStore, GlyphtrailEvent  # noqa: E402,F401
+from session_log import SessionLog, SessionStore  # noqa: E402,F401
 
-class BeaconGlyphsLoader:
-    """Load and access BeaconGlyphs registry."""
 
-    def __init__(self):
-        # Load from the registry
-        base_path = Path(__file__).parent.parent.parent
-        registry_path = base_path / "src" / "glyphs" / "registry.json"
+class BeaconGlyphsLoader:
+    """Access the shared BeaconGlyphs registry."""
 
-        with open(registry_path, 'r') as f:
-            self.registry = json.load(f)
+    def __init__(self, registry_path=None):
+        # All loaders share one parsed registry per file
+        self._glyphs = BeaconGlyphs.shared(registry_path)
 
-        self._index = {g['id']: g for g in self.registry['glyphs']}
+    @property
+    def registry(self):
+        return self._glyphs.registry
 
     def get(self, glyph_id, format='unicode'):
-        glyph = self._index.get(glyph_id)
+        glyph = self._glyphs.get_glyph(glyph_id)
         return glyph['representations'].get(format) if glyph else '?'
 
-
-class GlyphtrailEvent:
-    """Represents a single event in an interaction lineage."""
-
-    def __init__(self, event_type, message, timestamp=None, metadata=None):
-        self.event_type = event_type
-        self.message = message
-        self.timestamp = timestamp or datetime.now()
-        self.metadata = metadata or {}
+    def resolve_map(self, glyph_map, format='unicode', default_id='events.flag'):
+        """
+        Resolve a key -> glyph ID map to key -> rendered glyph.
+
+        The table is built once per registry version and format, and is
+        rebuilt automatically after the shared registry reloads. Tables
+        are cached by the map's contents, so equal maps share a table and
+        a mutated map gets a new one.
+
+        Returns:
+            (table, fallback) where fallback is the rendering of default_id
+        """
+        def build(glyphs):
+            # Read the registry version the table is cached under
+            def render(glyph_id):
+                glyph = glyphs.get_glyph(glyph_id)
+                return glyph['representations'].get(format) if glyph else '?'
+
+            table = {key: render(glyph_id) for key, glyph_id in items}
+            return table, render(default_id)
+
+        items = tuple(sorted(glyph_map.items()))
+        key = ('resolve_map', items, format, default_id)
+        return self._glyphs.derived(key, build)
+
+
+def _write_chunked(stream, parts, separator, chunk_size):
+    """Join `parts` with `separator`, writing every `chunk_size` parts."""
+    chunk = []
+    written = 0
+    for part in parts:
+        chunk.append(part)
+        if len(chunk) >= chunk_size:
+            stream.write(('' if written == 0 else separator) + separator.join(chunk))
+            written += len(chunk)
+            chunk.clear()
+    if chunk:
+        stream.write(('' if written == 0 else separator) + separator.join(chunk))
+        written += len(chunk)
+    return written
 
 
 class GlyphtrailSession:
@@ -66,74 +102,193 @@ class GlyphtrailSession:
     def __init__(self, session_id, agent_name=None):
         self.session_id = session_id
         self.agent_name = agent_name or f"Agent-{session_id}"
-        self.events = []
+        self.events = EventStore()
         self.glyphs = BeaconGlyphsLoader()
 
-    def add_event(self, event_type, message, metadata=None):
+        # Running continuity counters, maintained by add_event
+        self._continuity_events = 0
+        self._continuity_links = 0
+        self._continuity_breaks = 0
+        self._last_break = None
+
+        # Events of a replayed log not yet counted (see from_log)
+        self._scan_pending = False
+        self._scan_stop = None
+
+    @classmethod
+    def from_log(cls, log, since=None, until=None):
+        """
+        Create a session backed by a persisted SessionLog.
+
+        Events are streamed from disk whenever the session is rendered,
+        so the log is never loaded into memory. Without a time range,
+        the session is live: add_event() appends to the log. With one,
+        it is a read-only replay of the events in
+        `since <= timestamp < until` (datetimes or epoch seconds).
+
+        Continuity counters are computed with one streaming pass the
+        first time they are needed.
+        """
+        session = cls(log.session_id, log.agent_name)
+        if since is None and until is None:
+            session.events = log
+            session._scan_stop = len(log)
+        else:
+            session.events = log.view(since, until)
+        session._scan_pending = True
+        return session
+
+    # Cache of event type -> 'link' / 'break' / 'other' / None (not continuity)
+    _CONTINUITY_KINDS = {}
+
+    @classmethod
+    def _continuity_kind(cls, event_type):
+        kind = cls._CONTINUITY_KINDS.get(event_type, False)
+        if kind is False:
+            if not event_type.startswith('continuity.'):
+                kind = None
+            elif 'broken' in event_type:
+                kind = 'break'
+            elif 'linked' in event_type or 'established' in event_type:
+                kind = 'link'
+            else:
+                kind = 'other'
+            cls._CONTINUITY_KINDS[event_type] = kind
+        return kind
+
+    def _count_continuity(self, event_type, position):
+        kind = self._continuity_kind(event_type)
+        if kind is not None:
+            self._continuity_events += 1
+            if kind == 'break':
+                self._continuity_breaks += 1
+                self._last_break = position
+            elif kind == 'link':
+                self._continuity_links += 1
+
+    def _scan_continuity(self):
+        """Count the continuity events of a replayed log (done on first use)."""
+        if not self._scan_pending:
+            return
+        self._scan_pending = False
+        later_break = self._last_break
+        types = self.events.iter_types(0, self._scan_stop)
+        for position, event_type in enumerate(types):
+            self._count_continuity(event_type, position)
+        if later_break is not None:
+            self._last_break = later_break
+
+    def add_event(self, event_type, message, metadata=None, timestamp=None):
         """Add an event to the session."""
-        event = GlyphtrailEvent(event_type, message, metadata=metadata)
-        self.events.append(event)
-
-    def render_lineage(self, format='unicode'):
-        """Render the complete interaction lineage."""
-        output = []
-
+        # Count only once the store has accepted the event
+        self.events.append(event_type, message, timestamp, metadata)
+        self._count_continuity(event_type, len(self.events) - 1)
+
+    def continuity_health(self):
+        """
+        Get continuity health as structured data.
+
+        Returns:
+            Dict with 'events', 'links', 'breaks', 'last_break' (index of
+            the most recent break event, or None) and 'healthy'
+        """
+        self._scan_continuity()
+        return {
+            'events': self._continuity_events,
+            'links': self._continuity_links,
+            'breaks': self._continuity_breaks,
+            'last_break': self._last_break,
+            'healthy': self._continuity_breaks == 0,
+        }
+
+    def iter_lineage(self, format='unicode'):
+        """
+        Yield the interaction lineage one line at a time.
+
+        Lines are produced lazily, so rendering memory stays constant
+        regardless of the number of events in the session.
+        """
         # Header
-        output.append("=" * 70)
-        output.append(f"GLYPHTRAIL SESSION LINEAGE")
-        output.append(f"Session: {self.session_id}")
-        output.append(f"Agent: {self.agent_name}")
-        output.append("=" * 70)
-        output.append("")
+        yield "=" * 70
+        yield "GLYPHTRAIL SESSION LINEAGE"
+        yield f"Session: {self.session_id}"
+        yield f"Agent: {self.agent_name}"
+        yield "=" * 70
+        yield ""
 
         # Events
-        for i, event in enumerate(self.events, 1):
-            glyph_id = self.EVENT_GLYPH_MAP.get(event.event_type, 'events.flag')
-            glyph = self.glyphs.get(glyph_id, format)
+        glyph_table, fallback = self.glyphs.resolve_map(self.EVENT_GLYPH_MAP, format)
+        count = 0
+        last_second = None
+        for event_type, message, epoch, metadata in self.events.iter_rows():
+            glyph = glyph_table.get(event_type, fallback)
+
+            # Consecutive events usually share a second; reuse its label
+            second = int(epoch)
+            if second != last_second:
+                timestamp = time.strftime('%H:%M:%S', time.localtime(epoch))
+                last_second = second
+
+            line = f"  {glyph}  [{timestamp}] {message}"
+
+            if metadata:
+                meta_str = ', '.join(f"{k}={v}" for k, v in metadata.items())
+                line += f" ({meta_str})"
 
-            timestamp = event.timestamp.strftime('%H:%M:%S')
+            count += 1
+            yield line
 
-            line = f"  {glyph}  [{timestamp}] {event.message}"
+        yield ""
+        yield "=" * 70
+        yield f"Total events: {count}"
+        yield "=" * 70
 
-            if event.metadata:
-                meta_str = ', '.join(f"{k}={v}" for k, v in event.metadata.items())
-                line += f" ({meta_str})"
+    def render_lineage(self, format='unicode'):
+        """Render the complete interaction lineage."""
+        return '\n'.join(self.iter_lineage(format))
+
+    def write_lineage(self, stream, format='unicode', chunk_lines=1024):
+        """
+        Write the interaction lineage to a file-like object.
 
-            output.append(line)
+        Lines are buffered and written in chunks of `chunk_lines`, so
+        only one chunk is held in memory at a time. The output is
+        identical to render_lineage().
 
-        output.append("")
-        output.append("=" * 70)
-        output.append(f"Total events: {len(self.events)}")
-        output.append("=" * 70)
+        Returns:
+            Number of lines written
+        """
+        return _write_chunked(stream, self.iter_lineage(format), '\n', chunk_lines)
 
-        return '\n'.join(output)
+    def iter_timeline(self, format='unicode'):
+        """Yield the compact timeline one glyph at a time."""
+        glyph_table, fallback = self.glyphs.resolve_map(self.EVENT_GLYPH_MAP, format)
+        for event_type in self.events.iter_types():
+            yield glyph_table.get(event_type, fallback)
 
     def render_timeline(self, format='unicode'):
         """Render a compact visual timeline."""
-        timeline_glyphs = []
+        return ' '.join(self.iter_timeline(format))
 
-        for event in self.events:
-            glyph_id = self.EVENT_GLYPH_MAP.get(event.event_type, 'events.flag')
-            glyph = self.glyphs.get(glyph_id, format)
-            timeline_glyphs.append(glyph)
+    def write_timeline(self, stream, format='unicode', chunk_glyphs=4096):
+        """
+        Write the compact timeline to a file-like object in chunks.
 
-        return ' '.join(timeline_glyphs)
+        Returns:
+            Number of glyphs written
+        """
+        return _write_chunked(stream, self.iter_timeline(format), ' ', chunk_glyphs)
 
     def render_continuity_summary(self):
         """Render a continuity health summary."""
-        continuity_events = [
-            e for e in self.events
-            if e.event_type.startswith('continuity.')
-        ]
-
-        if not continuity_events:
+        self._scan_continuity()
+        if not self._continuity_events:
             return "No continuity events recorded"
 
-        breaks = sum(1 for e in continuity_events if 'broken' in e.event_type)
-        links = sum(1 for e in continuity_events if 'linked' in e.event_type or 'established' in e.event_type)
+        breaks = self._continuity_breaks
+        links = self._continuity_links
 
         chain_glyph = self.glyphs.get('continuity.chain')
-        broken_glyph = self.glyphs.get('continuity.broken')
 
         health = "Healthy" if breaks == 0 else "Degraded"
 
@@ -224,11 +379,37 @@ def demo_recursive_reflection():
     print("\n")
 
 
+def demo_persisted_session():
+    """Demonstrate persisting a session and replaying a time range."""
+    print("\n" + "=" * 70)
+    print("DEMO: Persisted Session Replay")
+    print("=" * 70 + "\n")
+
+    with tempfile.TemporaryDirectory() as root:
+        store = SessionStore(root)
+        start = time.time() - 3600
+
+        with store.open("session-2025-11-13-004", "Archivist") as log:
+            session = GlyphtrailSession.from_log(log)
+            session.add_event('session.start', 'Session initiated', timestamp=start)
+            for i in range(1, 60):
+                session.add_event('reflection.checkpoint', f'Reflection checkpoint #{i}',
+                                  timestamp=start + i * 60)
+            session.add_event('session.stop', 'Session ended', timestamp=start + 3600)
+
+        # Reopen from disk and render only minutes 10-14
+        with store.open("session-2025-11-13-004") as log:
+            replay = GlyphtrailSession.from_log(log, since=start + 600, until=start + 900)
+            print(replay.render_lineage())
+            print(f"\n{len(log)} events on disk, {len(replay.events)} replayed\n")
+
+
 def main():
     """Run all demos."""
     demo_typical_session()
     demo_broken_continuity()
     demo_recursive_reflection()
+    demo_persisted_session()
 
     print("=" * 70)
     print("Integration demos complete!")
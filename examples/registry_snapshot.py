@@ -0,0 +1,420 @@
+#!/usr/bin/env python3
+"""
+BeaconGlyphs - Compiled Registry Snapshot
+
+Compiles registry.json into a compact, memory-mappable binary snapshot with
+the id/tag/category/useCase indexes already built. Opening a snapshot only
+reads a fixed-size header; glyphs and posting lists are decoded on demand,
+so cold start cost does not grow with the registry size.
+
+Usage:
+    python examples/registry_snapshot.py [registry.json] [-o registry.snapshot]
+
+Layout (all integers little-endian, offsets relative to the file start):
+
+    header      magic, format version, source mtime_ns/size, glyph count,
+                and the offset of each section
+    meta        JSON object with the registry's top-level fields
+    records     one compact JSON document per glyph, in registry order
+    ids         glyph IDs (UTF-8), in registry order
+    id_order    uint32 registry positions sorted by ID (binary search)
+    tags        sorted keys -> uint32 posting lists of registry positions
+    categories  same layout as tags
+    use_cases   same layout as tags
+"""
+
+import argparse
+import json
+import mmap
+import os
+import struct
+import sys
+from array import array
+from collections.abc import Mapping
+from pathlib import Path
+
+
+MAGIC = b'BGLYPHS\0'
+FORMAT_VERSION = 1
+SNAPSHOT_SUFFIX = '.snapshot'
+
+# magic, version, mtime_ns, size, glyph count, 8 section offsets
+_HEADER = struct.Struct('<8sIqqI8Q')
+
+_SECTIONS = (
+    'meta', 'records', 'ids', 'id_order',
+    'tags', 'categories', 'use_cases', 'end',
+)
+
+
+def snapshot_path_for(registry_path):
+    """Default snapshot location: next to the registry, '.snapshot' suffix."""
+    return Path(registry_path).with_suffix(SNAPSHOT_SUFFIX)
+
+
+def _u32(values):
+    data = array('I', values)
+    if sys.byteorder != 'little':
+        data.byteswap()
+    return data.tobytes()
+
+
+def _blob(chunks):
+    """Encode byte strings as a (count, offsets[count + 1], data) blob."""
+    offsets = [0]
+    for chunk in chunks:
+        offsets.append(offsets[-1] + len(chunk))
+    return (
+        struct.pack('<I', len(chunks)) + _u32(offsets) + b''.join(chunks)
+    )
+
+
+def _postings(index):
+    """Encode a key -> positions mapping as sorted keys + posting blobs."""
+    keys = sorted(index, key=lambda k: k.encode('utf-8'))
+    return (
+        _blob([key.encode('utf-8') for key in keys]) +
+        _blob([_u32(index[key]) for key in keys])
+    )
+
+
+def compile_snapshot(registry_path, snapshot_path=None):
+    """
+    Compile a registry JSON file into a binary snapshot.
+
+    Args:
+        registry_path: Path to registry.json
+        snapshot_path: Output path (defaults to snapshot_path_for(registry_path))
+
+    Returns:
+        Path of the written snapshot
+    """
+    registry_path = Path(registry_path)
+    if snapshot_path is None:
+        snapshot_path = snapshot_path_for(registry_path)
+    snapshot_path = Path(snapshot_path)
+
+    stat = os.stat(registry_path)
+    with open(registry_path, 'r') as f:
+        registry = json.load(f)
+
+    glyphs = registry['glyphs']
+    meta = {k: v for k, v in registry.items() if k != 'glyphs'}
+
+    tags = {}
+    categories = {}
+    use_cases = {}
+    for position, glyph in enumerate(glyphs):
+        categories.setdefault(glyph['category'], []).append(position)
+        metadata = glyph.get('metadata', {})
+        for tag in dict.fromkeys(metadata.get('tags', [])):
+            tags.setdefault(tag, []).append(position)
+        for use_case in dict.fromkeys(metadata.get('useCases', [])):
+            use_cases.setdefault(use_case, []).append(position)
+
+    encoded_ids = [glyph['id'].encode('utf-8') for glyph in glyphs]
+    id_order = sorted(range(len(glyphs)), key=encoded_ids.__getitem__)
+
+    sections = [
+        json.dumps(meta, separators=(',', ':')).encode('utf-8'),
+        _blob([
+            json.dumps(glyph, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+            for glyph in glyphs
+        ]),
+        _blob(encoded_ids),
+        _u32(id_order),
+        _postings(tags),
+        _postings(categories),
+        _postings(use_cases),
+    ]
+
+    offsets = []
+    position = _HEADER.size
+    for section in sections:
+        offsets.append(position)
+        position += len(section)
+    offsets.append(position)
+
+    header = _HEADER.pack(
+        MAGIC, FORMAT_VERSION, stat.st_mtime_ns, stat.st_size,
+        len(glyphs), *offsets
+    )
+
+    # Write to a temporary file and rename so readers never see a partial file
+    tmp_path = snapshot_path.with_name(snapshot_path.name + '.tmp')
+    with open(tmp_path, 'wb') as f:
+        f.write(header)
+        for section in sections:
+            f.write(section)
+    os.replace(tmp_path, snapshot_path)
+
+    return snapshot_path
+
+
+class _Blob:
+    """Zero-copy view over a (count, offsets, data) blob."""
+
+    def __init__(self, view, start):
+        self.count = struct.unpack_from('<I', view, start)[0]
+        offsets_start = start + 4
+        data_start = offsets_start + 4 * (self.count + 1)
+        self.offsets = view[offsets_start:data_start].cast('I')
+        self.data = view[data_start:data_start + self.offsets[self.count]]
+        self.end = data_start + self.offsets[self.count]
+
+    def __getitem__(self, i):
+        return self.data[self.offsets[i]:self.offsets[i + 1]]
+
+
+class _PostingTable:
+    """Sorted keys with uint32 posting lists, searched in place."""
+
+    def __init__(self, view, start):
+        self.keys = _Blob(view, start)
+        self.values = _Blob(view, self.keys.end)
+
+    def find(self, key):
+        target = key.encode('utf-8')
+        lo, hi = 0, self.keys.count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self.keys[mid].tobytes() < target:
+                lo = mid + 1
+            else:
+                hi = mid
+        if lo < self.keys.count and self.keys[lo] == target:
+            return self.values[lo].cast('I')
+        return None
+
+    def keys_list(self):
+        return [
+            self.keys[i].tobytes().decode('utf-8')
+            for i in range(self.keys.count)
+        ]
+
+
+class RegistrySnapshot:
+    """Read-only, memory-mapped view of a compiled registry snapshot."""
+
+    def __init__(self, snapshot_path):
+        self.snapshot_path = Path(snapshot_path)
+
+        with open(self.snapshot_path, 'rb') as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        view = memoryview(self._mmap)
+        if len(view) < _HEADER.size:
+            raise ValueError(f"Snapshot too short: {self.snapshot_path}")
+
+        fields = _HEADER.unpack_from(view, 0)
+        magic, version, self.source_mtime_ns, self.source_size, count = fields[:5]
+        if magic != MAGIC:
+            raise ValueError(f"Not a BeaconGlyphs snapshot: {self.snapshot_path}")
+        if version != FORMAT_VERSION:
+            raise ValueError(
+                f"Unsupported snapshot version {version} "
+                f"(expected {FORMAT_VERSION}): {self.snapshot_path}"
+            )
+
+        offsets = dict(zip(_SECTIONS, fields[5:]))
+        self.glyph_count = count
+        self._meta_bytes = view[offsets['meta']:offsets['records']]
+        self._records = _Blob(view, offsets['records'])
+        self._ids = _Blob(view, offsets['ids'])
+        self._id_order = view[offsets['id_order']:offsets['tags']].cast('I')
+        self.tags = _PostingTable(view, offsets['tags'])
+        self.categories = _PostingTable(view, offsets['categories'])
+        self.use_cases = _PostingTable(view, offsets['use_cases'])
+
+        # glyph ID -> position, filled in as IDs are looked up
+        self._positions = {}
+
+    @classmethod
+    def open_if_fresh(cls, registry_path, snapshot_path=None):
+        """
+        Open the snapshot for a registry if it matches the registry file.
+
+        Returns:
+            RegistrySnapshot, or None if the snapshot is missing, unreadable
+            or was compiled from a different version of the registry
+        """
+        if sys.byteorder != 'little':
+            return None
+        if snapshot_path is None:
+            snapshot_path = snapshot_path_for(registry_path)
+
+        try:
+            stat = os.stat(registry_path)
+            snapshot = cls(snapshot_path)
+        except (OSError, ValueError):
+            return None
+
+        if (snapshot.source_mtime_ns, snapshot.source_size) != (stat.st_mtime_ns, stat.st_size):
+            return None
+        return snapshot
+
+    def meta(self):
+        """Top-level registry fields other than 'glyphs'."""
+        return json.loads(self._meta_bytes.tobytes())
+
+    def glyph_at(self, position):
+        """Decode the glyph stored at a registry position."""
+        return json.loads(self._records[position].tobytes())
+
+    def id_at(self, position):
+        """Get the glyph ID stored at a registry position."""
+        return self._ids[position].tobytes().decode('utf-8')
+
+    def position_of(self, glyph_id):
+        """Find the registry position of a glyph ID, or None (memoized)."""
+        position = self._positions.get(glyph_id)
+        if position is not None:
+            return position
+
+        target = glyph_id.encode('utf-8')
+        order = self._id_order
+        lo, hi = 0, self.glyph_count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._ids[order[mid]].tobytes() < target:
+                lo = mid + 1
+            else:
+                hi = mid
+        if lo < self.glyph_count and self._ids[order[lo]] == target:
+            position = self._positions[glyph_id] = order[lo]
+            return position
+        return None
+
+
+class SnapshotGlyphIndex(Mapping):
+    """glyph ID -> glyph mapping that decodes records on first access."""
+
+    def __init__(self, snapshot):
+        self._snapshot = snapshot
+        self._cache = {}
+        self._by_id = {}
+
+    def glyph_at(self, position):
+        glyph = self._cache.get(position)
+        if glyph is None:
+            glyph = self._cache[position] = self._snapshot.glyph_at(position)
+        return glyph
+
+    def __getitem__(self, glyph_id):
+        glyph = self._by_id.get(glyph_id)
+        if glyph is None:
+            position = self._snapshot.position_of(glyph_id)
+            if position is None:
+                raise KeyError(glyph_id)
+            glyph = self._by_id[glyph_id] = self.glyph_at(position)
+        return glyph
+
+    def get(self, glyph_id, default=None):
+        # Warm lookups are a single dict probe, like the JSON index
+        glyph = self._by_id.get(glyph_id)
+        if glyph is not None:
+            return glyph
+        try:
+            return self[glyph_id]
+        except KeyError:
+            return default
+
+    def __contains__(self, glyph_id):
+        return glyph_id in self._by_id or self._snapshot.position_of(glyph_id) is not None
+
+    def __iter__(self):
+        for position in range(self._snapshot.glyph_count):
+            yield self._snapshot.id_at(position)
+
+    def __len__(self):
+        return self._snapshot.glyph_count
+
+
+class SnapshotPositions(Mapping):
+    """glyph ID -> registry position mapping backed by a snapshot."""
+
+    def __init__(self, snapshot):
+        self._snapshot = snapshot
+
+    def __getitem__(self, glyph_id):
+        position = self._snapshot.position_of(glyph_id)
+        if position is None:
+            raise KeyError(glyph_id)
+        return position
+
+    def __iter__(self):
+        for position in range(self._snapshot.glyph_count):
+            yield self._snapshot.id_at(position)
+
+    def __len__(self):
+        return self._snapshot.glyph_count
+
+
+class SnapshotPostings(Mapping):
+    """key -> list of glyph IDs mapping backed by a snapshot posting table."""
+
+    def __init__(self, index, table):
+        self._index = index
+        self._snapshot = index._snapshot
+        self._table = table
+        self._positions = {}
+        self._ids = {}
+
+    def positions(self, key):
+        """Registry positions listed under a key (empty for unknown keys)."""
+        positions = self._positions.get(key)
+        if positions is None:
+            found = self._table.find(key)
+            if found is None:
+                return ()
+            positions = self._positions[key] = found.tolist()
+        return positions
+
+    def glyphs(self, key):
+        """Glyphs listed under a key, resolved by position without ID lookups."""
+        glyph_at = self._index.glyph_at
+        return [glyph_at(position) for position in self.positions(key)]
+
+    def __getitem__(self, key):
+        ids = self._ids.get(key)
+        if ids is None:
+            positions = self.positions(key)
+            if not positions and self._table.find(key) is None:
+                raise KeyError(key)
+            id_at = self._snapshot.id_at
+            ids = self._ids[key] = [id_at(p) for p in positions]
+            # Later ID lookups (e.g. sorting by position) skip the binary search
+            self._snapshot._positions.update(zip(ids, positions))
+        return ids
+
+    def __iter__(self):
+        return iter(self._table.keys_list())
+
+    def __len__(self):
+        return self._table.keys.count
+
+
+def main():
+    """Compile a registry snapshot from the command line."""
+    default_registry = Path(__file__).parent.parent / "src" / "glyphs" / "registry.json"
+
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0].strip())
+    parser.add_argument('registry', nargs='?', type=Path, default=default_registry,
+                        help='registry JSON file (default: src/glyphs/registry.json)')
+    parser.add_argument('-o', '--output', type=Path, default=None,
+                        help='snapshot path (default: registry path with .snapshot suffix)')
+    args = parser.parse_args()
+
+    if not args.registry.exists():
+        print(f"Error: Registry not found at {args.registry}")
+        return 1
+
+    snapshot_path = compile_snapshot(args.registry, args.output)
+    snapshot = RegistrySnapshot(snapshot_path)
+    size = snapshot_path.stat().st_size
+    print(f"Compiled {snapshot.glyph_count} glyphs into {snapshot_path} ({size} bytes)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -7,26 +7,240 @@ Demonstrates how to load and use the glyph registry in a Python application.
 
 import json
 import os
+import threading
+from itertools import repeat
 from pathlib import Path
 
+from glyph_graph import GlyphGraph
+from registry_snapshot import (
+    RegistrySnapshot,
+    SnapshotGlyphIndex,
+    SnapshotPositions,
+    SnapshotPostings,
+)
+from svg_assets import SvgAssets, svg_data_uri
+from text_search import TextIndex
+
+
+# Default to the registry in this repo
+DEFAULT_REGISTRY_PATH = Path(__file__).parent.parent / "src" / "glyphs" / "registry.json"
+
+
+class _RegistryState:
+    """
+    Everything loaded from one version of the registry file.
+
+    A reload builds a complete new state and publishes it with a single
+    attribute assignment. Readers take one reference to the state per
+    call, so they never mix indexes from two versions.
+    """
+
+    __slots__ = ('version', 'stat_key', 'snapshot', 'document', 'index', 'position',
+                 'tag_index', 'category_index', 'use_case_index', 'derived')
+
+    def __init__(self, version, stat_key):
+        self.version = version
+        self.stat_key = stat_key
+        self.snapshot = None
+        # Parsed registry document (materialized on demand for snapshots)
+        self.document = None
+        self.derived = {}
+
 
 class BeaconGlyphs:
     """Simple glyph registry wrapper for Python applications."""
 
-    def __init__(self, registry_path=None):
+    # Process-wide instances handed out by shared(), keyed by resolved path
+    _shared = {}
+    _shared_lock = threading.Lock()
+
+    def __init__(self, registry_path=None, use_snapshot=True):
         if registry_path is None:
-            # Default to the registry in this repo
-            base_path = Path(__file__).parent.parent
-            registry_path = base_path / "src" / "glyphs" / "registry.json"
+            registry_path = DEFAULT_REGISTRY_PATH
 
-        with open(registry_path, 'r') as f:
-            self.registry = json.load(f)
+        self.registry_path = Path(registry_path)
+        self.use_snapshot = use_snapshot
+        self._state = None
+        self._lock = threading.Lock()
+        self._assets = None
+        self._load()
+
+    @classmethod
+    def shared(cls, registry_path=None):
+        """
+        Get the process-wide registry instance for a registry file.
+
+        The registry is loaded on first use and reused by every caller
+        afterwards. Each call re-checks the file's mtime and size and
+        reloads the shared instance in place if the file has changed, so
+        existing holders of the instance see the new glyphs too.
+        """
+        path = Path(registry_path or DEFAULT_REGISTRY_PATH).resolve()
+
+        with cls._shared_lock:
+            instance = cls._shared.get(path)
+            if instance is None:
+                instance = cls._shared[path] = cls(path)
+                return instance
+
+        instance.reload_if_changed()
+        return instance
+
+    @classmethod
+    def clear_shared(cls):
+        """Drop all shared instances (mainly useful in tests)."""
+        with cls._shared_lock:
+            cls._shared.clear()
+
+    @property
+    def snapshot(self):
+        """The memory-mapped snapshot serving lookups, or None for JSON."""
+        return self._state.snapshot
+
+    @property
+    def version(self):
+        """Incremented every time the registry is (re)loaded."""
+        return self._state.version
+
+    def _stat_key(self):
+        stat = os.stat(self.registry_path)
+        return (stat.st_mtime_ns, stat.st_size)
+
+    def _load(self):
+        """
+        Load the registry and its indexes.
 
-        # Build an index for fast lookup
-        self._index = {
-            glyph['id']: glyph
-            for glyph in self.registry['glyphs']
-        }
+        A fresh compiled snapshot (see registry_snapshot.py) is opened
+        in preference to the JSON file; a missing or stale snapshot falls
+        back to parsing JSON and building the indexes in Python. The new
+        state is published only once it is complete.
+        """
+        previous = self._state
+        state = _RegistryState(previous.version + 1 if previous else 1, self._stat_key())
+
+        snapshot = None
+        if self.use_snapshot:
+            snapshot = RegistrySnapshot.open_if_fresh(self.registry_path)
+
+        if snapshot is not None:
+            self._load_snapshot(state, snapshot)
+        else:
+            with open(self.registry_path, 'r') as f:
+                state.document = json.load(f)
+            self._build_indexes(state)
+
+        self._state = state
+
+    def derived(self, key, build):
+        """
+        Memoize data derived from the current registry contents.
+
+        `build(glyphs)` runs once per key and registry version; the cache
+        is discarded whenever the registry is reloaded. `glyphs` reads
+        the same registry version the value is cached under, even if a
+        reload happens while it is being built.
+        """
+        return self._derived(self._state, key, build)
+
+    def _derived(self, state, key, build):
+        cache = state.derived
+        try:
+            return cache[key]
+        except KeyError:
+            value = cache[key] = build(self._pinned(state))
+            return value
+
+    def _pinned(self, state):
+        """A view of this registry that always reads `state`."""
+        view = object.__new__(type(self))
+        view.registry_path = self.registry_path
+        view.use_snapshot = self.use_snapshot
+        view._state = state
+        view._lock = self._lock
+        view._assets = self._assets
+        return view
+
+    def _load_snapshot(self, state, snapshot):
+        """Serve lookups straight from a memory-mapped snapshot."""
+        state.snapshot = snapshot
+        state.index = SnapshotGlyphIndex(snapshot)
+        state.position = SnapshotPositions(snapshot)
+        state.tag_index = SnapshotPostings(state.index, snapshot.tags)
+        state.category_index = SnapshotPostings(state.index, snapshot.categories)
+        state.use_case_index = SnapshotPostings(state.index, snapshot.use_cases)
+
+    @property
+    def registry(self):
+        """The full registry document (materialized on demand for snapshots)."""
+        state = self._state
+        if state.document is None:
+            registry = state.snapshot.meta()
+            registry['glyphs'] = [
+                state.index.glyph_at(position)
+                for position in range(len(state.index))
+            ]
+            state.document = registry
+        return state.document
+
+    def reload_if_changed(self):
+        """
+        Reload the registry if the file's mtime or size has changed.
+
+        Returns:
+            True if the registry was reloaded
+        """
+        with self._lock:
+            if self._stat_key() == self._state.stat_key:
+                return False
+            self._load()
+            return True
+
+    def _build_indexes(self, state):
+        """Build the id index and the inverted tag/category/useCase indexes."""
+        index = {}
+        position_map = {}
+        tag_index = {}
+        category_index = {}
+        use_case_index = {}
+
+        for position, glyph in enumerate(state.document['glyphs']):
+            glyph_id = glyph['id']
+            index[glyph_id] = glyph
+            position_map[glyph_id] = position
+
+            category_index.setdefault(glyph['category'], []).append(glyph_id)
+
+            # A glyph listing a tag twice is still indexed under it once
+            metadata = glyph.get('metadata', {})
+            for tag in dict.fromkeys(metadata.get('tags', [])):
+                tag_index.setdefault(tag, []).append(glyph_id)
+            for use_case in dict.fromkeys(metadata.get('useCases', [])):
+                use_case_index.setdefault(use_case, []).append(glyph_id)
+
+        state.index = index
+        state.position = position_map
+        state.tag_index = tag_index
+        state.category_index = category_index
+        state.use_case_index = use_case_index
+
+    @staticmethod
+    def _glyph_at(state, position):
+        """Get the glyph at a registry position."""
+        if state.snapshot is not None:
+            return state.index.glyph_at(position)
+        return state.document['glyphs'][position]
+
+    @staticmethod
+    def _resolve(state, glyph_ids):
+        """Map a list of glyph IDs to glyph objects."""
+        index = state.index
+        return [index[glyph_id] for glyph_id in glyph_ids]
+
+    def _lookup(self, state, postings, key):
+        """Get the glyphs an inverted index lists under a key."""
+        if state.snapshot is not None:
+            return postings.glyphs(key)
+        return self._resolve(state, postings.get(key, ()))
 
     def get(self, glyph_id, format='unicode'):
         """
@@ -39,38 +253,243 @@ class BeaconGlyphs:
         Returns:
             String representation of the glyph, or None if not found
         """
-        glyph = self._index.get(glyph_id)
+        glyph = self._state.index.get(glyph_id)
         if not glyph:
             return None
 
         return glyph['representations'].get(format)
 
+    @property
+    def assets(self):
+        """SVG artwork cache for assets/svg/ (created on first use)."""
+        if self._assets is None:
+            self._assets = SvgAssets()
+        return self._assets
+
+    def get_svg(self, glyph_id, data_uri=False):
+        """
+        Get a glyph's SVG artwork.
+
+        Inline SVG from the registry is used when present; otherwise the
+        glyph's file in assets/svg/ is served from the asset cache.
+
+        Args:
+            glyph_id: Glyph identifier (e.g., 'continuity.chain')
+            data_uri: Return a data URI instead of SVG markup
+
+        Returns:
+            SVG markup or data URI, or None if the glyph has no artwork
+        """
+        glyph = self._state.index.get(glyph_id)
+        if not glyph:
+            return None
+        inline = glyph['representations'].get('svg')
+        if inline is not None:
+            return svg_data_uri(inline) if data_uri else inline
+        return self.assets.data_uri(glyph_id) if data_uri else self.assets.get(glyph_id)
+
+    def _representation_table(self, state, format):
+        """
+        glyph ID -> representation for one format, cached per registry version.
+
+        Built in full for JSON-loaded registries; for snapshots it starts
+        empty and is filled with the IDs that batches actually ask for, so
+        the snapshot is never decoded wholesale.
+        """
+        def build(glyphs):
+            if glyphs.snapshot is not None:
+                return {}
+            table = {}
+            for glyph_id, glyph in glyphs._state.index.items():
+                value = glyph['representations'].get(format)
+                if value is not None:
+                    table[glyph_id] = value
+            return table
+
+        return self._derived(state, ('representations', format), build)
+
+    def get_many(self, glyph_ids, format='unicode', default=None):
+        """
+        Get many glyphs in the specified format in one call.
+
+        Args:
+            glyph_ids: Sequence of glyph identifiers
+            format: Representation format ('unicode', 'text', 'emoji', 'svg')
+            default: Value for unknown IDs or glyphs without that format
+
+        Returns:
+            List of representations, in the same order as glyph_ids
+        """
+        if not isinstance(glyph_ids, (list, tuple)):
+            glyph_ids = list(glyph_ids)
+
+        state = self._state
+        table = self._representation_table(state, format)
+        if state.snapshot is not None:
+            index = state.index
+            for glyph_id in set(glyph_ids).difference(table):
+                glyph = index.get(glyph_id)
+                if glyph is not None:
+                    value = glyph['representations'].get(format)
+                    if value is not None:
+                        table[glyph_id] = value
+
+        return list(map(table.get, glyph_ids, repeat(default)))
+
+    def get_matrix(self, glyph_ids, formats, default=None):
+        """
+        Get many glyphs in several formats in one call.
+
+        Args:
+            glyph_ids: Sequence of glyph identifiers
+            formats: Sequence of representation formats
+            default: Value for unknown IDs or missing formats
+
+        Returns:
+            List with one tuple per glyph ID, holding its representation
+            in each of `formats` in order
+        """
+        if not isinstance(glyph_ids, (list, tuple)):
+            glyph_ids = list(glyph_ids)
+        columns = [self.get_many(glyph_ids, format, default) for format in formats]
+        return list(zip(*columns))
+
     def get_glyph(self, glyph_id):
         """Get the full glyph object."""
-        return self._index.get(glyph_id)
+        return self._state.index.get(glyph_id)
 
     def search_by_tag(self, tag):
         """Find glyphs that have a specific tag."""
-        results = []
-        for glyph in self.registry['glyphs']:
-            tags = glyph.get('metadata', {}).get('tags', [])
-            if tag in tags:
-                results.append(glyph)
-        return results
+        state = self._state
+        return self._lookup(state, state.tag_index, tag)
 
-    def get_category(self, category_name):
-        """Get all glyphs in a specific category."""
+    def search_by_tags(self, tags, match='all'):
+        """
+        Find glyphs matching several tags.
+
+        Args:
+            tags: Iterable of tags to look up
+            match: 'all' to require every tag (AND), 'any' for at least one (OR)
+
+        Returns:
+            List of glyph objects in registry order
+        """
+        if match not in ('all', 'any'):
+            raise ValueError(f"match must be 'all' or 'any', got: {match}")
+
+        # Snapshots post registry positions directly, so no ID lookups are needed
+        state = self._state
+        snapshot = state.snapshot is not None
+        if snapshot:
+            postings = [state.tag_index.positions(tag) for tag in tags]
+        else:
+            postings = [state.tag_index.get(tag, []) for tag in tags]
+        if not postings:
+            return []
+
+        if match == 'all':
+            # Walk the shortest posting list and probe the others
+            postings.sort(key=len)
+            others = [set(p) for p in postings[1:]]
+            keys = [
+                key for key in postings[0]
+                if all(key in other for other in others)
+            ]
+        elif snapshot:
+            keys = sorted(set().union(*postings))
+        else:
+            keys = sorted(
+                set().union(*postings),
+                key=state.position.__getitem__
+            )
+
+        if snapshot:
+            return [state.index.glyph_at(position) for position in keys]
+        return self._resolve(state, keys)
+
+    def text_index(self):
+        """
+        Get the full-text search index for the current registry version.
+
+        Built on first use and kept until the registry is reloaded. A
+        fresh persisted index (see text_search.py) is loaded instead of
+        building one, unless the instance was created with
+        use_snapshot=False.
+        """
+        return self._text_index(self._state)
+
+    def _text_index(self, state):
+        def build(glyphs):
+            index = None
+            if glyphs.use_snapshot:
+                index = TextIndex.open_if_fresh(glyphs.registry_path)
+            if index is None:
+                index = TextIndex.build(glyphs.registry['glyphs'])
+            return index
+
+        return self._derived(state, 'text_index', build)
+
+    def search_text(self, query, limit=10):
+        """
+        Find glyphs by free text across names, descriptions, accessibility
+        text and tags.
+
+        Args:
+            query: Free-text query (e.g., 'trust boundaries')
+            limit: Maximum number of results
+
+        Returns:
+            List of glyph objects, best match first
+        """
+        state = self._state
         return [
-            glyph for glyph in self.registry['glyphs']
-            if glyph['category'] == category_name
+            self._glyph_at(state, position)
+            for position, _ in self._text_index(state).search(query, limit)
         ]
 
+    def graph(self):
+        """Get the relatedGlyphs graph for the current registry version."""
+        return self._graph(self._state)
+
+    def _graph(self, state):
+        return self._derived(state, 'graph',
+                             lambda glyphs: GlyphGraph(glyphs.registry['glyphs']))
+
+    def get_related(self, glyph_id, hops=1, direction='both'):
+        """
+        Get glyphs related to a glyph, following relatedGlyphs references.
+
+        Args:
+            glyph_id: Glyph identifier
+            hops: How many references to follow
+            direction: 'out', 'in' or 'both' (see GlyphGraph.neighbors)
+
+        Returns:
+            List of glyph objects, nearest first (empty for unknown IDs)
+        """
+        state = self._state
+        graph = self._graph(state)
+        if glyph_id not in graph:
+            return []
+        return self._resolve(state, graph.k_hop(glyph_id, hops, direction))
+
+    def get_category(self, category_name):
+        """Get all glyphs in a specific category."""
+        state = self._state
+        return self._lookup(state, state.category_index, category_name)
+
+    def get_use_case(self, use_case):
+        """Get all glyphs tagged with a specific use case."""
+        state = self._state
+        return self._lookup(state, state.use_case_index, use_case)
+
     def all_categories(self):
         """Get a list of all unique categories."""
-        return sorted(set(
-            glyph['category']
-            for glyph in self.registry['glyphs']
-        ))
+        return sorted(self._state.category_index)
+
+    def all_tags(self):
+        """Get a list of all unique tags."""
+        return sorted(self._state.tag_index)
 
 
 def demo_basic_usage():
@@ -80,7 +499,7 @@ def demo_basic_usage():
     print("=" * 60)
     print()
 
-    glyphs = BeaconGlyphs()
+    glyphs = BeaconGlyphs.shared()
 
     # Get individual glyphs
     print("1. Individual Glyphs:")
@@ -107,7 +526,7 @@ def demo_category_display():
     print("=" * 60)
     print()
 
-    glyphs = BeaconGlyphs()
+    glyphs = BeaconGlyphs.shared()
 
     for category in glyphs.all_categories():
         print(f"{category.upper()}")
@@ -129,7 +548,7 @@ def demo_status_indicator():
     print("=" * 60)
     print()
 
-    glyphs = BeaconGlyphs()
+    glyphs = BeaconGlyphs.shared()
 
     # Simulate different service states
     services = [
@@ -165,7 +584,7 @@ def demo_continuity_chain():
     print("=" * 60)
     print()
 
-    glyphs = BeaconGlyphs()
+    glyphs = BeaconGlyphs.shared()
 
     # Simulate session continuity
     sessions = [
@@ -203,7 +622,7 @@ def demo_event_log():
     print("=" * 60)
     print()
 
-    glyphs = BeaconGlyphs()
+    glyphs = BeaconGlyphs.shared()
 
     events = [
         ("events.start", "Session initiated"),
@@ -234,7 +653,7 @@ def demo_search():
     print("=" * 60)
     print()
 
-    glyphs = BeaconGlyphs()
+    glyphs = BeaconGlyphs.shared()
 
     # Search by tag
     print("Glyphs tagged with 'continuity':")
@@ -249,6 +668,27 @@ def demo_search():
         print(f"  {glyph['representations']['unicode']} {glyph['name']}")
     print()
 
+    # Multi-tag queries
+    print("Glyphs tagged with 'continuity' AND 'session':")
+    for glyph in glyphs.search_by_tags(['continuity', 'session'], match='all'):
+        print(f"  {glyph['representations']['unicode']} {glyph['name']}")
+    print()
+
+    print("Free-text search for 'session memory':")
+    for glyph in glyphs.search_text('session memory', limit=3):
+        print(f"  {glyph['representations']['unicode']} {glyph['name']}")
+    print()
+
+    print("Glyphs related to 'continuity.chain':")
+    for glyph in glyphs.get_related('continuity.chain'):
+        print(f"  {glyph['representations']['unicode']} {glyph['name']}")
+    print()
+
+    print("Glyphs used by Glyphtrail:")
+    for glyph in glyphs.get_use_case('glyphtrail'):
+        print(f"  {glyph['representations']['unicode']} {glyph['name']}")
+    print()
+
 
 def main():
     """Run all demos."""
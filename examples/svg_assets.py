@@ -0,0 +1,242 @@
+#!/usr/bin/env python3
+"""
+BeaconGlyphs - SVG Asset Cache
+
+Maps glyph IDs to the artwork in assets/svg/ ('continuity.chain' ->
+continuity-chain.svg) and serves it from an in-memory LRU cache. Assets
+are read on first use (or all at once with `preload()`), optionally
+minified, and can be turned into data URIs or <symbol> sprite sheets
+without going back to disk.
+
+Usage:
+    python examples/svg_assets.py [glyph_id ...]
+"""
+
+import re
+import sys
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from urllib.parse import quote
+
+
+DEFAULT_ASSETS_DIR = Path(__file__).parent.parent / "assets" / "svg"
+
+SYMBOL_PREFIX = 'bg-'
+
+_COMMENT_RE = re.compile(r'<!--.*?-->', re.DOTALL)
+_PROLOG_RE = re.compile(r'<\?xml.*?\?>|<!DOCTYPE[^>]*>', re.DOTALL)
+_METADATA_RE = re.compile(r'<metadata\b.*?</metadata>|<metadata\b[^>]*/>', re.DOTALL)
+_TITLE_DESC_RE = re.compile(r'<(title|desc)\b[^>]*>.*?</\1>', re.DOTALL)
+_BETWEEN_TAGS_RE = re.compile(r'>\s+<')
+_SPACES_RE = re.compile(r'\s+')
+_TAG_END_RE = re.compile(r'\s+(/?>)')
+_ROOT_RE = re.compile(r'<svg\b([^>]*)>(.*)</svg>', re.DOTALL)
+_ATTR_RE = re.compile(r'([\w:.-]+)\s*=\s*(["\'])(.*?)\2', re.DOTALL)
+
+# Root attributes that only make sense on a standalone document
+_DOCUMENT_ATTRS = {'xmlns', 'xmlns:xlink', 'version', 'width', 'height', 'id', 'x', 'y'}
+
+# Characters left unescaped in data URIs; quoting less keeps them short
+_URI_SAFE = " =:/;,'-_.!~*()@?&+$"
+
+
+def asset_name(glyph_id):
+    """Asset file stem for a glyph ID ('continuity.chain' -> 'continuity-chain')."""
+    return glyph_id.replace('.', '-')
+
+
+def minify_svg(svg, keep_titles=True):
+    """
+    Minify SVG markup.
+
+    Strips the XML prolog, comments, <metadata> and whitespace between
+    tags, and collapses runs of whitespace. <title>/<desc> are kept by
+    default because screen readers use them.
+    """
+    svg = _PROLOG_RE.sub('', svg)
+    svg = _COMMENT_RE.sub('', svg)
+    svg = _METADATA_RE.sub('', svg)
+    if not keep_titles:
+        svg = _TITLE_DESC_RE.sub('', svg)
+    svg = _BETWEEN_TAGS_RE.sub('><', svg)
+    svg = _SPACES_RE.sub(' ', svg)
+    svg = _TAG_END_RE.sub(r'\1', svg)
+    return svg.strip()
+
+
+def svg_data_uri(svg):
+    """Encode SVG markup as a URL-encoded data URI (smaller than base64 for SVG)."""
+    return 'data:image/svg+xml,' + quote(svg.replace('"', "'"), safe=_URI_SAFE)
+
+
+def svg_to_symbol(svg, symbol_id):
+    """
+    Convert a standalone SVG document into a <symbol> element.
+
+    The root's viewBox and presentation attributes (fill, stroke, ...)
+    move to the symbol; document-only attributes such as width, height
+    and xmlns are dropped.
+    """
+    match = _ROOT_RE.search(svg)
+    if match is None:
+        raise ValueError(f"Not an SVG document: {symbol_id}")
+    attrs, body = match.groups()
+
+    parts = [f'id="{symbol_id}"']
+    for name, _, value in _ATTR_RE.findall(attrs):
+        if name not in _DOCUMENT_ATTRS:
+            # The value may have been single-quoted; the symbol uses double quotes
+            value = value.replace('"', '&quot;')
+            parts.append(f'{name}="{value}"')
+    return f"<symbol {' '.join(parts)}>{body.strip()}</symbol>"
+
+
+def build_sprite(symbols):
+    """Wrap <symbol> elements in a hidden sprite sheet document."""
+    return (
+        '<svg xmlns="http://www.w3.org/2000/svg" style="display:none">'
+        + ''.join(symbols) +
+        '</svg>'
+    )
+
+
+class _Asset:
+    __slots__ = ('svg', 'data_uri', 'symbol')
+
+    def __init__(self, svg):
+        self.svg = svg
+        self.data_uri = None
+        self.symbol = None
+
+
+class SvgAssets:
+    """LRU-cached access to the SVG artwork in an assets directory."""
+
+    def __init__(self, assets_dir=None, max_entries=256, minify=True):
+        self.assets_dir = Path(assets_dir or DEFAULT_ASSETS_DIR)
+        self.max_entries = max_entries
+        self.minify = minify
+        self._cache = OrderedDict()
+        self._lock = threading.Lock()
+
+    def names(self):
+        """Get the stems of every asset in the directory, sorted."""
+        return sorted(path.stem for path in self.assets_dir.glob('*.svg'))
+
+    def path_for(self, name):
+        """Get the file for a glyph ID or asset stem."""
+        return self.assets_dir / f"{asset_name(name)}.svg"
+
+    def _asset(self, name):
+        name = asset_name(name)
+        with self._lock:
+            asset = self._cache.get(name)
+            if asset is not None:
+                self._cache.move_to_end(name)
+                return asset
+
+        try:
+            svg = self.path_for(name).read_text(encoding='utf-8')
+        except FileNotFoundError:
+            return None
+        if self.minify:
+            svg = minify_svg(svg)
+
+        with self._lock:
+            asset = self._cache.setdefault(name, _Asset(svg))
+            self._cache.move_to_end(name)
+            while len(self._cache) > self.max_entries:
+                self._cache.popitem(last=False)
+        return asset
+
+    def preload(self, names=None):
+        """
+        Read assets into the cache ahead of time.
+
+        Args:
+            names: Glyph IDs or asset stems (defaults to every asset)
+
+        Returns:
+            Number of assets loaded
+        """
+        if names is None:
+            names = self.names()
+        return sum(1 for name in names if self._asset(name) is not None)
+
+    def clear(self):
+        """Drop every cached asset (e.g. after the artwork changed)."""
+        with self._lock:
+            self._cache.clear()
+
+    def __len__(self):
+        return len(self._cache)
+
+    def get(self, name):
+        """Get the SVG markup for a glyph ID or asset stem, or None."""
+        asset = self._asset(name)
+        return asset.svg if asset is not None else None
+
+    def data_uri(self, name):
+        """Get the asset as a data URI (for <img src> or CSS url()), or None."""
+        asset = self._asset(name)
+        if asset is None:
+            return None
+        if asset.data_uri is None:
+            asset.data_uri = svg_data_uri(asset.svg)
+        return asset.data_uri
+
+    def symbol(self, name):
+        """Get the asset as a <symbol id="bg-<name>"> element, or None."""
+        asset = self._asset(name)
+        if asset is None:
+            return None
+        if asset.symbol is None:
+            asset.symbol = svg_to_symbol(asset.svg, SYMBOL_PREFIX + asset_name(name))
+        return asset.symbol
+
+    def sprite(self, names=None):
+        """
+        Build a sprite sheet of <symbol> elements.
+
+        Args:
+            names: Glyph IDs or asset stems (defaults to every asset);
+                unknown names are skipped
+
+        Returns:
+            SVG document; reference a glyph with <use href="#bg-<name>"/>
+        """
+        if names is None:
+            names = self.names()
+        return build_sprite(
+            symbol for symbol in (self.symbol(name) for name in names)
+            if symbol is not None
+        )
+
+
+def main():
+    """Print the minified SVG and data URI size for some assets."""
+    assets = SvgAssets()
+    names = sys.argv[1:] or assets.names()
+
+    raw_total = minified_total = 0
+    for name in names:
+        path = assets.path_for(name)
+        if not path.exists():
+            print(f"  ❌ {name}: no asset at {path}")
+            continue
+        raw = path.stat().st_size
+        minified = len(assets.get(name).encode('utf-8'))
+        raw_total += raw
+        minified_total += minified
+        print(f"  {asset_name(name):<28} {raw:6d} -> {minified:6d} bytes, "
+              f"data URI {len(assets.data_uri(name)):6d} bytes")
+
+    if raw_total:
+        print(f"Total: {raw_total} -> {minified_total} bytes "
+              f"({100 * (raw_total - minified_total) / raw_total:.1f}% smaller)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
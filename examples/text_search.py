@@ -0,0 +1,331 @@
+#!/usr/bin/env python3
+"""
+BeaconGlyphs - Full-Text Search Index
+
+Tokenized inverted index over glyph names, descriptions, accessibility
+text and tags, ranked with BM25. Each query token matches its exact term
+plus terms it is a prefix of ('trust bound' finds 'boundary').
+
+Every posting's BM25 contribution depends only on the indexed data, so
+it is computed once at build time and posting lists are stored sorted by
+it. Queries only score the first `champions` postings of each term (the
+"champion list"), which keeps latency flat on large registries: terms
+that appear in most glyphs carry little weight and are cut short, while
+selective terms are scored in full.
+
+The index can be persisted next to the registry:
+
+    python examples/text_search.py [registry.json] [-o registry.search]
+
+Layout (little-endian, offsets relative to the file start):
+
+    header      magic, format version, source mtime_ns/size, glyph count,
+                term count, average document length and section offsets
+    terms       JSON list of terms, sorted
+    offsets     uint32 start of each term's postings (term count + 1)
+    docs        uint32 registry positions, per term by descending impact
+    impacts     float32 BM25 contribution of each posting
+"""
+
+import argparse
+import heapq
+import json
+import math
+import os
+import re
+import struct
+import sys
+from array import array
+from bisect import bisect_left
+from pathlib import Path
+
+
+MAGIC = b'BGSEARCH'
+FORMAT_VERSION = 1
+INDEX_SUFFIX = '.search'
+
+# magic, version, mtime_ns, size, glyph count, term count, avgdl, 5 offsets
+_HEADER = struct.Struct('<8sIqqIId5Q')
+
+# Term frequency weight of each indexed field
+FIELD_WEIGHTS = (
+    ('name', 3.0),
+    ('tags', 2.0),
+    ('description', 1.0),
+    ('accessibility', 1.0),
+)
+
+K1 = 1.2
+B = 0.75
+
+# Score multiplier for terms matched by prefix rather than exactly
+PREFIX_WEIGHT = 0.5
+MAX_EXPANSIONS = 32
+
+_TOKEN_RE = re.compile(r'[a-z0-9]+')
+
+
+def index_path_for(registry_path):
+    """Default index location: next to the registry, '.search' suffix."""
+    return Path(registry_path).with_suffix(INDEX_SUFFIX)
+
+
+def _normalize(token):
+    """Fold simple English plurals ('boundaries' -> 'boundary')."""
+    if len(token) > 4 and token.endswith('ies'):
+        return token[:-3] + 'y'
+    if len(token) > 3 and token.endswith('s') and not token.endswith('ss'):
+        return token[:-1]
+    return token
+
+
+def tokenize(text):
+    """Split text into lowercase, plural-folded search terms."""
+    return [_normalize(token) for token in _TOKEN_RE.findall(text.lower())]
+
+
+def _fields(glyph):
+    metadata = glyph.get('metadata', {})
+    yield 'name', glyph.get('name', '')
+    yield 'tags', ' '.join(metadata.get('tags', []))
+    yield 'description', glyph.get('description', '')
+    yield 'accessibility', metadata.get('accessibility', '')
+
+
+def _le(data):
+    if sys.byteorder != 'little':
+        data = array(data.typecode, data)
+        data.byteswap()
+    return data.tobytes()
+
+
+class TextIndex:
+    """BM25-ranked inverted index with prefix matching."""
+
+    def __init__(self, terms, offsets, docs, impacts, glyph_count, avgdl, champions=1000):
+        self.terms = terms
+        self.glyph_count = glyph_count
+        self.avgdl = avgdl
+        self.champions = champions
+        # Set when loaded from a persisted index
+        self.source_mtime_ns = None
+        self.source_size = None
+        self._term_ids = {term: i for i, term in enumerate(terms)}
+        self._offsets = offsets
+        self._docs = docs
+        self._impacts = impacts
+
+    @classmethod
+    def build(cls, glyphs, champions=1000):
+        """
+        Build an index from a sequence of glyph objects.
+
+        Documents are identified by their position in `glyphs`.
+        """
+        weights = dict(FIELD_WEIGHTS)
+        doc_terms = []
+        lengths = []
+        for glyph in glyphs:
+            frequencies = {}
+            for field, text in _fields(glyph):
+                weight = weights[field]
+                for term in tokenize(text):
+                    frequencies[term] = frequencies.get(term, 0.0) + weight
+            doc_terms.append(frequencies)
+            lengths.append(sum(frequencies.values()))
+
+        count = len(doc_terms)
+        avgdl = (sum(lengths) / count) if count else 0.0
+
+        postings = {}
+        for position, frequencies in enumerate(doc_terms):
+            # Length normalization is per document, shared by all its terms
+            norm = K1 * (1 - B + B * lengths[position] / avgdl) if avgdl else K1
+            for term, tf in frequencies.items():
+                postings.setdefault(term, []).append((position, tf * (K1 + 1) / (tf + norm)))
+
+        terms = sorted(postings)
+        offsets = array('I', [0])
+        docs = array('I')
+        impacts = array('f')
+        for term in terms:
+            entries = postings[term]
+            n = len(entries)
+            idf = math.log(1 + (count - n + 0.5) / (n + 0.5))
+            entries.sort(key=lambda entry: (-entry[1], entry[0]))
+            for position, score in entries:
+                docs.append(position)
+                impacts.append(idf * score)
+            offsets.append(len(docs))
+
+        return cls(terms, offsets, docs, impacts, count, avgdl, champions)
+
+    def _expand(self, token):
+        """Yield (term id, weight) for the exact term and its prefix matches."""
+        exact = self._term_ids.get(token)
+        if exact is not None:
+            yield exact, 1.0
+
+        terms = self.terms
+        i = bisect_left(terms, token)
+        end = min(len(terms), i + MAX_EXPANSIONS + 1)
+        while i < end and terms[i].startswith(token):
+            if i != exact:
+                yield i, PREFIX_WEIGHT
+            i += 1
+
+    def search(self, query, limit=10):
+        """
+        Rank glyphs against a free-text query.
+
+        Returns:
+            List of (position, score) pairs, best first
+        """
+        scores = {}
+        get = scores.get
+        offsets = self._offsets
+        docs = self._docs
+        impacts = self._impacts
+        champions = self.champions
+
+        for token in dict.fromkeys(tokenize(query)):
+            for term_id, weight in self._expand(token):
+                start = offsets[term_id]
+                stop = min(offsets[term_id + 1], start + champions)
+                for position, impact in zip(docs[start:stop], impacts[start:stop]):
+                    scores[position] = get(position, 0.0) + weight * impact
+
+        return heapq.nlargest(limit, scores.items(), key=lambda item: (item[1], -item[0]))
+
+    def save(self, path, registry_path):
+        """Persist the index, stamped with the registry file's mtime and size."""
+        path = Path(path)
+        stat = os.stat(registry_path)
+
+        sections = [
+            json.dumps(self.terms, separators=(',', ':'), ensure_ascii=False).encode('utf-8'),
+            _le(self._offsets),
+            _le(self._docs),
+            _le(self._impacts),
+        ]
+        offsets = []
+        position = _HEADER.size
+        for section in sections:
+            offsets.append(position)
+            position += len(section)
+        offsets.append(position)
+
+        header = _HEADER.pack(
+            MAGIC, FORMAT_VERSION, stat.st_mtime_ns, stat.st_size,
+            self.glyph_count, len(self.terms), self.avgdl, *offsets
+        )
+
+        # Write to a temporary file and rename so readers never see a partial file
+        tmp_path = path.with_name(path.name + '.tmp')
+        with open(tmp_path, 'wb') as f:
+            f.write(header)
+            for section in sections:
+                f.write(section)
+        os.replace(tmp_path, path)
+        return path
+
+    @classmethod
+    def load(cls, path, champions=1000):
+        """Load a persisted index (without checking freshness)."""
+        with open(path, 'rb') as f:
+            data = f.read()
+        if len(data) < _HEADER.size:
+            raise ValueError(f"Search index too short: {path}")
+
+        fields = _HEADER.unpack_from(data, 0)
+        magic, version, mtime_ns, size, count, term_count, avgdl = fields[:7]
+        if magic != MAGIC:
+            raise ValueError(f"Not a BeaconGlyphs search index: {path}")
+        if version != FORMAT_VERSION:
+            raise ValueError(
+                f"Unsupported search index version {version} "
+                f"(expected {FORMAT_VERSION}): {path}"
+            )
+
+        terms_at, offsets_at, docs_at, impacts_at, end = fields[7:]
+        sections = []
+        for typecode, start, stop in (
+            ('I', offsets_at, docs_at), ('I', docs_at, impacts_at), ('f', impacts_at, end)
+        ):
+            values = array(typecode)
+            values.frombytes(data[start:stop])
+            if sys.byteorder != 'little':
+                values.byteswap()
+            sections.append(values)
+
+        terms = json.loads(data[terms_at:offsets_at].decode('utf-8'))
+        if len(terms) != term_count:
+            raise ValueError(f"Corrupt search index: {path}")
+
+        index = cls(terms, *sections, count, avgdl, champions)
+        index.source_mtime_ns = mtime_ns
+        index.source_size = size
+        return index
+
+    @classmethod
+    def open_if_fresh(cls, registry_path, index_path=None, champions=1000):
+        """
+        Load the persisted index for a registry if it matches the registry file.
+
+        Returns:
+            TextIndex, or None if the index is missing, unreadable or was
+            built from a different version of the registry
+        """
+        if index_path is None:
+            index_path = index_path_for(registry_path)
+
+        try:
+            stat = os.stat(registry_path)
+            index = cls.load(index_path, champions)
+        except (OSError, ValueError):
+            return None
+
+        if (index.source_mtime_ns, index.source_size) != (stat.st_mtime_ns, stat.st_size):
+            return None
+        return index
+
+
+def build_index_file(registry_path, index_path=None):
+    """
+    Build and persist the search index for a registry file.
+
+    Returns:
+        Path of the written index
+    """
+    if index_path is None:
+        index_path = index_path_for(registry_path)
+    with open(registry_path, 'r') as f:
+        glyphs = json.load(f)['glyphs']
+    return TextIndex.build(glyphs).save(index_path, registry_path)
+
+
+def main():
+    """Build a persisted search index from the command line."""
+    default_registry = Path(__file__).parent.parent / "src" / "glyphs" / "registry.json"
+
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0].strip())
+    parser.add_argument('registry', nargs='?', type=Path, default=default_registry,
+                        help='registry JSON file (default: src/glyphs/registry.json)')
+    parser.add_argument('-o', '--output', type=Path, default=None,
+                        help='index path (default: registry path with .search suffix)')
+    args = parser.parse_args()
+
+    if not args.registry.exists():
+        print(f"Error: Registry not found at {args.registry}")
+        return 1
+
+    index_path = build_index_file(args.registry, args.output)
+    index = TextIndex.load(index_path)
+    size = index_path.stat().st_size
+    print(f"Indexed {index.glyph_count} glyphs, {len(index.terms)} terms "
+          f"into {index_path} ({size} bytes)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -34,6 +34,9 @@ setup(
             "pytest-cov>=4.0.0",
             "jsonschema>=4.0.0",
         ],
+        "raster": [
+            "cairosvg>=2.5.0",
+        ],
     },
     classifiers=[
         "Development Status :: 4 - Beta",
@@ -0,0 +1,120 @@
+"""
+Tests for the parallel batch lineage renderer in
+examples/glyphtrail_integration/batch_render.py.
+"""
+
+import io
+import sys
+from pathlib import Path
+
+import pytest
+
+
+# Determine paths
+BASE_PATH = Path(__file__).parent.parent
+sys.path.insert(0, str(BASE_PATH / "examples" / "glyphtrail_integration"))
+
+from batch_render import print_throughput, render_batch  # noqa: E402
+from session_log import SessionLog, SessionStore  # noqa: E402
+from session_renderer import GlyphtrailSession  # noqa: E402
+
+
+START = 1_700_000_000.0
+TYPES = ['session.start', 'continuity.linked', 'state.active', 'continuity.broken']
+
+
+@pytest.fixture
+def store(tmp_path):
+    """A store with 10 sessions of 0..9 events."""
+    store = SessionStore(tmp_path / "store")
+    store.root.mkdir()
+    for n in range(10):
+        with store.open(f"s-{n}", f"Agent {n}") as log:
+            for i in range(n):
+                log.append(TYPES[i % len(TYPES)], f"event {i}", START + i)
+    return store
+
+
+def expected_lineage(store, session_id):
+    with SessionLog(store.path_for(session_id)) as log:
+        return GlyphtrailSession.from_log(log).render_lineage() + '\n'
+
+
+class TestRenderBatch:
+    """Test sharding, outputs and throughput statistics."""
+
+    @pytest.mark.parametrize("jobs", [1, 2])
+    def test_concatenated_stream_in_input_order(self, store, jobs):
+        out = io.StringIO()
+        stats = render_batch([store.root], stream=out, jobs=jobs, shard_size=3)
+        assert out.getvalue() == ''.join(expected_lineage(store, f"s-{n}") for n in range(10))
+        assert (stats['sessions'], stats['events']) == (10, 45)
+        assert sum(worker['sessions'] for worker in stats['workers'].values()) == 10
+
+    @pytest.mark.parametrize("jobs", [1, 2])
+    def test_per_session_files(self, store, tmp_path, jobs):
+        out_dir = tmp_path / "out"
+        render_batch([store.root], out_dir=out_dir, jobs=jobs, shard_size=4)
+        assert sorted(path.name for path in out_dir.iterdir()) == sorted(f"s-{n}.txt" for n in range(10))
+        for n in range(10):
+            text = (out_dir / f"s-{n}.txt").read_text(encoding='utf-8')
+            assert text == expected_lineage(store, f"s-{n}")
+
+    def test_in_memory_sessions_and_single_logs(self, store):
+        session = GlyphtrailSession("live", "Bob")
+        session.add_event('session.start', "hello", timestamp=START)
+        out = io.StringIO()
+        stats = render_batch([session, store.path_for("s-3")], stream=out, jobs=2)
+        assert out.getvalue() == session.render_lineage() + '\n' + expected_lineage(store, "s-3")
+        assert stats['events'] == 4
+
+    def test_logs_are_not_modified(self, store):
+        path = store.path_for("s-5")
+        before = path.read_bytes()
+        render_batch([path], stream=io.StringIO(), jobs=1)
+        assert path.read_bytes() == before
+
+    def test_throughput_report(self, store):
+        stats = render_batch([store.root], stream=io.StringIO(), jobs=1)
+        out = io.StringIO()
+        print_throughput(stats, out)
+        report = out.getvalue()
+        assert "Rendered 10 sessions (45 events)" in report
+        assert "per core" in report
+        assert "sessions per CPU second" in report
+
+    @pytest.mark.parametrize("jobs", [1, 2])
+    def test_failed_session_is_reported_not_fatal(self, store, tmp_path, jobs):
+        bad = store.root / "s-4x.gtlog"
+        bad.write_bytes(b'not a session log')
+        out = io.StringIO()
+        stats = render_batch([store.root], stream=out, jobs=jobs, shard_size=3)
+        assert out.getvalue() == ''.join(expected_lineage(store, f"s-{n}") for n in range(10))
+        assert stats['sessions'] == 10
+        assert [source for source, _ in stats['failed']] == [str(bad)]
+        assert "ValueError" in stats['failed'][0][1]
+
+        out_dir = tmp_path / "out"
+        stats = render_batch([store.root], out_dir=out_dir, jobs=jobs, shard_size=3)
+        assert len(stats['failed']) == 1
+        assert not (out_dir / "s-4x.txt").exists()
+        assert len(list(out_dir.iterdir())) == 10
+
+    def test_output_name_collision_is_reported(self, store, tmp_path):
+        other = SessionStore(tmp_path / "other")
+        other.root.mkdir()
+        with other.open("s-1", "Impostor") as log:
+            log.append('session.start', "other", START)
+
+        out_dir = tmp_path / "out"
+        stats = render_batch([store.root, other.root], out_dir=out_dir, jobs=1)
+        assert stats['sessions'] == 10
+        assert stats['failed'] == [(
+            str(other.path_for("s-1")),
+            f"s-1.txt is already written for {store.path_for('s-1')}",
+        )]
+        assert (out_dir / "s-1.txt").read_text(encoding='utf-8') == expected_lineage(store, "s-1")
+
+        report = io.StringIO()
+        print_throughput(stats, report)
+        assert "1 session(s) failed" in report.getvalue()
@@ -0,0 +1,69 @@
+"""
+Tests for the SVG sprite builder in tooling/build_sprite.py.
+"""
+
+import json
+import shutil
+import sys
+from pathlib import Path
+
+import pytest
+
+
+# Determine paths
+BASE_PATH = Path(__file__).parent.parent
+ASSETS_DIR = BASE_PATH / "assets" / "svg"
+sys.path.insert(0, str(BASE_PATH / "tooling"))
+
+from build_sprite import MANIFEST_NAME, SPRITE_NAME, SpriteBuilder  # noqa: E402
+
+
+@pytest.fixture
+def assets(tmp_path):
+    """Copy the shipped assets to a scratch directory."""
+    assets_dir = tmp_path / "svg"
+    shutil.copytree(ASSETS_DIR, assets_dir)
+    return assets_dir
+
+
+def build(assets, tmp_path):
+    builder = SpriteBuilder(assets, tmp_path / "out")
+    manifest = builder.build()
+    return builder, manifest
+
+
+class TestSpriteBuilder:
+    """Test sprite output, manifest and incremental rebuilds."""
+
+    def test_sprite_and_manifest(self, assets, tmp_path):
+        builder, manifest = build(assets, tmp_path)
+        sprite = (tmp_path / "out" / SPRITE_NAME).read_text()
+
+        assert sprite.count('<symbol ') == len(list(assets.glob('*.svg')))
+        entry = manifest['glyphs']['continuity.chain']
+        assert entry['symbol'] == 'bg-continuity-chain'
+        assert entry['file'] == 'continuity-chain.svg'
+        assert f'id="{entry["symbol"]}"' in sprite
+        # Brand artwork is not in the registry and is keyed by file stem
+        assert manifest['glyphs']['mirrordna']['symbol'] == 'bg-mirrordna'
+        assert json.loads((tmp_path / "out" / MANIFEST_NAME).read_text()) == manifest
+
+    def test_incremental_rebuild(self, assets, tmp_path):
+        _, first = build(assets, tmp_path)
+
+        builder, second = build(assets, tmp_path)
+        assert builder.stats['converted'] == 0
+        assert second == first
+
+        chain = assets / "continuity-chain.svg"
+        chain.write_text(chain.read_text().replace('stroke-width="2"', 'stroke-width="1.5"'))
+        (assets / "lingos.svg").unlink()
+
+        builder, third = build(assets, tmp_path)
+        assert builder.stats == {
+            'converted': 1, 'reused': len(list(assets.glob('*.svg'))) - 1, 'removed': 1,
+        }
+        assert third['hash'] != first['hash']
+        assert third['glyphs']['continuity.chain']['hash'] != first['glyphs']['continuity.chain']['hash']
+        assert 'lingos' not in third['glyphs']
+        assert 'stroke-width="1.5"' in (tmp_path / "out" / SPRITE_NAME).read_text()
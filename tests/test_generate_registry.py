@@ -0,0 +1,79 @@
+"""
+Tests for the synthetic registry generator in tooling/generate_registry.py.
+"""
+
+import json
+import sys
+from collections import Counter
+from pathlib import Path
+
+import pytest
+
+
+# Determine paths
+BASE_PATH = Path(__file__).parent.parent
+SCHEMA_PATH = BASE_PATH / "src" / "schema" / "glyph_schema.json"
+sys.path.insert(0, str(BASE_PATH / "tooling"))
+
+from generate_registry import RegistryGenerator, generate_registry  # noqa: E402
+from validate_registry import RegistryValidator  # noqa: E402
+
+
+def validate(registry, tmp_path):
+    """Run the validator over a registry dict and collect its findings."""
+    path = tmp_path / "registry.json"
+    path.write_text(json.dumps(registry))
+    findings = []
+    validator = RegistryValidator(path, SCHEMA_PATH, on_finding=findings.append)
+    validator.run_checks()
+    return findings
+
+
+class TestGenerator:
+    """Test determinism, validity and shape parameters."""
+
+    def test_same_seed_same_registry(self):
+        assert generate_registry(300, seed=5) == generate_registry(300, seed=5)
+        assert generate_registry(300, seed=5) != generate_registry(300, seed=6)
+
+    def test_clean_registry_passes_validation(self, tmp_path):
+        registry = generate_registry(2000, seed=1)
+        assert len(registry['glyphs']) == 2000
+        assert validate(registry, tmp_path) == []
+
+    def test_category_weights(self):
+        registry = generate_registry(1000, category_weights={'events': 3, 'state': 1})
+        counts = Counter(g['category'] for g in registry['glyphs'])
+        assert set(counts) == {'events', 'state'}
+        assert counts['events'] > 2 * counts['state']
+
+    def test_tag_cardinality_and_related_density(self):
+        registry = generate_registry(
+            2000, tag_vocabulary=20, tags_per_glyph=(1, 3), related_density=0.5
+        )
+        glyphs = registry['glyphs']
+        tags = {t for g in glyphs for t in g['metadata']['tags']}
+        assert len(tags) <= 20
+        assert all(1 <= len(g['metadata']['tags']) <= 3 for g in glyphs)
+
+        edges = sum(len(g['metadata'].get('relatedGlyphs', [])) for g in glyphs)
+        assert 0.4 < edges / len(glyphs) < 0.6
+
+    def test_injected_errors_are_reported(self, tmp_path):
+        generator = RegistryGenerator(seed=2, invalid_rate=0.05)
+        registry = generator.generate(2000)
+        assert generator.injected
+
+        errors = {f['glyph_id'] for f in validate(registry, tmp_path) if f['severity'] == 'error'}
+        assert errors == {glyph_id for _, glyph_id, _ in generator.injected}
+
+    def test_injected_duplicates_are_reported(self, tmp_path):
+        generator = RegistryGenerator(seed=3, duplicate_rate=0.02)
+        registry = generator.generate(2000)
+        duplicates = [f for f in validate(registry, tmp_path)
+                      if f['message'].startswith('Duplicate glyph ID')]
+        assert len(duplicates) == len(generator.injected) > 0
+
+    def test_rejects_unknown_category_weight(self):
+        with pytest.raises(ValueError):
+            RegistryGenerator(category_weights={'bogus': 1})
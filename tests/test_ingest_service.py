@@ -0,0 +1,254 @@
+"""
+Tests for the asyncio ingestion service in
+examples/glyphtrail_integration/ingest_service.py.
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+
+import pytest
+
+
+# Determine paths
+BASE_PATH = Path(__file__).parent.parent
+sys.path.insert(0, str(BASE_PATH / "examples" / "glyphtrail_integration"))
+
+from ingest_service import IngestClient, IngestError, IngestService  # noqa: E402
+from session_log import SessionLog  # noqa: E402
+from session_renderer import GlyphtrailSession  # noqa: E402
+
+
+START = 1_700_000_000.0
+
+
+def events(count, offset=0):
+    return [
+        {'type': 'continuity.linked' if i % 2 else 'state.active', 'message': f"event {offset + i}",
+         'timestamp': START + offset + i}
+        for i in range(count)
+    ]
+
+
+def run(coroutine):
+    return asyncio.run(asyncio.wait_for(coroutine, 30))
+
+
+class TestIngestService:
+    """Test queueing, persistence and rendering without a socket."""
+
+    def test_events_are_persisted(self, tmp_path):
+        async def scenario():
+            service = IngestService(tmp_path)
+            await service.submit("s-1", events(5), "Alice")
+            await service.submit("s-1", events(5, offset=5))
+            await service.submit("s-2", events(3))
+            await service.close()
+
+        run(scenario())
+        with SessionLog(tmp_path / "s-1.gtlog") as log:
+            assert log.agent_name == "Alice"
+            assert [row[1] for row in log.iter_rows()] == [f"event {i}" for i in range(10)]
+        with SessionLog(tmp_path / "s-2.gtlog") as log:
+            assert len(log) == 3
+
+    def test_render_matches_session(self, tmp_path):
+        async def scenario():
+            service = IngestService(tmp_path)
+            await service.submit("s-1", events(50), "Alice")
+            lineage = ''.join([chunk async for chunk in service.render("s-1", chunk_lines=7)])
+            timeline = ''.join([chunk async for chunk in service.render("s-1", 'timeline', chunk_lines=7)])
+            partial = ''.join([chunk async for chunk in service.render(
+                "s-1", since=START + 10, until=START + 12)])
+            await service.close()
+            return lineage, timeline, partial
+
+        lineage, timeline, partial = run(scenario())
+        with SessionLog(tmp_path / "s-1.gtlog") as log:
+            session = GlyphtrailSession.from_log(log)
+            assert lineage == session.render_lineage()
+            assert timeline == session.render_timeline()
+        assert "Total events: 2" in partial
+
+    def test_rejects_bad_batches(self, tmp_path):
+        async def scenario():
+            service = IngestService(tmp_path, max_batch=2)
+            for batch in ([], events(3), [{'type': 'x'}], [{'type': 'x', 'message': 'm', 'timestamp': 'now'}],
+                          [{'type': 'é' * 0x8000, 'message': 'm'}]):
+                with pytest.raises(ValueError):
+                    await service.submit("s-1", batch)
+            with pytest.raises(KeyError):
+                async for _ in service.render("missing"):
+                    pass
+            await service.close()
+
+        run(scenario())
+
+    def test_backpressure_when_queue_is_full(self, tmp_path):
+        async def scenario():
+            service = IngestService(tmp_path, queue_size=1)
+            await service.submit("s-1", events(1))
+            state = service._sessions["s-1"]
+            await state.queue.join()
+
+            # Stall the writer while it holds the session lock
+            async with state.lock:
+                first = asyncio.create_task(service.submit("s-1", events(1, 1)))
+                await asyncio.sleep(0.01)
+                second = asyncio.create_task(service.submit("s-1", events(1, 2)))
+                third = asyncio.create_task(service.submit("s-1", events(1, 3)))
+                await asyncio.sleep(0.01)
+                assert first.done()
+                assert not (second.done() and third.done())
+            await asyncio.gather(first, second, third)
+            assert service.stats['blocked_puts'] >= 1
+            await service.close()
+
+        run(scenario())
+        with SessionLog(tmp_path / "s-1.gtlog") as log:
+            assert sorted(row[1] for row in log.iter_rows()) == [f"event {i}" for i in range(4)]
+
+
+    def test_write_failure_is_reported(self, tmp_path):
+        async def scenario():
+            service = IngestService(tmp_path)
+            await service.submit("s-1", events(5), "Alice")
+            state = service._sessions["s-1"]
+            await state.queue.join()
+
+            def fail():
+                raise OSError("No space left on device")
+            state.log.flush = fail
+            with pytest.raises(OSError, match="No space left"):
+                await service.flush()
+            assert service.stats['write_errors'] == 1
+
+            # The error is reported once; later flushes and other sessions work
+            assert "s-1" not in service._sessions
+            assert state.log.closed
+            await service.flush()
+            await service.submit("s-2", events(2))
+            # The session reopens from disk, without the events that never synced
+            await service.submit("s-1", events(1))
+            await service.close()
+
+        run(scenario())
+        with SessionLog(tmp_path / "s-1.gtlog") as log:
+            assert len(log) == 1
+        with SessionLog(tmp_path / "s-2.gtlog") as log:
+            assert len(log) == 2
+
+    def test_failure_reported_to_next_request(self, tmp_path):
+        async def scenario():
+            service = IngestService(tmp_path)
+            await service.submit("s-1", events(1))
+            state = service._sessions["s-1"]
+            await state.queue.join()
+            service._fail(state, OSError("disk gone"))
+            with pytest.raises(OSError, match="Writing session s-1 failed"):
+                async for _ in service.render("s-1"):
+                    pass
+            # Already reported, so neither a flush nor the session fails again
+            await service.flush()
+            chunks = [chunk async for chunk in service.render("s-1")]
+            assert chunks
+            await service.close()
+
+        run(scenario())
+
+    def test_writer_survives_a_failed_batch(self, tmp_path):
+        async def scenario():
+            service = IngestService(tmp_path)
+            await service.submit("s-1", events(1))
+            state = service._sessions["s-1"]
+            await state.queue.join()
+
+            def fail(*args):
+                raise OSError("disk gone")
+            state.session.add_event = fail
+            await service.submit("s-1", events(3))
+            # The failed batch is still marked done, so this cannot hang
+            await state.queue.join()
+            assert state.pending == 0
+            assert service.stats['write_errors'] == 1
+            with pytest.raises(OSError, match="disk gone"):
+                await service.submit("s-1", events(1))
+            # Reported once, so closing succeeds
+            await service.close()
+
+        run(scenario())
+
+    def test_idle_sessions_closed_beyond_limit(self, tmp_path):
+        async def scenario():
+            service = IngestService(tmp_path, max_sessions=2)
+            await service.submit("s-1", events(2), "Alice")
+            await service.submit("s-2", events(2))
+            await service.flush()
+            await service.submit("s-3", events(2))
+            assert list(service._sessions) == ["s-2", "s-3"]
+            assert service.stats['sessions_closed'] == 1
+            await service.flush()
+
+            # A busy session is skipped; the next least recently used is closed
+            async with service._sessions["s-2"].lock:
+                await service.submit("s-1", events(2, 2))
+                assert list(service._sessions) == ["s-2", "s-1"]
+            await service.flush()
+            lineage = ''.join([chunk async for chunk in service.render("s-1")])
+            await service.close()
+            return lineage
+
+        lineage = run(scenario())
+        assert "Total events: 4" in lineage
+        with SessionLog(tmp_path / "s-1.gtlog") as log:
+            assert log.agent_name == "Alice"
+            assert [row[1] for row in log.iter_rows()] == [f"event {i}" for i in range(4)]
+
+
+class TestProtocol:
+    """Test the newline-delimited JSON protocol over sockets."""
+
+    async def exchange(self, service, connect):
+        clients = [await connect() for _ in range(4)]
+        await asyncio.gather(*(
+            client.append(f"s-{n % 2}", events(10, offset=n * 10), agent_name="Agent")
+            for n, client in enumerate(clients)
+        ))
+        client = clients[0]
+        lineage = await client.render("s-0")
+        timeline = await client.render("s-1", 'timeline')
+        with pytest.raises(IngestError, match="Unknown session"):
+            await client.render("nope")
+        with pytest.raises(IngestError, match="Unknown op"):
+            await client._request({'op': 'bogus'})
+        with pytest.raises(IngestError, match="longer than 65535 bytes"):
+            await client.append("s-0", [{'type': 'x' * 0x10000, 'message': 'm'}])
+        await client.flush()
+        stats = await client.stats()
+        for c in clients:
+            await c.close()
+        await service.close()
+        return lineage, timeline, stats
+
+    def test_unix_socket(self, tmp_path):
+        async def scenario():
+            service = IngestService(tmp_path / "store")
+            path = await service.start(tmp_path / "s.sock")
+            return await self.exchange(service, lambda: IngestClient.connect(path))
+
+        lineage, timeline, stats = run(scenario())
+        assert "Total events: 20" in lineage
+        assert len(timeline.split(' ')) == 20
+        assert stats['events'] == 40
+        assert stats['errors'] == 3
+        assert stats['sessions'] == 2
+
+    def test_tcp(self, tmp_path):
+        async def scenario():
+            service = IngestService(tmp_path / "store")
+            host, port = await service.start()
+            return await self.exchange(service, lambda: IngestClient.connect(host=host, port=port))
+
+        lineage, _, stats = run(scenario())
+        assert "Total events: 20" in lineage
+        assert stats['connections'] == 4
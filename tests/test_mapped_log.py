@@ -0,0 +1,132 @@
+"""
+Tests for the memory-mapped session log reader in
+examples/glyphtrail_integration/mapped_log.py.
+"""
+
+import io
+import sys
+from pathlib import Path
+
+import pytest
+
+
+# Determine paths
+BASE_PATH = Path(__file__).parent.parent
+sys.path.insert(0, str(BASE_PATH / "examples" / "glyphtrail_integration"))
+
+from mapped_log import MappedSessionLog  # noqa: E402
+from session_log import INDEX_ENTRY, INDEX_HEADER, SessionLog  # noqa: E402
+from session_renderer import GlyphtrailSession  # noqa: E402
+
+
+START = 1_700_000_000.0
+TYPES = ['session.start', 'continuity.linked', 'state.active', 'continuity.broken', 'événement']
+
+
+@pytest.fixture
+def log_path(tmp_path):
+    """Write a 100-event log (16-event blocks) with some out-of-order timestamps."""
+    path = tmp_path / "s.gtlog"
+    with SessionLog(path, "s-1", "Tester", index_interval=16) as log:
+        for i in range(100):
+            timestamp = START + i if i != 50 else START - 10
+            log.append(TYPES[i % len(TYPES)], f"event {i} ✓", timestamp,
+                       {'n': i} if i % 7 == 0 else None)
+    return path
+
+
+@pytest.fixture
+def logs(log_path):
+    with SessionLog(log_path) as log, MappedSessionLog(log_path) as mapped:
+        yield log, mapped
+
+
+class TestMappedSessionLog:
+    """Test that the mapped reader agrees with SessionLog."""
+
+    def test_header(self, logs):
+        _, mapped = logs
+        assert (mapped.session_id, mapped.agent_name, len(mapped)) == ("s-1", "Tester", 100)
+
+    @pytest.mark.parametrize("start,stop", [(0, None), (0, 1), (15, 17), (16, 32), (95, 100), (99, 500), (100, None)])
+    def test_rows(self, logs, start, stop):
+        log, mapped = logs
+        assert list(mapped.iter_rows(start, stop)) == list(log.iter_rows(start, stop))
+        assert list(mapped.iter_types(start, stop)) == [row[0] for row in log.iter_rows(start, stop)]
+
+    @pytest.mark.parametrize("since,until", [(None, None), (START + 20, START + 40), (None, START), (START + 99, None)])
+    def test_time_range(self, logs, since, until):
+        log, mapped = logs
+        assert list(mapped.iter_range(since, until)) == list(log.iter_range(since, until))
+
+    def test_summarize(self, logs):
+        _, mapped = logs
+        summary = mapped.summarize()
+        assert summary['events'] == 100
+        assert (summary['first'], summary['last']) == (START - 10, START + 99)
+        assert summary['types'] == {event_type: 20 for event_type in TYPES}
+        assert mapped.summarize(START + 10, START + 12)['types'] == {TYPES[0]: 1, TYPES[1]: 1}
+
+    def test_renders_like_session_log(self, logs):
+        log, mapped = logs
+        for since, until in [(None, None), (START + 30, START + 60)]:
+            expected = GlyphtrailSession.from_log(log, since, until)
+            session = GlyphtrailSession.from_log(mapped, since, until)
+            out = io.StringIO()
+            session.write_lineage(out)
+            assert out.getvalue() == expected.render_lineage()
+            assert session.render_timeline() == expected.render_timeline()
+            assert session.continuity_health() == expected.continuity_health()
+
+    def test_torn_tail_is_ignored(self, log_path):
+        with open(log_path, 'ab') as f:
+            f.write(b'\x00' * 30)
+        with MappedSessionLog(log_path) as mapped:
+            assert len(mapped) == 100
+            assert list(mapped.iter_rows(99))[0][1] == "event 99 ✓"
+
+    def test_without_index(self, log_path, logs):
+        log, _ = logs
+        expected = list(log.iter_rows())
+        log_path.with_suffix('.gtidx').unlink()
+        with MappedSessionLog(log_path) as mapped:
+            assert list(mapped.iter_rows()) == expected
+            assert list(mapped.iter_rows(40, 45)) == expected[40:45]
+
+    @pytest.mark.parametrize("field,value", [(0, 999), (2, 7)])
+    def test_non_contiguous_index_entry_is_not_trusted(self, log_path, logs, field, value):
+        log, _ = logs
+        expected = list(log.iter_rows())
+        # Break the third entry's first event or start offset; it and every
+        # entry after it must be ignored and the records scanned instead
+        index_path = log_path.with_suffix('.gtidx')
+        data = bytearray(index_path.read_bytes())
+        offset = INDEX_HEADER.size + 2 * INDEX_ENTRY.size
+        entry = list(INDEX_ENTRY.unpack_from(data, offset))
+        entry[field] = value
+        INDEX_ENTRY.pack_into(data, offset, *entry)
+        index_path.write_bytes(bytes(data))
+
+        with MappedSessionLog(log_path) as mapped:
+            assert len(mapped) == 100
+            assert list(mapped.iter_rows()) == expected
+            assert list(mapped.iter_rows(40, 45)) == expected[40:45]
+            assert list(mapped.iter_range(START + 20, START + 40)) == list(log.iter_range(START + 20, START + 40))
+
+    def test_view_types_match_rows(self, logs):
+        for source in logs:
+            view = source.view(START + 20, START + 60)
+            assert list(view.iter_types()) == [row[0] for row in view.iter_rows()]
+            assert list(view.iter_types(5, 9)) == [row[0] for row in view.iter_rows(5, 9)]
+
+    def test_releasing_pages_does_not_change_results(self, log_path, logs):
+        log, _ = logs
+        with MappedSessionLog(log_path, release_bytes=1) as mapped:
+            assert list(mapped.iter_rows()) == list(log.iter_rows())
+            assert list(mapped.iter_range(START, START + 80)) == list(log.iter_range(START, START + 80))
+
+    def test_rejects_other_files(self, tmp_path):
+        path = tmp_path / "x.gtlog"
+        path.write_bytes(b'not a session log at all')
+        with pytest.raises(ValueError):
+            MappedSessionLog(path)
@@ -0,0 +1,98 @@
+"""
+Tests for the PNG pre-renderer in tooling/rasterize_glyphs.py.
+
+A deterministic stand-in renderer is used so the cache, planning and
+parallel paths run without the optional cairosvg backend.
+"""
+
+import json
+import shutil
+import sys
+from pathlib import Path
+
+import pytest
+
+
+# Determine paths
+BASE_PATH = Path(__file__).parent.parent
+ASSETS_DIR = BASE_PATH / "assets" / "svg"
+sys.path.insert(0, str(BASE_PATH / "tooling"))
+
+from rasterize_glyphs import INDEX_NAME, Rasterizer, colorize  # noqa: E402
+
+
+def fake_render(svg, size):
+    """Stand-in renderer: records its inputs instead of drawing."""
+    return f"{size}:{svg}".encode('utf-8')
+
+
+def failing_render(svg, size):
+    raise ValueError("cannot render")
+
+
+@pytest.fixture
+def assets(tmp_path):
+    """A scratch copy of a few shipped assets."""
+    assets_dir = tmp_path / "svg"
+    assets_dir.mkdir()
+    for name in ('continuity-chain', 'state-verified', 'mirrordna'):
+        shutil.copy(ASSETS_DIR / f"{name}.svg", assets_dir)
+    return assets_dir
+
+
+def rasterizer(assets, tmp_path, render=fake_render, **options):
+    options.setdefault('jobs', 1)
+    return Rasterizer(assets, tmp_path / "png", sizes=(16, 32), colors=('#000', '#fff'),
+                      render=render, backend='fake', **options)
+
+
+class TestRasterizer:
+    """Test content addressing, skipping and parallel rendering."""
+
+    def test_renders_every_size_and_color(self, assets, tmp_path):
+        r = rasterizer(assets, tmp_path)
+        index = r.run()
+
+        assert r.stats['rendered'] == 3 * 2 * 2
+        png = tmp_path / "png" / index['continuity-chain']['32@#fff']
+        svg = (assets / "continuity-chain.svg").read_text()
+        assert png.read_bytes() == fake_render(colorize(svg, '#fff'), 32)
+        saved = json.loads((tmp_path / "png" / INDEX_NAME).read_text())
+        assert saved == {'backend': 'fake', 'glyphs': index}
+
+    def test_unchanged_svgs_are_skipped(self, assets, tmp_path):
+        rasterizer(assets, tmp_path).run()
+
+        chain = assets / "continuity-chain.svg"
+        chain.write_text(chain.read_text().replace('stroke-width="2"', 'stroke-width="3"'))
+        r = rasterizer(assets, tmp_path)
+        r.run(prune=True)
+        assert r.stats == {'rendered': 4, 'cached': 8, 'failed': 0, 'pruned': 4}
+
+    def test_parallel_matches_serial(self, assets, tmp_path):
+        serial = rasterizer(assets, tmp_path / "a").run()
+        parallel = rasterizer(assets, tmp_path / "b", jobs=2).run()
+        assert serial == parallel
+        for renders in serial.values():
+            for rel in renders.values():
+                assert (tmp_path / "a" / "png" / rel).read_bytes() == \
+                    (tmp_path / "b" / "png" / rel).read_bytes()
+
+    def test_failures_are_reported(self, assets, tmp_path):
+        r = rasterizer(assets, tmp_path, render=failing_render)
+        r.run()
+        assert r.stats['failed'] == 12
+        assert 'cannot render' in r.errors[0]
+
+    def test_failed_renders_left_out_of_index(self, assets, tmp_path):
+        def render(svg, size):
+            if size == 32:
+                raise ValueError("cannot render")
+            return fake_render(svg, size)
+
+        r = rasterizer(assets, tmp_path, render=render)
+        index = r.run()
+        assert r.stats['failed'] == 6
+        assert index['mirrordna'].keys() == {'16@#000', '16@#fff'}
+        saved = json.loads((tmp_path / "png" / INDEX_NAME).read_text())
+        assert saved['glyphs'] == index
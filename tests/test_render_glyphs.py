@@ -0,0 +1,403 @@
+"""
+Tests for the BeaconGlyphs Python wrapper in examples/render_glyphs.py.
+"""
+
+import json
+import os
+import sys
+import pytest
+from pathlib import Path
+
+
+# Determine paths
+BASE_PATH = Path(__file__).parent.parent
+sys.path.insert(0, str(BASE_PATH / "examples"))
+
+from render_glyphs import BeaconGlyphs  # noqa: E402
+from glyph_graph import GlyphGraph  # noqa: E402
+from registry_snapshot import compile_snapshot  # noqa: E402
+from svg_assets import SvgAssets, minify_svg, svg_to_symbol  # noqa: E402
+from text_search import build_index_file, tokenize  # noqa: E402
+
+
+@pytest.fixture
+def glyphs():
+    """Load the glyph registry wrapper."""
+    return BeaconGlyphs()
+
+
+def _scan_tag(glyphs, tag):
+    return [
+        g for g in glyphs.registry['glyphs']
+        if tag in g.get('metadata', {}).get('tags', [])
+    ]
+
+
+class TestIndexes:
+    """Test the inverted tag/category/useCase indexes."""
+
+    def test_search_by_tag_matches_scan(self, glyphs):
+        for tag in glyphs.all_tags():
+            assert glyphs.search_by_tag(tag) == _scan_tag(glyphs, tag)
+
+    def test_unknown_tag_returns_empty(self, glyphs):
+        assert glyphs.search_by_tag('no-such-tag') == []
+
+    def test_get_category_matches_scan(self, glyphs):
+        for category in glyphs.all_categories():
+            expected = [
+                g for g in glyphs.registry['glyphs']
+                if g['category'] == category
+            ]
+            assert glyphs.get_category(category) == expected
+
+    def test_get_use_case(self, glyphs):
+        results = glyphs.get_use_case('glyphtrail')
+        assert results
+        for glyph in results:
+            assert 'glyphtrail' in glyph['metadata']['useCases']
+
+    def test_search_by_tags_all(self, glyphs):
+        expected = [
+            g for g in _scan_tag(glyphs, 'continuity')
+            if 'session' in g['metadata']['tags']
+        ]
+        assert glyphs.search_by_tags(['continuity', 'session']) == expected
+
+    def test_search_by_tags_any(self, glyphs):
+        results = glyphs.search_by_tags(['continuity', 'identity'], match='any')
+        expected = [
+            g for g in glyphs.registry['glyphs']
+            if {'continuity', 'identity'} & set(g.get('metadata', {}).get('tags', []))
+        ]
+        assert results == expected
+
+    def test_search_by_tags_invalid_match(self, glyphs):
+        with pytest.raises(ValueError):
+            glyphs.search_by_tags(['continuity'], match='some')
+
+    def test_repeated_tag_returns_glyph_once(self, tmp_path):
+        data = json.loads((BASE_PATH / "src" / "glyphs" / "registry.json").read_text())
+        glyph = data['glyphs'][0]
+        glyph['metadata']['tags'] = ['twice', 'twice']
+        glyph['metadata']['useCases'] = ['again', 'again']
+        path = tmp_path / "registry.json"
+        path.write_text(json.dumps(data))
+
+        glyphs = BeaconGlyphs(path, use_snapshot=False)
+        assert glyphs.search_by_tag('twice') == [glyph]
+        assert glyphs.get_use_case('again') == [glyph]
+
+
+class TestSharedRegistry:
+    """Test the process-wide shared registry."""
+
+    @pytest.fixture(autouse=True)
+    def clear_shared(self):
+        BeaconGlyphs.clear_shared()
+        yield
+        BeaconGlyphs.clear_shared()
+
+    @pytest.fixture
+    def registry_copy(self, tmp_path):
+        path = tmp_path / "registry.json"
+        path.write_text((BASE_PATH / "src" / "glyphs" / "registry.json").read_text())
+        return path
+
+    def test_shared_returns_same_instance(self):
+        assert BeaconGlyphs.shared() is BeaconGlyphs.shared()
+
+    def test_shared_is_keyed_by_path(self, registry_copy):
+        assert BeaconGlyphs.shared(registry_copy) is not BeaconGlyphs.shared()
+
+    def test_unchanged_file_is_not_reloaded(self, registry_copy):
+        glyphs = BeaconGlyphs.shared(registry_copy)
+        version = glyphs.version
+        assert glyphs.reload_if_changed() is False
+        assert BeaconGlyphs.shared(registry_copy).version == version
+
+    def test_changed_file_is_reloaded_in_place(self, registry_copy):
+        glyphs = BeaconGlyphs.shared(registry_copy)
+        version = glyphs.version
+
+        data = json.loads(registry_copy.read_text())
+        data['glyphs'][0]['representations']['unicode'] = '#'
+        registry_copy.write_text(json.dumps(data))
+        stat = os.stat(registry_copy)
+        os.utime(registry_copy, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+        assert BeaconGlyphs.shared(registry_copy) is glyphs
+        assert glyphs.version == version + 1
+        assert glyphs.get(data['glyphs'][0]['id']) == '#'
+
+    def test_derived_build_sees_one_version(self, registry_copy):
+        glyphs = BeaconGlyphs(registry_copy)
+        glyph_id = glyphs.registry['glyphs'][0]['id']
+        before = glyphs.get(glyph_id)
+
+        def build(view):
+            # A reload while the value is being built must not leak into it
+            data = json.loads(registry_copy.read_text())
+            data['glyphs'][0]['representations']['unicode'] = '#'
+            registry_copy.write_text(json.dumps(data))
+            stat = os.stat(registry_copy)
+            os.utime(registry_copy, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+            assert glyphs.reload_if_changed()
+            return view.version, view.get(glyph_id)
+
+        version = glyphs.version
+        assert glyphs.derived('probe', build) == (version, before)
+        assert glyphs.get(glyph_id) == '#'
+        assert glyphs.derived('probe', lambda view: (view.version, view.get(glyph_id))) == \
+            (version + 1, '#')
+
+
+class TestSnapshot:
+    """Test loading from a compiled registry snapshot."""
+
+    @pytest.fixture
+    def registry_copy(self, tmp_path):
+        path = tmp_path / "registry.json"
+        path.write_text((BASE_PATH / "src" / "glyphs" / "registry.json").read_text())
+        return path
+
+    def test_snapshot_matches_json(self, registry_copy):
+        from_json = BeaconGlyphs(registry_copy, use_snapshot=False)
+        compile_snapshot(registry_copy)
+        from_snapshot = BeaconGlyphs(registry_copy)
+
+        assert from_snapshot.snapshot is not None
+        for glyph in from_json.registry['glyphs']:
+            assert from_snapshot.get_glyph(glyph['id']) == glyph
+        for tag in from_json.all_tags():
+            assert from_snapshot.search_by_tag(tag) == from_json.search_by_tag(tag)
+        for category in from_json.all_categories():
+            assert from_snapshot.get_category(category) == from_json.get_category(category)
+        assert from_snapshot.get_use_case('logs') == from_json.get_use_case('logs')
+        assert from_snapshot.all_tags() == from_json.all_tags()
+        assert from_snapshot.get('no.such') is None
+        assert from_snapshot.registry == from_json.registry
+
+    def test_snapshot_multi_tag_search_matches_json(self, registry_copy):
+        data = json.loads(registry_copy.read_text())
+        data['glyphs'][0]['metadata']['tags'].append(data['glyphs'][0]['metadata']['tags'][0])
+        registry_copy.write_text(json.dumps(data))
+        from_json = BeaconGlyphs(registry_copy, use_snapshot=False)
+        compile_snapshot(registry_copy)
+        from_snapshot = BeaconGlyphs(registry_copy)
+
+        assert from_snapshot.snapshot is not None
+        tags = from_json.all_tags()
+        for match in ('all', 'any'):
+            for pair in zip(tags, tags[1:]):
+                assert from_snapshot.search_by_tags(pair, match) == from_json.search_by_tags(pair, match)
+        first = data['glyphs'][0]
+        assert from_snapshot.search_by_tag(first['metadata']['tags'][0]) == \
+            from_json.search_by_tag(first['metadata']['tags'][0])
+        assert from_snapshot.get_related(first['id'], 2) == from_json.get_related(first['id'], 2)
+        assert first['id'] in from_snapshot._state.index
+        assert 'no.such' not in from_snapshot._state.index
+
+    def test_stale_snapshot_falls_back_to_json(self, registry_copy):
+        compile_snapshot(registry_copy)
+        data = json.loads(registry_copy.read_text())
+        data['glyphs'] = data['glyphs'][:3]
+        registry_copy.write_text(json.dumps(data))
+
+        glyphs = BeaconGlyphs(registry_copy)
+        assert glyphs.snapshot is None
+        assert len(glyphs.registry['glyphs']) == 3
+
+
+class TestBatchResolution:
+    """Test get_many/get_matrix batch lookups."""
+
+    IDS = ['continuity.chain', 'no.such', 'state.verified', 'continuity.chain']
+
+    def test_get_many_matches_get(self, glyphs):
+        for format in ('unicode', 'text', 'emoji', 'svg'):
+            assert glyphs.get_many(self.IDS, format) == [glyphs.get(i, format) for i in self.IDS]
+
+    def test_get_many_default(self, glyphs):
+        result = glyphs.get_many(iter(self.IDS), 'text', default='?')
+        assert result[1] == '?'
+        assert result[0] == glyphs.get('continuity.chain', 'text')
+
+    def test_get_matrix(self, glyphs):
+        rows = glyphs.get_matrix(self.IDS, ['unicode', 'text'], default='')
+        assert len(rows) == len(self.IDS)
+        assert rows[0] == (glyphs.get('continuity.chain'), glyphs.get('continuity.chain', 'text'))
+        assert rows[1] == ('', '')
+
+    def test_get_many_from_snapshot(self, tmp_path, glyphs):
+        path = tmp_path / "registry.json"
+        path.write_text((BASE_PATH / "src" / "glyphs" / "registry.json").read_text())
+        compile_snapshot(path)
+        from_snapshot = BeaconGlyphs(path)
+
+        assert from_snapshot.snapshot is not None
+        assert from_snapshot.get_many(self.IDS) == glyphs.get_many(self.IDS)
+        assert from_snapshot.get_many(self.IDS, default='?')[1] == '?'
+
+
+class TestTextSearch:
+    """Test the BM25 full-text index."""
+
+    def test_name_match_ranks_first(self, glyphs):
+        assert glyphs.search_text('memory')[0]['id'] == 'data.memory'
+
+    def test_prefix_matching(self, glyphs):
+        ids = [g['id'] for g in glyphs.search_text('verif')]
+        assert 'state.verified' in ids
+
+    def test_plural_folding(self, glyphs):
+        assert tokenize('Trust boundaries, Sessions') == ['trust', 'boundary', 'session']
+        assert glyphs.search_text('sessions') == glyphs.search_text('session')
+
+    def test_limit_and_no_match(self, glyphs):
+        assert len(glyphs.search_text('event', limit=2)) == 2
+        assert glyphs.search_text('xyzzy') == []
+
+    def test_persisted_index(self, tmp_path, glyphs):
+        path = tmp_path / "registry.json"
+        path.write_text((BASE_PATH / "src" / "glyphs" / "registry.json").read_text())
+        build_index_file(path)
+
+        loaded = BeaconGlyphs(path)
+        assert loaded.text_index().source_mtime_ns is not None
+        for query in ('memory', 'trust', 'eve', 'session continuity'):
+            assert loaded.search_text(query) == glyphs.search_text(query)
+
+    def test_stale_persisted_index_is_rebuilt(self, tmp_path):
+        path = tmp_path / "registry.json"
+        path.write_text((BASE_PATH / "src" / "glyphs" / "registry.json").read_text())
+        build_index_file(path)
+        data = json.loads(path.read_text())
+        data['glyphs'] = data['glyphs'][:3]
+        path.write_text(json.dumps(data))
+
+        glyphs = BeaconGlyphs(path)
+        assert glyphs.text_index().source_mtime_ns is None
+        assert glyphs.text_index().glyph_count == 3
+
+
+def _node(glyph_id, *related):
+    return {'id': glyph_id, 'metadata': {'relatedGlyphs': list(related)}}
+
+
+class TestGlyphGraph:
+    """Test the relatedGlyphs graph."""
+
+    @pytest.fixture
+    def graph(self):
+        # a -> b -> c -> a is a cycle, d -> a, e is an orphan, f -> f
+        return GlyphGraph([
+            _node('g.a', 'g.b'),
+            _node('g.b', 'g.c', 'g.missing'),
+            _node('g.c', 'g.a'),
+            _node('g.d', 'g.a', 'g.a'),
+            _node('g.e'),
+            _node('g.f', 'g.f'),
+        ])
+
+    def test_neighbors_and_reverse_edges(self, graph):
+        assert graph.neighbors('g.a') == ['g.b']
+        assert graph.neighbors('g.a', 'in') == ['g.c', 'g.d']
+        assert graph.neighbors('g.a', 'both') == ['g.b', 'g.c', 'g.d']
+        assert graph.edge_count == 5
+
+    def test_dangling_references(self, graph):
+        assert graph.dangling == [('g.b', 'g.missing')]
+
+    def test_k_hop(self, graph):
+        assert graph.k_hop('g.d', 1, 'out') == {'g.a': 1}
+        assert graph.k_hop('g.d', 3, 'out') == {'g.a': 1, 'g.b': 2, 'g.c': 3}
+        assert graph.k_hop('g.b', 1) == {'g.a': 1, 'g.c': 1}
+
+    def test_components(self, graph):
+        assert graph.components() == [['g.a', 'g.b', 'g.c', 'g.d'], ['g.e'], ['g.f']]
+        assert graph.component_of('g.c') == ['g.a', 'g.b', 'g.c', 'g.d']
+
+    def test_cycles_and_orphans(self, graph):
+        assert graph.cycles() == [['g.a', 'g.b', 'g.c'], ['g.f']]
+        assert graph.orphans() == ['g.e']
+
+    def test_invalid_queries(self, graph):
+        with pytest.raises(KeyError):
+            graph.neighbors('g.missing')
+        with pytest.raises(ValueError):
+            graph.neighbors('g.a', 'sideways')
+
+    def test_get_related(self, glyphs):
+        related = [g['id'] for g in glyphs.get_related('continuity.chain')]
+        assert related == ['continuity.link', 'continuity.infinity']
+        assert glyphs.get_related('no.such') == []
+        assert glyphs.graph() is glyphs.graph()
+
+
+class TestSvgAssets:
+    """Test the SVG asset cache."""
+
+    SVG = (
+        '<?xml version="1.0"?>\n<!-- Glyph -->\n'
+        '<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 24 24" width="24" height="24" '
+        'stroke="currentColor">\n  <title>Glyph</title>\n  <metadata>editor</metadata>\n'
+        '  <path d="M0 0 L24 24" fill="#000"/>\n</svg>\n'
+    )
+
+    @pytest.fixture
+    def assets_dir(self, tmp_path):
+        for name in ('state-a', 'state-b', 'state-c'):
+            (tmp_path / f"{name}.svg").write_text(self.SVG)
+        return tmp_path
+
+    def test_minify(self):
+        minified = minify_svg(self.SVG)
+        assert minified.startswith('<svg ') and minified.endswith('</svg>')
+        assert '<!--' not in minified and 'metadata' not in minified
+        assert '<title>Glyph</title>' in minified
+        assert '<title>' not in minify_svg(self.SVG, keep_titles=False)
+
+    def test_lookup_by_glyph_id_and_lru(self, assets_dir):
+        assets = SvgAssets(assets_dir, max_entries=2)
+        assert assets.get('state.a') == minify_svg(self.SVG)
+        assets.get('state.b')
+        assets.get('state.a')
+        assets.get('state.c')
+        assert len(assets) == 2
+        assert set(assets._cache) == {'state-a', 'state-c'}
+        assert assets.get('state.missing') is None
+
+    def test_preloaded_assets_do_not_touch_disk(self, assets_dir):
+        assets = SvgAssets(assets_dir)
+        assert assets.preload() == 3
+        for path in assets_dir.glob('*.svg'):
+            path.unlink()
+        assert assets.get('state.b') is not None
+
+    def test_data_uri_and_symbols(self, assets_dir):
+        from urllib.parse import unquote
+
+        assets = SvgAssets(assets_dir)
+        uri = assets.data_uri('state.a')
+        assert uri.startswith('data:image/svg+xml,')
+        assert '#' not in uri and '"' not in uri
+        assert unquote(uri.split(',', 1)[1]) == assets.get('state.a').replace('"', "'")
+
+        symbol = assets.symbol('state.a')
+        assert symbol.startswith('<symbol id="bg-state-a" viewBox="0 0 24 24" stroke="currentColor">')
+        assert 'width=' not in symbol.split('>', 1)[0]
+        assert assets.sprite().count('<symbol ') == 3
+
+    def test_symbol_accepts_single_quotes(self):
+        svg = ("<svg xmlns='http://www.w3.org/2000/svg' viewBox='0 0 24 24' width='24' "
+               "font-family='\"Inter\"'><path d='M0 0'/></svg>")
+        assert svg_to_symbol(svg, 'bg-x') == (
+            '<symbol id="bg-x" viewBox="0 0 24 24" font-family="&quot;Inter&quot;">'
+            "<path d='M0 0'/></symbol>"
+        )
+
+    def test_get_svg(self, glyphs):
+        assert glyphs.get_svg('continuity.chain').startswith('<svg ')
+        assert glyphs.get_svg('continuity.chain', data_uri=True).startswith('data:image/svg+xml,')
+        assert glyphs.get_svg('no.such') is None
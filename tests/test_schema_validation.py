@@ -3,6 +3,7 @@ Tests for BeaconGlyphs schema validation and registry integrity.
 """
 
 import json
+import sys
 import pytest
 from pathlib import Path
 
@@ -11,6 +12,9 @@ from pathlib import Path
 BASE_PATH = Path(__file__).parent.parent
 REGISTRY_PATH = BASE_PATH / "src" / "glyphs" / "registry.json"
 SCHEMA_PATH = BASE_PATH / "src" / "schema" / "glyph_schema.json"
+sys.path.insert(0, str(BASE_PATH / "tooling"))
+
+from schema_compiler import compile_schema  # noqa: E402
 
 
 @pytest.fixture
@@ -33,6 +37,44 @@ def glyphs(registry):
     return registry.get('glyphs', [])
 
 
+class TestCompiledSchema:
+    """Validate every glyph against the compiled JSON schema."""
+
+    def test_glyphs_match_schema(self, glyphs, schema):
+        validate = compile_schema(schema)
+        for glyph in glyphs:
+            assert validate(glyph) == [], \
+                f"Glyph '{glyph.get('id', '?')}' violates schema: {validate(glyph)}"
+
+    def test_compiled_schema_reports_violations(self, schema):
+        validate = compile_schema(schema)
+        violations = validate({
+            'id': 'Bad.ID',
+            'category': 'nowhere',
+            'name': 'x' * 60,
+            'description': 'Long enough description',
+            'representations': {'unicode': '', 'text': 5},
+            'metadata': {'tags': ['ok', 3]},
+        })
+        assert {(path, keyword) for path, keyword, _ in violations} == {
+            ('id', 'pattern'),
+            ('category', 'enum'),
+            ('name', 'maxLength'),
+            ('representations.unicode', 'minLength'),
+            ('representations.text', 'type'),
+            ('metadata.tags[1]', 'type'),
+        }
+
+    @pytest.mark.parametrize("node, keyword", [
+        ({'type': 'string', 'format': 'email'}, 'format'),
+        ({'properties': {'tags': {'type': 'array', 'uniqueItems': True}}}, 'uniqueItems'),
+        ({'type': 'object', 'additionalProperties': {'type': 'string'}}, 'additionalProperties'),
+    ])
+    def test_unsupported_keyword_rejected(self, node, keyword):
+        with pytest.raises(ValueError, match=f"'{keyword}'"):
+            compile_schema(node)
+
+
 class TestRegistryStructure:
     """Test top-level registry structure."""
 
@@ -0,0 +1,210 @@
+"""
+Tests for the persistent session log in
+examples/glyphtrail_integration/session_log.py.
+"""
+
+import sys
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+
+# Determine paths
+BASE_PATH = Path(__file__).parent.parent
+sys.path.insert(0, str(BASE_PATH / "examples" / "glyphtrail_integration"))
+
+import session_log  # noqa: E402
+from session_log import INDEX_ENTRY, INDEX_HEADER, SessionLog, SessionStore  # noqa: E402
+from session_renderer import GlyphtrailSession  # noqa: E402
+
+
+START = 1_700_000_000.0
+
+
+def fill(log, count, step=1.0):
+    """Append `count` events one `step` second apart."""
+    for i in range(count):
+        log.append('state.active' if i % 2 else 'continuity.linked', f"event {i}",
+                   START + i * step, {'n': i} if i % 3 == 0 else None)
+
+
+@pytest.fixture
+def log(tmp_path):
+    log = SessionLog(tmp_path / "s.gtlog", "s-1", "Tester", index_interval=16)
+    yield log
+    log.close()
+
+
+class TestSessionLog:
+    """Test appends, reopening and indexed replay."""
+
+    def test_rows_round_trip(self, log):
+        fill(log, 5)
+        assert list(log.iter_rows()) == [
+            ('continuity.linked', 'event 0', START, {'n': 0}),
+            ('state.active', 'event 1', START + 1, None),
+            ('continuity.linked', 'event 2', START + 2, None),
+            ('state.active', 'event 3', START + 3, {'n': 3}),
+            ('continuity.linked', 'event 4', START + 4, None),
+        ]
+        assert len(log) == 5
+
+    def test_reopen(self, tmp_path):
+        path = tmp_path / "s.gtlog"
+        with SessionLog(path, "s-1", "Tester", index_interval=16) as log:
+            fill(log, 100)
+            expected = list(log.iter_rows())
+
+        with SessionLog(path, index_interval=16) as log:
+            assert (log.session_id, log.agent_name) == ("s-1", "Tester")
+            assert len(log) == 100
+            assert list(log.iter_rows()) == expected
+            log.append('session.stop', 'done', START + 100)
+            assert len(log) == 101
+
+        with SessionLog(path) as log:
+            assert list(log.iter_rows(100)) == [('session.stop', 'done', START + 100, None)]
+
+    def test_wrong_session_id(self, tmp_path):
+        SessionLog(tmp_path / "s.gtlog", "s-1").close()
+        with pytest.raises(ValueError):
+            SessionLog(tmp_path / "s.gtlog", "s-2")
+
+    @pytest.mark.parametrize("start,stop", [(0, 100), (15, 17), (16, 32), (40, 41), (90, None), (99, 200)])
+    def test_iter_rows_slices(self, log, start, stop):
+        fill(log, 100)
+        everything = list(log.iter_rows())
+        assert list(log.iter_rows(start, stop)) == everything[start:stop]
+
+    def test_time_range(self, log):
+        fill(log, 100)
+        rows = list(log.iter_range(START + 20, START + 25))
+        assert [row[1] for row in rows] == [f"event {i}" for i in range(20, 25)]
+        assert list(log.iter_range(datetime.fromtimestamp(START + 98))) == list(log.iter_rows(98))
+
+    def test_time_range_out_of_order(self, log):
+        fill(log, 40)
+        log.append('event.warning', 'late', START - 100)
+        assert [row[1] for row in log.iter_range(until=START)] == ['late']
+
+    def test_time_range_reads_only_matching_blocks(self, log, monkeypatch):
+        fill(log, 160)
+        read = []
+        original = log._iter_blocks
+        monkeypatch.setattr(log, '_iter_blocks', lambda blocks: (read.extend(blocks), original(blocks))[1])
+        assert len(list(log.iter_range(START + 40, START + 50))) == 10
+        assert [block[0] for block in read] == [32, 48]
+
+    def test_types_skip_payload_decoding(self, log, monkeypatch):
+        fill(log, 40)
+        expected = [row[0] for row in log.iter_rows(10, 30)]
+        in_range = [row[0] for row in log.iter_range(START + 5, START + 25)]
+
+        def fail(*args):
+            raise AssertionError("payload decoded")
+        monkeypatch.setattr(session_log, 'decode_records', fail)
+        assert list(log.iter_types(10, 30)) == expected
+        assert list(log.view(START + 5, START + 25).iter_types()) == in_range
+
+    def test_index_written_per_block(self, log):
+        fill(log, 40)
+        log.flush()
+        assert log.index_path.stat().st_size == INDEX_HEADER.size + 2 * INDEX_ENTRY.size
+
+    def test_batched_sync(self, tmp_path):
+        log = SessionLog(tmp_path / "s.gtlog", "s-1", sync_every=10, sync_interval=3600)
+        size = log.path.stat().st_size
+        fill(log, 9)
+        assert log.path.stat().st_size == size
+        fill(log, 1)
+        assert log.path.stat().st_size > size
+        log.close()
+
+    def test_torn_tail_is_truncated(self, tmp_path):
+        path = tmp_path / "s.gtlog"
+        with SessionLog(path, "s-1", index_interval=16) as log:
+            fill(log, 20)
+        with open(path, 'ab') as f:
+            f.write(b'\x01\x02\x03')
+        with SessionLog(path) as log:
+            assert len(log) == 20
+            log.append('session.stop', 'done', START + 20)
+        with SessionLog(path) as log:
+            assert [row[1] for row in log.iter_rows(19)] == ['event 19', 'done']
+
+    def test_corrupt_record_is_truncated(self, tmp_path):
+        path = tmp_path / "s.gtlog"
+        with SessionLog(path, "s-1", index_interval=16) as log:
+            fill(log, 20)
+        data = bytearray(path.read_bytes())
+        data[-3] ^= 0xFF
+        path.write_bytes(bytes(data))
+        with SessionLog(path) as log:
+            assert len(log) == 19
+
+    def test_index_rebuilt_when_missing(self, tmp_path):
+        path = tmp_path / "s.gtlog"
+        with SessionLog(path, "s-1", index_interval=16) as log:
+            fill(log, 50)
+            expected = list(log.iter_rows())
+        log.index_path.unlink()
+        with SessionLog(path, index_interval=16) as log:
+            assert len(log) == 50
+            assert list(log.iter_rows(20, 30)) == expected[20:30]
+        assert log.index_path.stat().st_size == INDEX_HEADER.size + 3 * INDEX_ENTRY.size
+
+
+class TestSessionStore:
+    """Test the directory of session logs."""
+
+    def test_open_and_list(self, tmp_path):
+        store = SessionStore(tmp_path)
+        store.open("b").close()
+        store.open("a", "Alice").close()
+        assert store.session_ids() == ["a", "b"]
+        assert "a" in store and "c" not in store
+
+    @pytest.mark.parametrize("session_id", ["", "../x", "a/b", ".hidden"])
+    def test_rejects_unsafe_ids(self, tmp_path, session_id):
+        with pytest.raises(ValueError):
+            SessionStore(tmp_path).path_for(session_id)
+
+
+class TestReplay:
+    """Test rendering sessions backed by a log."""
+
+    def test_live_session_renders_like_in_memory(self, log):
+        memory = GlyphtrailSession("s-1", "Tester")
+        persisted = GlyphtrailSession.from_log(log)
+        for session in (memory, persisted):
+            session.add_event('session.start', 'Session initiated', timestamp=START)
+            session.add_event('continuity.broken', 'Continuity lost', timestamp=START + 1)
+            session.add_event('data.saved', 'Saved', {'key': 'v'}, timestamp=START + 2)
+
+        assert persisted.render_lineage() == memory.render_lineage()
+        assert persisted.render_timeline() == memory.render_timeline()
+        assert persisted.continuity_health() == memory.continuity_health()
+
+    def test_replay_time_range(self, log):
+        fill(log, 100)
+        replay = GlyphtrailSession.from_log(log, since=START + 10, until=START + 13)
+        lines = replay.render_lineage().splitlines()
+        assert [line.split('] ')[1] for line in lines if '] ' in line] == [
+            "event 10", "event 11", "event 12 (n=12)",
+        ]
+        assert "Total events: 3" in lines
+        assert replay.continuity_health()['links'] == 2
+
+    def test_continuity_counted_after_reopen(self, tmp_path):
+        path = tmp_path / "s.gtlog"
+        with SessionLog(path, "s-1") as log:
+            session = GlyphtrailSession.from_log(log)
+            session.add_event('continuity.broken', 'lost', timestamp=START)
+            session.add_event('continuity.linked', 'back', timestamp=START + 1)
+
+        with SessionLog(path) as log:
+            session = GlyphtrailSession.from_log(log)
+            session.add_event('continuity.linked', 'again', timestamp=START + 2)
+            health = session.continuity_health()
+        assert health == {'events': 3, 'links': 2, 'breaks': 1, 'last_break': 0, 'healthy': False}
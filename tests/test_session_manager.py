@@ -0,0 +1,193 @@
+"""
+Tests for the thread-safe session manager in
+examples/glyphtrail_integration/session_manager.py.
+"""
+
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+
+
+# Determine paths
+BASE_PATH = Path(__file__).parent.parent
+sys.path.insert(0, str(BASE_PATH / "examples" / "glyphtrail_integration"))
+
+from session_log import SessionLog  # noqa: E402
+from session_manager import SessionManager  # noqa: E402
+from session_renderer import GlyphtrailSession  # noqa: E402
+
+
+START = 1_700_000_000.0
+
+
+def add_events(manager, session_id, count, offset=0):
+    for i in range(offset, offset + count):
+        event_type = 'continuity.broken' if i % 10 == 9 else 'state.active'
+        manager.add_event(session_id, event_type, f"event {i}", timestamp=START + i)
+
+
+def stored_messages(path):
+    with SessionLog(path) as log:
+        return [row[1] for row in log.iter_rows()]
+
+
+class TestSessionManager:
+    """Test the session registry, eviction and concurrency."""
+
+    def test_add_and_render(self, tmp_path):
+        manager = SessionManager(tmp_path, stripes=4)
+        add_events(manager, "s-1", 20)
+        manager.add_event("s-2", "state.active", "hello", agent_name="Alice")
+
+        expected = GlyphtrailSession("s-1")
+        for i in range(20):
+            expected.add_event('continuity.broken' if i % 10 == 9 else 'state.active',
+                               f"event {i}", timestamp=START + i)
+        assert manager.render_lineage("s-1") == expected.render_lineage()
+        assert manager.render_timeline("s-1") == expected.render_timeline()
+        assert manager.continuity_health("s-1")['breaks'] == 2
+        assert "Alice" in manager.render_lineage("s-2")
+        with pytest.raises(KeyError):
+            manager.render_lineage("missing")
+        assert manager.stats()['sessions'] == 2
+
+    def test_session_limit_evicts_least_recently_used(self, tmp_path):
+        manager = SessionManager(tmp_path, stripes=1, max_sessions=2)
+        add_events(manager, "a", 3)
+        add_events(manager, "b", 3)
+        manager.render_timeline("a")
+        add_events(manager, "c", 3)
+
+        # "b" was the least recently used, so it went to the store
+        assert len(manager) == 2
+        assert stored_messages(tmp_path / "b.gtlog") == ["event 0", "event 1", "event 2"]
+        assert not (tmp_path / "a.gtlog").exists()
+
+        # Touching "b" again loads it back and evicts "a"
+        add_events(manager, "b", 2, offset=3)
+        assert "Total events: 5" in manager.render_lineage("b")
+        assert manager.continuity_health("b")['events'] == 0
+        stats = manager.stats()
+        assert (stats['loads'], stats['evictions']) == (4, 2)
+
+    def test_event_limit_bounds_memory(self, tmp_path):
+        manager = SessionManager(tmp_path, stripes=2, max_events=40)
+        for n in range(10):
+            add_events(manager, f"s-{n}", 10)
+            stats = manager.stats()
+            assert stats['events'] <= 40
+            assert stats['evictions'] == n + 1 - stats['sessions']
+
+        manager.close()
+        assert manager.stats()['sessions'] == manager.stats()['events'] == 0
+        for n in range(10):
+            assert len(stored_messages(tmp_path / f"s-{n}.gtlog")) == 10
+
+    def test_flush_appends_only_new_events(self, tmp_path):
+        manager = SessionManager(tmp_path)
+        add_events(manager, "s", 5)
+        manager.flush()
+        add_events(manager, "s", 5, offset=5)
+        manager.flush()
+        assert stored_messages(tmp_path / "s.gtlog") == [f"event {i}" for i in range(10)]
+
+    def test_reloaded_session_is_not_replayed(self, tmp_path):
+        manager = SessionManager(tmp_path, stripes=1, max_sessions=1)
+        add_events(manager, "big", 100)
+        add_events(manager, "other", 1)
+        assert manager.stats()['events'] == 1
+
+        # Loading "big" back holds only its new events in memory
+        add_events(manager, "big", 1, offset=100)
+        assert manager.stats()['events'] == 1
+        assert "Total events: 101" in manager.render_lineage("big")
+        assert manager.continuity_health("big")['breaks'] == 10
+        manager.flush()
+        assert manager.stats()['events'] == 0
+        assert stored_messages(tmp_path / "big.gtlog") == [f"event {i}" for i in range(101)]
+
+    def test_sessions_in_use_are_not_evicted(self, tmp_path):
+        manager = SessionManager(tmp_path, stripes=1, max_sessions=1)
+        with manager.use("held") as session:
+            session.add_event("state.active", "inside")
+            add_events(manager, "other", 1)
+            add_events(manager, "third", 1)
+            assert "held" in manager._stripes[0].entries
+        assert "Total events: 1" in manager.render_lineage("held")
+
+    def test_concurrent_threads(self, tmp_path):
+        manager = SessionManager(tmp_path, stripes=8, max_sessions=16, max_events=400)
+        errors = []
+
+        def worker(n):
+            try:
+                for round_ in range(5):
+                    for s in range(8):
+                        add_events(manager, f"s-{s}", 10, offset=(n * 5 + round_) * 10)
+                        manager.render_timeline(f"s-{s}")
+            except Exception as e:  # pragma: no cover - reported below
+                errors.append(e)
+
+        threads = [threading.Thread(target=worker, args=(n,)) for n in range(6)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert not errors
+
+        manager.close()
+        for s in range(8):
+            messages = stored_messages(tmp_path / f"s-{s}.gtlog")
+            assert sorted(messages, key=lambda m: int(m.split()[1])) == \
+                [f"event {i}" for i in range(300)]
+
+    def test_lock_released_when_eviction_fails(self, tmp_path, monkeypatch):
+        manager = SessionManager(tmp_path, stripes=1, max_events=2)
+        add_events(manager, "old", 1)
+        add_events(manager, "busy", 1)
+
+        def fail(*args, **kwargs):
+            raise OSError("store unavailable")
+        monkeypatch.setattr(manager.store, 'open', fail)
+        # Going over the event limit evicts "old", which cannot be persisted
+        with pytest.raises(OSError):
+            add_events(manager, "busy", 1, offset=1)
+        assert not manager._stripes[0].entries["busy"].lock.locked()
+
+        monkeypatch.undo()
+        add_events(manager, "busy", 1, offset=2)
+        manager.close()
+        assert stored_messages(tmp_path / "busy.gtlog") == ["event 0", "event 1", "event 2"]
+        assert stored_messages(tmp_path / "old.gtlog") == ["event 0"]
+
+    def test_close_waits_for_users_and_marks_entries_evicted(self, tmp_path):
+        manager = SessionManager(tmp_path, stripes=2)
+        add_events(manager, "s", 1)
+        entry = manager._stripe("s").entries["s"]
+        inside, release = threading.Event(), threading.Event()
+
+        def user():
+            with manager.use("s") as session:
+                inside.set()
+                release.wait(5)
+                session.add_event("state.active", "event 1", timestamp=START + 1)
+
+        thread = threading.Thread(target=user)
+        thread.start()
+        inside.wait(5)
+        closer = threading.Thread(target=manager.close)
+        closer.start()
+        closer.join(0.1)
+        assert closer.is_alive()
+        release.set()
+        thread.join()
+        closer.join(5)
+
+        assert entry.evicted
+        assert len(manager) == 0 and manager.stats()['events'] == 0
+        assert stored_messages(tmp_path / "s.gtlog") == ["event 0", "event 1"]
+        # The session is loaded again on next use
+        add_events(manager, "s", 1, offset=2)
+        assert "Total events: 3" in manager.render_lineage("s")
@@ -0,0 +1,175 @@
+"""
+Tests for the Glyphtrail integration example in
+examples/glyphtrail_integration/session_renderer.py.
+"""
+
+import io
+import json
+import os
+import sys
+import pytest
+from pathlib import Path
+
+
+# Determine paths
+BASE_PATH = Path(__file__).parent.parent
+sys.path.insert(0, str(BASE_PATH / "examples" / "glyphtrail_integration"))
+
+from session_renderer import BeaconGlyphsLoader, GlyphtrailSession  # noqa: E402
+
+
+@pytest.fixture
+def session():
+    """Build a small session covering mapped and unmapped event types."""
+    session = GlyphtrailSession("session-test", "Tester")
+    session.add_event('session.start', 'Session initiated')
+    session.add_event('identity.loaded', 'Agent DNA loaded', {'agent_id': 'tester-001'})
+    session.add_event('continuity.linked', 'Linked to previous session')
+    session.add_event('continuity.broken', 'Continuity lost')
+    session.add_event('unknown.type', 'Unmapped event')
+    session.add_event('session.stop', 'Session ended')
+    return session
+
+
+class TestRendering:
+    """Test lineage and timeline rendering."""
+
+    def test_lineage_lists_every_event(self, session):
+        lineage = session.render_lineage()
+        assert "Session: session-test" in lineage
+        assert "Agent: Tester" in lineage
+        assert "(agent_id=tester-001)" in lineage
+        assert "Total events: 6" in lineage
+
+    def test_timeline_uses_fallback_glyph(self, session):
+        timeline = session.render_timeline('text').split(' ')
+        assert len(timeline) == 6
+        assert timeline[0] == '[START]'
+        assert timeline[4] == '[FLAG]'
+
+    @pytest.mark.parametrize('chunk', [1, 2, 1024])
+    def test_write_lineage_matches_render(self, session, chunk):
+        stream = io.StringIO()
+        lines = session.write_lineage(stream, chunk_lines=chunk)
+        assert stream.getvalue() == session.render_lineage()
+        assert lines == len(session.render_lineage().split('\n'))
+
+    @pytest.mark.parametrize('chunk', [1, 4, 4096])
+    def test_write_timeline_matches_render(self, session, chunk):
+        stream = io.StringIO()
+        session.write_timeline(stream, 'text', chunk_glyphs=chunk)
+        assert stream.getvalue() == session.render_timeline('text')
+
+    def test_iter_lineage_is_lazy(self, session):
+        lines = session.iter_lineage()
+        assert next(lines) == "=" * 70
+
+
+class TestEventStore:
+    """Test the columnar event storage behind GlyphtrailSession."""
+
+    def test_events_round_trip(self, session):
+        assert len(session.events) == 6
+        event = session.events[1]
+        assert event.event_type == 'identity.loaded'
+        assert event.message == 'Agent DNA loaded'
+        assert event.metadata == {'agent_id': 'tester-001'}
+        assert session.events[-1].event_type == 'session.stop'
+
+    def test_empty_metadata_is_sparse(self, session):
+        assert session.events[0].metadata == {}
+        assert len(session.events._metadata) == 1
+
+    def test_event_types_are_interned(self, session):
+        session.add_event('session.start', 'Again')
+        assert session.events.event_types().count('session.start') == 1
+
+    def test_explicit_timestamp(self):
+        from datetime import datetime
+
+        session = GlyphtrailSession("session-ts")
+        when = datetime(2025, 11, 13, 10, 0, 1)
+        session.add_event('session.start', 'Started', timestamp=when)
+        assert session.events[0].timestamp == when
+        assert "[10:00:01] Started" in session.render_lineage()
+
+    def test_rejected_append_leaves_columns_aligned(self, session):
+        events = session.events
+        with pytest.raises(ValueError):
+            events.append('continuity.broken', 'Bad timestamp', timestamp='2025-01-01')
+        assert len(events._types) == len(events._timestamps) == len(events) == 6
+
+
+class TestResolvedGlyphTable:
+    """Test the precomputed event type -> glyph tables."""
+
+    GLYPH_MAP = {'session.start': 'events.start', 'missing': 'no.such'}
+
+    @pytest.fixture
+    def registry_copy(self, tmp_path):
+        path = tmp_path / "registry.json"
+        path.write_text((BASE_PATH / "src" / "glyphs" / "registry.json").read_text())
+        return path
+
+    def test_table_matches_get(self):
+        loader = BeaconGlyphsLoader()
+        table, fallback = loader.resolve_map(self.GLYPH_MAP, 'text')
+        assert table == {'session.start': '[START]', 'missing': '?'}
+        assert fallback == '[FLAG]'
+
+    def test_table_is_cached_per_format(self):
+        loader = BeaconGlyphsLoader()
+        assert loader.resolve_map(self.GLYPH_MAP) is loader.resolve_map(self.GLYPH_MAP)
+        assert loader.resolve_map(self.GLYPH_MAP, 'text') is not loader.resolve_map(self.GLYPH_MAP)
+
+    def test_table_keyed_by_contents(self):
+        loader = BeaconGlyphsLoader()
+        glyph_map = dict(self.GLYPH_MAP)
+        assert loader.resolve_map(glyph_map) is loader.resolve_map(self.GLYPH_MAP)
+        glyph_map['missing'] = 'events.start'
+        assert loader.resolve_map(glyph_map, 'text')[0]['missing'] == '[START]'
+
+    def test_table_rebuilt_after_reload(self, registry_copy):
+        loader = BeaconGlyphsLoader(registry_copy)
+        assert loader.resolve_map(self.GLYPH_MAP)[0]['session.start'] != '#'
+
+        data = json.loads(registry_copy.read_text())
+        for glyph in data['glyphs']:
+            if glyph['id'] == 'events.start':
+                glyph['representations']['unicode'] = '#'
+        registry_copy.write_text(json.dumps(data))
+        stat = os.stat(registry_copy)
+        os.utime(registry_copy, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+        BeaconGlyphsLoader(registry_copy)
+        assert loader.resolve_map(self.GLYPH_MAP)[0]['session.start'] == '#'
+
+
+class TestContinuityHealth:
+    """Test the incrementally maintained continuity counters."""
+
+    def test_no_continuity_events(self):
+        session = GlyphtrailSession("session-empty")
+        session.add_event('session.start', 'Session initiated')
+        assert session.render_continuity_summary() == "No continuity events recorded"
+        assert session.continuity_health()['events'] == 0
+
+    def test_counts_links_and_breaks(self, session):
+        session.add_event('continuity.established', 'Chain established')
+        session.add_event('continuity.infinite', 'Archive access')
+
+        health = session.continuity_health()
+        assert health == {
+            'events': 4,
+            'links': 2,
+            'breaks': 1,
+            'last_break': 3,
+            'healthy': False,
+        }
+        assert "Degraded (2 links, 1 breaks)" in session.render_continuity_summary()
+
+    def test_rejected_event_is_not_counted(self, session):
+        before = session.continuity_health()
+        with pytest.raises(ValueError):
+            session.add_event('continuity.broken', 'Bad timestamp', timestamp='2025-01-01')
+        assert session.continuity_health() == before
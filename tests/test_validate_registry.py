@@ -0,0 +1,386 @@
+"""
+Tests for the registry validator in tooling/validate_registry.py.
+"""
+
+import json
+import sys
+import pytest
+from pathlib import Path
+
+
+# Determine paths
+BASE_PATH = Path(__file__).parent.parent
+REGISTRY_PATH = BASE_PATH / "src" / "glyphs" / "registry.json"
+SCHEMA_PATH = BASE_PATH / "src" / "schema" / "glyph_schema.json"
+sys.path.insert(0, str(BASE_PATH / "tooling"))
+
+from validate_registry import RegistryValidator, main, validate_many  # noqa: E402
+
+
+@pytest.fixture
+def registry():
+    """Load a fresh copy of the glyph registry."""
+    with open(REGISTRY_PATH, 'r') as f:
+        return json.load(f)
+
+
+@pytest.fixture
+def write_registry(tmp_path):
+    """Write a registry dict to a temporary file."""
+    def write(data, name="registry.json"):
+        path = tmp_path / name
+        path.write_text(json.dumps(data))
+        return path
+    return write
+
+
+class TestValidator:
+    """Test the single-pass validation engine."""
+
+    def test_shipped_registry_is_valid(self):
+        validator = RegistryValidator(REGISTRY_PATH, SCHEMA_PATH)
+        assert validator.validate(report=False)
+        assert validator.errors == []
+        assert validator.warnings == []
+
+    def test_findings_reported_in_check_order(self, registry, write_registry):
+        glyphs = registry['glyphs']
+        duplicate = json.loads(json.dumps(glyphs[0]))
+        duplicate['representations'].update(unicode='#', text='[DUP]')
+        glyphs.append(duplicate)
+        glyphs[0]['metadata']['relatedGlyphs'].append('continuity.missing')
+        glyphs[2]['category'] = 'identity'
+        glyphs[3]['representations']['text'] = glyphs[4]['representations']['text']
+
+        validator = RegistryValidator(write_registry(registry), SCHEMA_PATH)
+        assert not validator.validate(report=False)
+
+        assert validator.errors == [
+            f"Duplicate glyph ID: {glyphs[0]['id']}",
+            f"Glyph '{glyphs[2]['id']}' category mismatch: "
+            f"category='identity' but ID starts with 'continuity'",
+            f"Duplicate text representation '{glyphs[4]['representations']['text']}': "
+            f"used by '{glyphs[4]['id']}' and '{glyphs[3]['id']}'",
+            f"Glyph '{glyphs[0]['id']}' references non-existent "
+            f"related glyph: continuity.missing",
+        ]
+
+    def test_missing_schema_enum_warns(self, registry, write_registry, tmp_path):
+        schema_path = tmp_path / "schema.json"
+        schema_path.write_text(json.dumps({'properties': {}}))
+
+        validator = RegistryValidator(write_registry(registry), schema_path)
+        assert validator.validate(report=False)
+        assert validator.warnings == ["No category enum found in schema"]
+
+
+class TestValidateMany:
+    """Test multi-registry validation."""
+
+    def test_results_in_input_order(self, registry, write_registry, tmp_path):
+        good = write_registry(registry, "good.json")
+        broken = tmp_path / "broken.json"
+        broken.write_text("not json")
+
+        results = validate_many([str(good), str(broken), str(good)], SCHEMA_PATH, jobs=2)
+
+        assert [r['registry'] for r in results] == [str(good), str(broken), str(good)]
+        assert results[0]['errors'] == []
+        assert results[0]['glyphs'] == len(registry['glyphs'])
+        assert results[1]['errors'][0].startswith("Could not load registry")
+
+
+    def test_max_findings_caps_the_total(self, write_registry, monkeypatch, capsys):
+        first = write_registry({'glyphs': []}, "first.json")
+        second = write_registry({'glyphs': [{'id': 'Bad'}, {'id': 'Worse'}]}, "second.json")
+        monkeypatch.setattr(sys, 'argv', [
+            'validate_registry.py', str(first), str(second),
+            '--format', 'jsonl', '--max-findings', '5', '-j', '1',
+        ])
+        assert main() == 1
+
+        lines = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+        assert [line['type'] for line in lines] == ['finding'] * 5 + ['summary']
+        assert {line['registry'] for line in lines[:5]} == {str(first), str(second)}
+        assert lines[-1]['errors'] + lines[-1]['warnings'] == 5
+        assert lines[-1]['stopped_early']
+
+
+class TestStreamingFindings:
+    """Test streamed findings and early stopping."""
+
+    @pytest.fixture
+    def bad_registry(self, write_registry):
+        return write_registry({'glyphs': [{'id': 'Bad'}, {'id': 'Worse'}]})
+
+    def test_on_finding_streams_structured_findings(self, bad_registry):
+        findings = []
+        validator = RegistryValidator(bad_registry, SCHEMA_PATH, on_finding=findings.append)
+        assert not validator.validate(report=False)
+
+        assert validator.errors == []
+        assert len(findings) == validator.error_count + validator.warning_count
+        assert findings[0] == {
+            'registry': str(bad_registry),
+            'check': 'registry_structure',
+            'severity': 'error',
+            'glyph_id': None,
+            'message': "Missing required field: version",
+        }
+        assert {f['glyph_id'] for f in findings} >= {'Bad', 'Worse'}
+
+    def test_fail_fast_stops_at_first_error(self, bad_registry):
+        validator = RegistryValidator(bad_registry, SCHEMA_PATH, fail_fast=True)
+        assert not validator.validate(report=False)
+        assert validator.error_count == 1
+        assert validator.stopped_early
+
+    def test_max_findings_caps_output(self, bad_registry):
+        findings = []
+        validator = RegistryValidator(
+            bad_registry, SCHEMA_PATH, on_finding=findings.append, max_findings=4
+        )
+        validator.validate(report=False)
+        assert len(findings) == 4
+        assert validator.stopped_early
+
+    def test_valid_registry_not_stopped(self):
+        validator = RegistryValidator(REGISTRY_PATH, SCHEMA_PATH, fail_fast=True)
+        assert validator.validate(report=False)
+        assert not validator.stopped_early
+
+
+class TestIncremental:
+    """Test incremental validation against cached results."""
+
+    def test_unchanged_registry_replays_findings(self, registry, write_registry, tmp_path):
+        registry['glyphs'][0]['representations']['text'] = '[lower]'
+        path = write_registry(registry)
+        cache_path = tmp_path / "cache"
+
+        first = RegistryValidator(path, SCHEMA_PATH, cache_path=cache_path)
+        first.validate(report=False)
+        assert not first.from_cache
+        assert cache_path.exists()
+
+        second = RegistryValidator(path, SCHEMA_PATH, cache_path=cache_path)
+        second.validate(report=False)
+        assert second.from_cache
+        assert second.warnings == first.warnings
+        assert second.glyph_count == first.glyph_count
+
+    def test_changed_registry_is_revalidated(self, registry, write_registry, tmp_path):
+        path = write_registry(registry)
+        cache_path = tmp_path / "cache"
+        RegistryValidator(path, SCHEMA_PATH, cache_path=cache_path).validate(report=False)
+
+        registry['glyphs'][1]['id'] = registry['glyphs'][0]['id']
+        write_registry(registry)
+
+        validator = RegistryValidator(path, SCHEMA_PATH, cache_path=cache_path)
+        assert not validator.validate(report=False)
+        assert not validator.from_cache
+        assert f"Duplicate glyph ID: {registry['glyphs'][0]['id']}" in validator.errors
+
+    def test_only_changed_glyphs_are_rechecked(self, registry, write_registry, tmp_path):
+        glyphs = registry['glyphs']
+        glyphs[0]['representations']['text'] = '[lower]'
+        path = write_registry(registry)
+        cache_path = tmp_path / "cache"
+        first = RegistryValidator(path, SCHEMA_PATH, cache_path=cache_path)
+        first.validate(report=False)
+        assert first.revalidated == len(glyphs)
+
+        glyphs[1]['name'] = 'ab'
+        glyphs[2]['representations']['text'] = glyphs[3]['representations']['text']
+        glyphs[4]['metadata']['relatedGlyphs'] = ['nowhere.glyph']
+        write_registry(registry)
+
+        streamed = []
+        incremental = RegistryValidator(path, SCHEMA_PATH, cache_path=cache_path,
+                                        on_finding=streamed.append)
+        incremental.validate(report=False)
+        assert not incremental.from_cache
+        assert incremental.revalidated == 3
+
+        full_streamed = []
+        RegistryValidator(path, SCHEMA_PATH, on_finding=full_streamed.append).validate(report=False)
+        assert streamed == full_streamed
+
+        incremental = RegistryValidator(path, SCHEMA_PATH, cache_path=tmp_path / "cache")
+        full = RegistryValidator(path, SCHEMA_PATH)
+        incremental.validate(report=False)
+        full.validate(report=False)
+        assert incremental.from_cache
+        assert (incremental.errors, incremental.warnings) == (full.errors, full.warnings)
+
+    def test_schema_change_rechecks_every_glyph(self, registry, write_registry, tmp_path):
+        path = write_registry(registry)
+        cache_path = tmp_path / "cache"
+        RegistryValidator(path, SCHEMA_PATH, cache_path=cache_path).validate(report=False)
+
+        schema = json.loads(SCHEMA_PATH.read_text())
+        schema['properties']['name']['minLength'] = 50
+        schema_path = tmp_path / "schema.json"
+        schema_path.write_text(json.dumps(schema))
+
+        validator = RegistryValidator(path, schema_path, cache_path=cache_path)
+        assert not validator.validate(report=False)
+        assert validator.revalidated == len(registry['glyphs'])
+
+
+class TestSchemaCheck:
+    """Test the compiled-schema check."""
+
+    def test_reports_schema_only_violations(self, registry, write_registry):
+        registry['glyphs'][0]['name'] = 'ab'
+        registry['glyphs'][1]['metadata']['useCases'].append('nowhere')
+
+        validator = RegistryValidator(write_registry(registry), SCHEMA_PATH)
+        assert not validator.validate(report=False)
+        assert validator.errors == [
+            f"Glyph '{registry['glyphs'][0]['id']}' schema violation: "
+            f"name is shorter than 3 characters",
+            f"Glyph '{registry['glyphs'][1]['id']}' schema violation: "
+            f"metadata.useCases[{len(registry['glyphs'][1]['metadata']['useCases']) - 1}] "
+            f"must be one of: glyphtrail, lingos, active_mirror_os, mirrordna_protocol, ui, logs, api",
+        ]
+
+    def test_does_not_duplicate_hand_written_checks(self, registry, write_registry):
+        del registry['glyphs'][0]['description']
+        del registry['glyphs'][1]['representations']['text']
+
+        validator = RegistryValidator(write_registry(registry), SCHEMA_PATH)
+        validator.validate(report=False)
+        assert not any('schema violation' in error for error in validator.errors)
+
+    def test_bad_id_reported_once(self, registry, write_registry):
+        category = registry['glyphs'][0]['category']
+        for glyph, glyph_id in zip(registry['glyphs'], [
+            f"{category}.Upper", f"{category}_nodot", f"{category}.digit2", f"{category}.a.b",
+        ]):
+            glyph['id'] = glyph_id
+
+        validator = RegistryValidator(write_registry(registry), SCHEMA_PATH)
+        validator.validate(report=False)
+        for glyph in registry['glyphs'][:4]:
+            reported = [
+                error for error in validator.errors
+                if f"ID '{glyph['id']}'" in error or f"'{glyph['id']}' schema violation" in error
+            ]
+            assert len(reported) == 1, reported
+
+
+GOOD_SVG = (
+    '<?xml version="1.0" encoding="UTF-8"?>\n'
+    '<svg xmlns="http://www.w3.org/2000/svg" width="24" height="24" viewBox="0 0 24 24"\n'
+    '     fill="none" stroke="currentColor" stroke-width="2">\n'
+    '  <title>Test</title>\n'
+    '  <desc>A test glyph</desc>\n'
+    '  <circle cx="12" cy="12" r="8"/>\n'
+    '</svg>\n'
+)
+
+
+class TestSvgLint:
+    """Test the SVG asset lint stage."""
+
+    def lint(self, tmp_path, svgs, **options):
+        assets_dir = tmp_path / "svg"
+        assets_dir.mkdir()
+        for name, svg in svgs.items():
+            (assets_dir / name).write_text(svg)
+        validator = RegistryValidator(REGISTRY_PATH, SCHEMA_PATH, assets_dir=assets_dir,
+                                      jobs=1, **options)
+        return validator, validator.validate(report=False)
+
+    def test_shipped_assets_have_no_errors(self):
+        validator = RegistryValidator(REGISTRY_PATH, SCHEMA_PATH,
+                                      assets_dir=BASE_PATH / "assets" / "svg")
+        assert validator.validate(report=False)
+        assert len(validator.svg_results) == len(list((BASE_PATH / "assets" / "svg").glob('*.svg')))
+
+    def test_clean_svg_passes(self, tmp_path):
+        validator, valid = self.lint(tmp_path, {'good.svg': GOOD_SVG})
+        assert valid
+        assert validator.warnings == []
+
+    def test_errors(self, tmp_path):
+        validator, valid = self.lint(tmp_path, {
+            'no-viewbox.svg': GOOD_SVG.replace(' viewBox="0 0 24 24"', ''),
+            'no-ns.svg': GOOD_SVG.replace(' xmlns="http://www.w3.org/2000/svg"', ''),
+            'raster.svg': GOOD_SVG.replace(
+                '<circle', '<image href="data:image/png;base64,AAAA"/><circle'),
+            'script.svg': GOOD_SVG.replace('<circle', '<script>alert(1)</script><circle'),
+            'handler.svg': GOOD_SVG.replace('<circle', '<circle onclick="x()"'),
+            'broken.svg': '<svg',
+        })
+        assert not valid
+        assert validator.errors == [
+            "broken.svg: not well-formed: unclosed token: line 1, column 0",
+            "handler.svg: event handler attribute 'onclick' on <circle>",
+            "no-ns.svg: root element must be <svg> in the http://www.w3.org/2000/svg namespace",
+            "no-viewbox.svg: missing viewBox",
+            "raster.svg: embedded raster <image> element",
+            "raster.svg: raster image reference on <image>",
+            "script.svg: <script> is not allowed",
+        ]
+
+    def test_size_budget(self, tmp_path):
+        validator, valid = self.lint(tmp_path, {'good.svg': GOOD_SVG}, svg_budget=100)
+        assert not valid
+        assert validator.errors == [
+            f"good.svg: {len(GOOD_SVG)} bytes exceeds the 100 byte budget",
+        ]
+
+    def test_warnings(self, tmp_path):
+        svg = (GOOD_SVG.replace('stroke-width="2"', 'stroke-width="3" style="opacity:1"')
+               .replace('viewBox="0 0 24 24"', 'viewBox="0 0 24 20"')
+               .replace('  <desc>A test glyph</desc>\n', '')
+               .replace('stroke="currentColor"', 'stroke="#ff0000"')
+               .replace('r="8"', 'r="8.12345"'))
+        validator, valid = self.lint(tmp_path, {'warn.svg': svg})
+        assert valid
+        assert validator.warnings == [
+            "warn.svg: viewBox '0 0 24 20' is not square",
+            "warn.svg: missing <desc>",
+            "warn.svg: inline style attributes (use presentation attributes and currentColor)",
+            "warn.svg: hardcoded colors #ff0000 (use currentColor)",
+            "warn.svg: non-standard stroke-width 3 (expected 1, 2, 2.5)",
+            "warn.svg: coordinates with more than 2 decimal places",
+        ]
+
+    def test_reports_size_and_savings(self, tmp_path):
+        svg = GOOD_SVG.replace('r="8"', 'r="8.123456"')
+        validator, _ = self.lint(tmp_path, {'a.svg': svg})
+        [result] = validator.svg_results
+        assert result['file'] == 'a.svg'
+        assert result['size'] == len(svg)
+        assert 0 < result['optimized_size'] < result['size']
+
+    def test_parallel_matches_serial(self, tmp_path):
+        assets_dir = BASE_PATH / "assets" / "svg"
+        serial = RegistryValidator(REGISTRY_PATH, SCHEMA_PATH, assets_dir=assets_dir, jobs=1)
+        parallel = RegistryValidator(REGISTRY_PATH, SCHEMA_PATH, assets_dir=assets_dir, jobs=2)
+        serial.validate(report=False)
+        parallel.validate(report=False)
+        assert parallel.svg_results == serial.svg_results
+        assert parallel.warnings == serial.warnings
+
+    def test_incremental_revalidates_changed_assets(self, tmp_path):
+        cache_path = tmp_path / "cache"
+        _, valid = self.lint(tmp_path, {'good.svg': GOOD_SVG}, cache_path=cache_path)
+        assert valid
+
+        cached = RegistryValidator(REGISTRY_PATH, SCHEMA_PATH, assets_dir=tmp_path / "svg",
+                                   cache_path=cache_path, jobs=1)
+        assert cached.validate(report=False)
+        assert cached.from_cache
+        assert cached.svg_results[0]['file'] == 'good.svg'
+
+        (tmp_path / "svg" / "good.svg").write_text(GOOD_SVG.replace(' viewBox="0 0 24 24"', ''))
+        changed = RegistryValidator(REGISTRY_PATH, SCHEMA_PATH, assets_dir=tmp_path / "svg",
+                                    cache_path=cache_path, jobs=1)
+        assert not changed.validate(report=False)
+        assert not changed.from_cache
+        assert changed.errors == ["good.svg: missing viewBox"]
@@ -0,0 +1,209 @@
+#!/usr/bin/env python3
+"""
+BeaconGlyphs SVG Sprite Builder
+
+Combines every SVG in assets/svg/ into one <symbol>-based sprite sheet
+plus a JSON manifest, so clients make one request instead of one per
+glyph:
+
+    <svg><use href="beaconglyphs.svg#bg-continuity-chain"/></svg>
+
+The manifest maps each glyph ID (or asset stem, for brand artwork that
+is not in the registry) to its symbol ID, source file and content hash.
+
+Rebuilds are incremental: a build cache next to the output remembers
+each asset's mtime, size, hash and converted <symbol>, so only new or
+changed files are read and converted, and the sprite is not rewritten
+when nothing changed.
+
+Usage:
+    python tooling/build_sprite.py [--assets assets/svg] [-o dist/sprite]
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import sys
+from pathlib import Path
+from typing import Any, Dict, Tuple
+
+
+BASE_PATH = Path(__file__).parent.parent
+sys.path.insert(0, str(BASE_PATH / "examples"))
+
+from svg_assets import (  # noqa: E402
+    SYMBOL_PREFIX,
+    asset_name,
+    build_sprite,
+    minify_svg,
+    svg_to_symbol,
+)
+
+
+DEFAULT_ASSETS_DIR = BASE_PATH / "assets" / "svg"
+DEFAULT_OUTPUT_DIR = BASE_PATH / "dist" / "sprite"
+DEFAULT_REGISTRY_PATH = BASE_PATH / "src" / "glyphs" / "registry.json"
+
+SPRITE_NAME = 'beaconglyphs.svg'
+MANIFEST_NAME = 'beaconglyphs.json'
+CACHE_NAME = '.sprite-cache.json'
+
+# Bump when symbol conversion changes so cached symbols are rebuilt
+CACHE_VERSION = 1
+
+
+def _digest(data: bytes) -> str:
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+def _write_atomic(path: Path, text: str):
+    tmp_path = path.with_name(path.name + '.tmp')
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        f.write(text)
+    os.replace(tmp_path, path)
+
+
+class SpriteBuilder:
+    """Builds the sprite sheet and manifest, reusing unchanged symbols."""
+
+    def __init__(self, assets_dir: Path = DEFAULT_ASSETS_DIR,
+                 output_dir: Path = DEFAULT_OUTPUT_DIR,
+                 registry_path: Path = DEFAULT_REGISTRY_PATH):
+        self.assets_dir = Path(assets_dir)
+        self.output_dir = Path(output_dir)
+        self.registry_path = Path(registry_path)
+        self.cache_path = self.output_dir / CACHE_NAME
+        self.stats = {'reused': 0, 'converted': 0, 'removed': 0}
+
+    def _glyph_ids(self) -> Dict[str, str]:
+        """Map asset stems to registry glyph IDs."""
+        try:
+            with open(self.registry_path, 'r') as f:
+                glyphs = json.load(f).get('glyphs', [])
+        except (OSError, ValueError):
+            return {}
+        return {asset_name(g['id']): g['id'] for g in glyphs if 'id' in g}
+
+    def _load_cache(self) -> Dict[str, Any]:
+        try:
+            with open(self.cache_path, 'r') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(data, dict) or data.get('version') != CACHE_VERSION:
+            return {}
+        return data.get('assets', {})
+
+    def _symbol(self, path: Path, cached: Dict[str, Any]) -> Tuple[Dict[str, Any], bool]:
+        """
+        Get the cache entry for one asset.
+
+        Returns:
+            (entry, converted) where converted is False if the cached
+            symbol was reused
+        """
+        stat = path.stat()
+        if cached and cached['mtime_ns'] == stat.st_mtime_ns and cached['size'] == stat.st_size:
+            return cached, False
+
+        data = path.read_bytes()
+        digest = _digest(data)
+        if cached and cached['hash'] == digest:
+            # Touched but not modified
+            return dict(cached, mtime_ns=stat.st_mtime_ns, size=stat.st_size), False
+
+        symbol_id = SYMBOL_PREFIX + path.stem
+        symbol = svg_to_symbol(minify_svg(data.decode('utf-8')), symbol_id)
+        return {
+            'mtime_ns': stat.st_mtime_ns,
+            'size': stat.st_size,
+            'hash': digest,
+            'symbol_id': symbol_id,
+            'symbol': symbol,
+        }, True
+
+    def build(self) -> Dict[str, Any]:
+        """
+        Build (or incrementally update) the sprite and manifest.
+
+        Returns:
+            The manifest
+        """
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        cache = self._load_cache()
+        glyph_ids = self._glyph_ids()
+
+        entries = {}
+        for path in sorted(self.assets_dir.glob('*.svg')):
+            entry, converted = self._symbol(path, cache.get(path.stem))
+            entries[path.stem] = entry
+            self.stats['converted' if converted else 'reused'] += 1
+        self.stats['removed'] = len(set(cache) - set(entries))
+
+        sprite = build_sprite(entry['symbol'] for entry in entries.values())
+        sprite_hash = _digest(sprite.encode('utf-8'))
+
+        manifest = {
+            'sprite': SPRITE_NAME,
+            'hash': sprite_hash,
+            'glyphs': {
+                glyph_ids.get(stem, stem): {
+                    'symbol': entry['symbol_id'],
+                    'file': f"{stem}.svg",
+                    'hash': entry['hash'],
+                }
+                for stem, entry in entries.items()
+            },
+        }
+
+        sprite_path = self.output_dir / SPRITE_NAME
+        manifest_path = self.output_dir / MANIFEST_NAME
+        if not self._unchanged(manifest_path, sprite_hash) or not sprite_path.exists():
+            _write_atomic(sprite_path, sprite)
+        _write_atomic(manifest_path, json.dumps(manifest, indent=2, ensure_ascii=False) + '\n')
+        _write_atomic(self.cache_path, json.dumps(
+            {'version': CACHE_VERSION, 'assets': entries}, separators=(',', ':')
+        ))
+        return manifest
+
+    def _unchanged(self, manifest_path: Path, sprite_hash: str) -> bool:
+        try:
+            with open(manifest_path, 'r') as f:
+                return json.load(f).get('hash') == sprite_hash
+        except (OSError, ValueError):
+            return False
+
+
+def main():
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description="Build the BeaconGlyphs SVG sprite sheet.")
+    parser.add_argument('--assets', type=Path, default=DEFAULT_ASSETS_DIR,
+                        help='directory of glyph SVGs (default: assets/svg)')
+    parser.add_argument('-o', '--output', type=Path, default=DEFAULT_OUTPUT_DIR,
+                        help='output directory (default: dist/sprite)')
+    parser.add_argument('--registry', type=Path, default=DEFAULT_REGISTRY_PATH,
+                        help='registry used to map asset files to glyph IDs')
+    args = parser.parse_args()
+
+    if not args.assets.is_dir():
+        print(f"Error: Assets directory not found at {args.assets}")
+        return 1
+
+    builder = SpriteBuilder(args.assets, args.output, args.registry)
+    try:
+        manifest = builder.build()
+    except ValueError as e:
+        print(f"Error: {e}")
+        return 1
+
+    stats = builder.stats
+    size = (args.output / SPRITE_NAME).stat().st_size
+    print(f"Built {args.output / SPRITE_NAME}: {len(manifest['glyphs'])} symbols, {size} bytes")
+    print(f"  {stats['converted']} converted, {stats['reused']} reused, "
+          f"{stats['removed']} removed")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
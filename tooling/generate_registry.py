@@ -0,0 +1,282 @@
+#!/usr/bin/env python3
+"""
+BeaconGlyphs Synthetic Registry Generator
+
+Generates deterministic, schema-valid registries of arbitrary size for
+load and regression testing of the validator, indexes and renderers.
+The same seed and options always produce the same registry.
+
+Knobs:
+    category weights    relative frequency of each schema category
+    tag vocabulary      number of distinct tags, drawn with a Zipf-like skew
+    tags per glyph      min/max tags on each glyph
+    related density     average number of relatedGlyphs edges per glyph
+    duplicate rate      fraction of glyphs that are copies of earlier glyphs
+    invalid rate        fraction of glyphs with one injected validation error
+
+Usage:
+    python tooling/generate_registry.py 100000 -o /tmp/registry.json
+    python tooling/generate_registry.py 1000 --seed 7 --invalid-rate 0.05 \\
+        --category-weights events=5,state=2
+"""
+
+import argparse
+import bisect
+import itertools
+import json
+import random
+import sys
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+
+BASE_PATH = Path(__file__).parent.parent
+DEFAULT_SCHEMA_PATH = BASE_PATH / "src" / "schema" / "glyph_schema.json"
+
+# Unicode Private Use Area; representations are encoded in base 6400 so
+# every glyph gets a distinct 1-4 character unicode value.
+_PUA_START = 0xE000
+_PUA_SIZE = 0xF8FF - 0xE000 + 1
+
+
+def _letters(n: int) -> str:
+    """Encode a non-negative integer as lowercase letters (a, b, ..., ba, ...)."""
+    digits = []
+    while True:
+        n, digit = divmod(n, 26)
+        digits.append(chr(ord('a') + digit))
+        if n == 0:
+            return ''.join(reversed(digits))
+
+
+def _private_use(n: int) -> str:
+    chars = []
+    while True:
+        n, digit = divmod(n, _PUA_SIZE)
+        chars.append(chr(_PUA_START + digit))
+        if n == 0:
+            return ''.join(reversed(chars))
+
+
+class RegistryGenerator:
+    """Builds synthetic registries from a seed and a set of shape parameters."""
+
+    INVALID_KINDS = (
+        'uppercase_id',
+        'unknown_category',
+        'missing_description',
+        'long_text',
+        'dangling_related',
+    )
+
+    def __init__(
+        self,
+        seed: int = 0,
+        category_weights: Optional[Dict[str, float]] = None,
+        tag_vocabulary: int = 500,
+        tags_per_glyph: Tuple[int, int] = (2, 6),
+        related_density: float = 2.0,
+        duplicate_rate: float = 0.0,
+        invalid_rate: float = 0.0,
+        schema_path: Path = DEFAULT_SCHEMA_PATH,
+    ):
+        with open(schema_path, 'r') as f:
+            schema = json.load(f)
+        self.categories = schema['properties']['category']['enum']
+        self.use_cases = (
+            schema['properties']['metadata']['properties']['useCases']['items']['enum']
+        )
+
+        weights = category_weights or {}
+        unknown = set(weights) - set(self.categories)
+        if unknown:
+            raise ValueError(f"Unknown categories in weights: {', '.join(sorted(unknown))}")
+        self.category_weights = [weights.get(c, 0 if weights else 1) for c in self.categories]
+        if sum(self.category_weights) <= 0:
+            raise ValueError("Category weights must include at least one positive weight")
+
+        if tag_vocabulary < tags_per_glyph[1]:
+            raise ValueError("tag_vocabulary must be at least the maximum tags per glyph")
+        if not 0 <= duplicate_rate + invalid_rate <= 1:
+            raise ValueError("duplicate_rate + invalid_rate must be between 0 and 1")
+
+        self.seed = seed
+        self.tag_vocabulary = tag_vocabulary
+        self.tags_per_glyph = tags_per_glyph
+        self.related_density = related_density
+        self.duplicate_rate = duplicate_rate
+        self.invalid_rate = invalid_rate
+
+        # (glyph index, glyph id, kind) for every injected duplicate or error
+        self.injected = []
+
+    def generate(self, count: int) -> Dict[str, Any]:
+        """
+        Generate a registry with `count` glyphs.
+
+        Returns:
+            Registry dict ready to be written as registry.json
+        """
+        rng = random.Random(self.seed)
+        self.injected = []
+
+        tags = [f"tag_{_letters(i)}" for i in range(self.tag_vocabulary)]
+        # Zipf-like popularity: a few tags are common, most are rare
+        tag_cumulative = list(itertools.accumulate(1.0 / (rank + 1) for rank in range(len(tags))))
+
+        categories = rng.choices(self.categories, weights=self.category_weights, k=count)
+        ids = [f"{category}.g_{_letters(i)}" for i, category in enumerate(categories)]
+
+        # Decide up front which slots are duplicates or invalid, so that
+        # relatedGlyphs edges only ever point at clean glyphs
+        plan = []
+        for i in range(count):
+            roll = rng.random()
+            if i > 0 and roll < self.duplicate_rate:
+                plan.append('duplicate')
+            elif roll >= 1 - self.invalid_rate:
+                plan.append(rng.choice(self.INVALID_KINDS))
+            else:
+                plan.append(None)
+        targets = [ids[i] for i, kind in enumerate(plan) if kind is None]
+
+        glyphs = []
+        for i, kind in enumerate(plan):
+            if kind == 'duplicate':
+                glyph = json.loads(json.dumps(glyphs[rng.randrange(i)]))
+            else:
+                glyph = self._glyph(rng, i, ids[i], categories[i], targets, tags, tag_cumulative)
+                if kind is not None:
+                    self._inject(glyph, kind, i)
+            if kind is not None:
+                self.injected.append((i, glyph['id'], kind))
+            glyphs.append(glyph)
+
+        return {
+            'version': '1.0.0',
+            'description': f"Synthetic BeaconGlyphs registry ({count} glyphs, seed {self.seed})",
+            'glyphs': glyphs,
+        }
+
+    def _glyph(self, rng, i, glyph_id, category, targets, tags, tag_cumulative):
+        suffix = _letters(i)
+        low, high = self.tags_per_glyph
+        tag_count = rng.randint(low, high)
+        glyph_tags = set()
+        while len(glyph_tags) < tag_count:
+            point = rng.random() * tag_cumulative[-1]
+            glyph_tags.add(tags[bisect.bisect_left(tag_cumulative, point)])
+
+        # Whole part of the density is always drawn, the fraction sometimes
+        related_count = int(self.related_density)
+        if rng.random() < self.related_density - related_count:
+            related_count += 1
+        related = set()
+        if targets:
+            for _ in range(related_count):
+                target = targets[rng.randrange(len(targets))]
+                if target != glyph_id:
+                    related.add(target)
+
+        metadata = {
+            'tags': sorted(glyph_tags),
+            'useCases': rng.sample(self.use_cases, rng.randint(1, 3)),
+            'accessibility': f"Synthetic {category} glyph {suffix}",
+        }
+        if related:
+            metadata['relatedGlyphs'] = sorted(related)
+
+        return {
+            'id': glyph_id,
+            'category': category,
+            'name': f"Synthetic {suffix.upper()}",
+            'description': f"Synthetic {category} glyph {suffix} for scale testing",
+            'representations': {
+                'unicode': _private_use(i),
+                'text': f"[{suffix.upper()}]",
+            },
+            'metadata': metadata,
+        }
+
+    def _inject(self, glyph, kind, i):
+        """Apply one validation error of the given kind to a glyph."""
+        if kind == 'uppercase_id':
+            glyph['id'] = glyph['id'].upper()
+        elif kind == 'unknown_category':
+            glyph['category'] = 'unknown'
+        elif kind == 'missing_description':
+            del glyph['description']
+        elif kind == 'long_text':
+            glyph['representations']['text'] = f"[INVALID_{_letters(i).upper()}]"
+        elif kind == 'dangling_related':
+            glyph['metadata'].setdefault('relatedGlyphs', []).append(
+                f"events.missing_{_letters(i)}"
+            )
+
+
+def generate_registry(count: int, **options) -> Dict[str, Any]:
+    """Generate a registry with `count` glyphs; see RegistryGenerator for options."""
+    return RegistryGenerator(**options).generate(count)
+
+
+def _parse_weights(value: str) -> Dict[str, float]:
+    weights = {}
+    for item in value.split(','):
+        name, _, weight = item.partition('=')
+        try:
+            weights[name.strip()] = float(weight)
+        except ValueError:
+            raise argparse.ArgumentTypeError(f"invalid weight: {item!r} (expected category=weight)")
+    return weights
+
+
+def main():
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description="Generate a synthetic BeaconGlyphs registry.")
+    parser.add_argument('count', type=int, help='number of glyphs')
+    parser.add_argument('-o', '--output', type=Path, default=None,
+                        help='output file (default: stdout)')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--category-weights', type=_parse_weights, default=None,
+                        metavar='CAT=W,...', help='relative category frequencies (default: uniform)')
+    parser.add_argument('--tag-vocabulary', type=int, default=500)
+    parser.add_argument('--tags-per-glyph', type=int, nargs=2, default=(2, 6), metavar=('MIN', 'MAX'))
+    parser.add_argument('--related-density', type=float, default=2.0,
+                        help='average relatedGlyphs per glyph')
+    parser.add_argument('--duplicate-rate', type=float, default=0.0)
+    parser.add_argument('--invalid-rate', type=float, default=0.0)
+    parser.add_argument('--schema', type=Path, default=DEFAULT_SCHEMA_PATH)
+    parser.add_argument('--indent', type=int, default=None)
+    args = parser.parse_args()
+
+    try:
+        generator = RegistryGenerator(
+            seed=args.seed,
+            category_weights=args.category_weights,
+            tag_vocabulary=args.tag_vocabulary,
+            tags_per_glyph=tuple(args.tags_per_glyph),
+            related_density=args.related_density,
+            duplicate_rate=args.duplicate_rate,
+            invalid_rate=args.invalid_rate,
+            schema_path=args.schema,
+        )
+    except ValueError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+
+    registry = generator.generate(args.count)
+
+    if args.output is None:
+        json.dump(registry, sys.stdout, indent=args.indent, ensure_ascii=False)
+        sys.stdout.write('\n')
+    else:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(registry, f, indent=args.indent, ensure_ascii=False)
+        print(f"Wrote {args.count} glyphs to {args.output} "
+              f"({len(generator.injected)} injected duplicates/errors)", file=sys.stderr)
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
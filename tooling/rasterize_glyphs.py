@@ -0,0 +1,246 @@
+#!/usr/bin/env python3
+"""
+BeaconGlyphs PNG Pre-Renderer
+
+Rasterizes every SVG in assets/svg/ at the configured sizes and colors
+into a content-addressed cache, so consumers that cannot display SVG
+(terminals, email) read ready-made PNGs instead of rasterizing per
+request.
+
+Each PNG is stored under the digest of its inputs (SVG bytes, size,
+color and renderer), so a glyph whose SVG has not changed is never
+rendered twice and unchanged files are skipped on every later run.
+Renders run in parallel across a process pool.
+
+Rendering uses cairosvg, an optional dependency:
+
+    pip install cairosvg
+
+Usage:
+    python tooling/rasterize_glyphs.py --sizes 16 32 64 --colors '#000000' '#ffffff'
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+
+BASE_PATH = Path(__file__).parent.parent
+DEFAULT_ASSETS_DIR = BASE_PATH / "assets" / "svg"
+DEFAULT_CACHE_DIR = BASE_PATH / "dist" / "png"
+
+DEFAULT_SIZES = (16, 24, 32, 64)
+DEFAULT_COLORS = ('#000000',)
+
+INDEX_NAME = 'index.json'
+
+# svg text, pixel size -> PNG bytes
+Renderer = Callable[[str, int], bytes]
+
+
+def cairosvg_render(svg: str, size: int) -> bytes:
+    """Render SVG markup to a square PNG with cairosvg."""
+    import cairosvg
+    return cairosvg.svg2png(
+        bytestring=svg.encode('utf-8'), output_width=size, output_height=size
+    )
+
+
+def default_renderer() -> Optional[Tuple[str, Renderer]]:
+    """Get (backend name, render function) for the installed backend, or None."""
+    try:
+        import cairosvg
+    except ImportError:
+        return None
+    return f"cairosvg-{getattr(cairosvg, '__version__', 'unknown')}", cairosvg_render
+
+
+def colorize(svg: str, color: str) -> str:
+    """Resolve currentColor (the glyphs' stroke/fill) to a concrete color."""
+    return svg.replace('currentColor', color)
+
+
+def render_key(svg: bytes, size: int, color: str, backend: str) -> str:
+    """Content address of one render."""
+    digest = hashlib.blake2b(svg, digest_size=16)
+    digest.update(f"|{size}|{color}|{backend}".encode('utf-8'))
+    return digest.hexdigest()
+
+
+def _render_one(render: Renderer, svg: str, size: int, color: str, out_path: str):
+    """Render one PNG and write it atomically (runs in a worker process)."""
+    data = render(colorize(svg, color), size)
+    tmp_path = f"{out_path}.{os.getpid()}.tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(data)
+    os.replace(tmp_path, out_path)
+    return len(data)
+
+
+class Rasterizer:
+    """Plans and runs the pre-render of every asset at every size and color."""
+
+    def __init__(self, assets_dir: Path = DEFAULT_ASSETS_DIR,
+                 cache_dir: Path = DEFAULT_CACHE_DIR,
+                 sizes: Sequence[int] = DEFAULT_SIZES,
+                 colors: Sequence[str] = DEFAULT_COLORS,
+                 render: Renderer = None, backend: str = None,
+                 jobs: int = None):
+        if render is None:
+            found = default_renderer()
+            if found is None:
+                raise RuntimeError("No rasterizer available; install cairosvg")
+            backend, render = found
+
+        self.assets_dir = Path(assets_dir)
+        self.cache_dir = Path(cache_dir)
+        self.sizes = list(sizes)
+        self.colors = list(colors)
+        self.render = render
+        self.backend = backend or getattr(render, '__name__', 'custom')
+        self.jobs = jobs
+        self.stats = {'rendered': 0, 'cached': 0, 'failed': 0, 'pruned': 0}
+        self.errors = []
+
+    def path_for(self, key: str) -> Path:
+        """Cache file for a render key (sharded by the first two hex digits)."""
+        return self.cache_dir / key[:2] / f"{key}.png"
+
+    def plan(self) -> Tuple[Dict[str, Dict[str, str]], List[Tuple[str, str, int, str, str]]]:
+        """
+        Work out which renders are needed.
+
+        Returns:
+            (index, pending): index maps asset stem -> {'<size>@<color>':
+            relative PNG path} for the renders already in the cache;
+            pending lists (stem, svg, size, color, output path) for the
+            rest, which run() adds to the index once they succeed
+        """
+        index = {}
+        pending = []
+        for path in sorted(self.assets_dir.glob('*.svg')):
+            data = path.read_bytes()
+            svg = data.decode('utf-8')
+            renders = index[path.stem] = {}
+            for size in self.sizes:
+                for color in self.colors:
+                    key = render_key(data, size, color, self.backend)
+                    out_path = self.path_for(key)
+                    if out_path.exists():
+                        renders[f"{size}@{color}"] = str(out_path.relative_to(self.cache_dir))
+                        self.stats['cached'] += 1
+                    else:
+                        pending.append((path.stem, svg, size, color, str(out_path)))
+        return index, pending
+
+    def run(self, prune: bool = False) -> Dict[str, Dict[str, str]]:
+        """
+        Render everything that is missing from the cache and write the index.
+
+        Args:
+            prune: Delete cached PNGs that the current assets no longer use
+
+        Returns:
+            The index (asset stem -> '<size>@<color>' -> relative PNG path)
+        """
+        index, pending = self.plan()
+
+        for out_dir in {Path(job[4]).parent for job in pending}:
+            out_dir.mkdir(parents=True, exist_ok=True)
+
+        if pending:
+            if self.jobs == 1:
+                results = [self._attempt(job) for job in pending]
+            else:
+                with ProcessPoolExecutor(max_workers=self.jobs) as pool:
+                    futures = [
+                        pool.submit(_render_one, self.render, svg, size, color, out_path)
+                        for _, svg, size, color, out_path in pending
+                    ]
+                    results = [self._result(job, future) for job, future in zip(pending, futures)]
+            for (stem, _, size, color, out_path), ok in zip(pending, results):
+                if ok:
+                    index[stem][f"{size}@{color}"] = str(Path(out_path).relative_to(self.cache_dir))
+            self.stats['rendered'] += sum(1 for ok in results if ok)
+            self.stats['failed'] += sum(1 for ok in results if not ok)
+
+        if prune:
+            self._prune(index)
+
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        index_path = self.cache_dir / INDEX_NAME
+        tmp_path = index_path.with_name(INDEX_NAME + '.tmp')
+        with open(tmp_path, 'w') as f:
+            json.dump({'backend': self.backend, 'glyphs': index}, f, indent=2, sort_keys=True)
+        os.replace(tmp_path, index_path)
+        return index
+
+    def _attempt(self, job) -> bool:
+        stem, svg, size, color, out_path = job
+        try:
+            _render_one(self.render, svg, size, color, out_path)
+            return True
+        except Exception as e:
+            self.errors.append(f"{stem} {size}@{color}: {e}")
+            return False
+
+    def _result(self, job, future) -> bool:
+        stem, _, size, color, _ = job
+        try:
+            future.result()
+            return True
+        except Exception as e:
+            self.errors.append(f"{stem} {size}@{color}: {e}")
+            return False
+
+    def _prune(self, index: Dict[str, Dict[str, str]]):
+        keep = {rel for renders in index.values() for rel in renders.values()}
+        for path in self.cache_dir.glob('*/*.png'):
+            if str(path.relative_to(self.cache_dir)) not in keep:
+                path.unlink()
+                self.stats['pruned'] += 1
+
+
+def main():
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description="Pre-render BeaconGlyphs SVGs to PNG.")
+    parser.add_argument('--assets', type=Path, default=DEFAULT_ASSETS_DIR)
+    parser.add_argument('-o', '--output', type=Path, default=DEFAULT_CACHE_DIR,
+                        help='cache directory (default: dist/png)')
+    parser.add_argument('--sizes', type=int, nargs='+', default=list(DEFAULT_SIZES))
+    parser.add_argument('--colors', nargs='+', default=list(DEFAULT_COLORS),
+                        help='colors substituted for currentColor')
+    parser.add_argument('-j', '--jobs', type=int, default=None,
+                        help='worker processes (default: one per CPU)')
+    parser.add_argument('--prune', action='store_true',
+                        help='delete cached PNGs no longer produced by the assets')
+    args = parser.parse_args()
+
+    try:
+        rasterizer = Rasterizer(args.assets, args.output, args.sizes, args.colors, jobs=args.jobs)
+    except RuntimeError as e:
+        print(f"Error: {e}")
+        return 1
+
+    start = time.perf_counter()
+    index = rasterizer.run(prune=args.prune)
+    elapsed = time.perf_counter() - start
+
+    stats = rasterizer.stats
+    for error in rasterizer.errors:
+        print(f"  ❌ {error}")
+    print(f"{len(index)} glyphs x {len(args.sizes)} sizes x {len(args.colors)} colors "
+          f"with {rasterizer.backend} in {elapsed:.2f}s")
+    print(f"  {stats['rendered']} rendered, {stats['cached']} cached, "
+          f"{stats['failed']} failed, {stats['pruned']} pruned")
+    return 0 if stats['failed'] == 0 else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,263 @@
+#!/usr/bin/env python3
+"""
+BeaconGlyphs Benchmark Suite
+
+Standalone, offline benchmarks for registry loading, lookup, search,
+validation and Glyphtrail rendering on synthetic registries and sessions
+of increasing size. Results are written as JSON with stable benchmark
+names, so runs from different commits can be compared directly.
+
+Usage:
+    python tooling/run_benchmarks.py --quick -o bench.json
+    python tooling/run_benchmarks.py --max-glyphs 1000000 --max-events 10000000
+    python tooling/run_benchmarks.py --compare old.json new.json
+"""
+
+import argparse
+import gc
+import io
+import json
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, List, Optional
+
+
+BASE_PATH = Path(__file__).parent.parent
+SCHEMA_PATH = BASE_PATH / "src" / "schema" / "glyph_schema.json"
+
+sys.path.insert(0, str(BASE_PATH / "examples"))
+sys.path.insert(0, str(BASE_PATH / "examples" / "glyphtrail_integration"))
+
+from render_glyphs import BeaconGlyphs  # noqa: E402
+from registry_snapshot import compile_snapshot  # noqa: E402
+from session_renderer import GlyphtrailSession  # noqa: E402
+from generate_registry import generate_registry  # noqa: E402
+from validate_registry import RegistryValidator  # noqa: E402
+
+
+def _sizes(low: int, high: int) -> List[int]:
+    """Powers of ten from `low` to `high` inclusive."""
+    sizes = []
+    size = low
+    while size <= high:
+        sizes.append(size)
+        size *= 10
+    return sizes
+
+
+def _time(fn: Callable[[], Any], repeat: int) -> float:
+    """Best wall-clock time of `repeat` runs, with GC disabled while timing."""
+    best = float('inf')
+    for _ in range(repeat):
+        gc.collect()
+        gc.disable()
+        try:
+            start = time.perf_counter()
+            fn()
+            best = min(best, time.perf_counter() - start)
+        finally:
+            gc.enable()
+    return best
+
+
+class BenchmarkRunner:
+    """Runs benchmarks and collects results."""
+
+    def __init__(self, repeat: int = 3, lookups: int = 100000):
+        self.repeat = repeat
+        self.lookups = lookups
+        self.results = []
+
+    def record(self, name: str, size: int, seconds: float, ops: int = 1):
+        result = {
+            'name': name,
+            'size': size,
+            'ops': ops,
+            'seconds': seconds,
+            'us_per_op': seconds / ops * 1e6,
+        }
+        self.results.append(result)
+        print(f"  {name:<32} n={size:<10} {seconds:10.4f}s  {result['us_per_op']:12.3f} us/op")
+
+    def bench_registry(self, size: int, workdir: Path):
+        """Load, lookup, search and validation benchmarks for one registry size."""
+        registry = generate_registry(size, seed=size)
+
+        path = workdir / f"registry-{size}.json"
+        with open(path, 'w') as f:
+            json.dump(registry, f)
+
+        self.record('registry.load_json', size,
+                    _time(lambda: BeaconGlyphs(path, use_snapshot=False), self.repeat))
+
+        compile_snapshot(path)
+        self.record('registry.load_snapshot', size,
+                    _time(lambda: BeaconGlyphs(path), self.repeat))
+
+        glyphs = BeaconGlyphs(path, use_snapshot=False)
+        ids = [g['id'] for g in registry['glyphs']]
+        probe = [ids[i % len(ids)] for i in range(self.lookups)]
+        tags = glyphs.all_tags()
+        categories = glyphs.all_categories()
+
+        def run_get():
+            get = glyphs.get
+            for glyph_id in probe:
+                get(glyph_id)
+
+        # search/category results grow with the registry; keep runs bounded
+        searches = max(1, min(self.lookups, 10 ** 7 // size))
+
+        def run_search():
+            for i in range(searches):
+                glyphs.search_by_tag(tags[i % len(tags)])
+
+        def run_category():
+            for i in range(searches):
+                glyphs.get_category(categories[i % len(categories)])
+
+        self.record('registry.get', size, _time(run_get, self.repeat), self.lookups)
+        self.record('registry.get_many', size,
+                    _time(lambda: glyphs.get_many(probe), self.repeat), self.lookups)
+        self.record('registry.search_by_tag', size, _time(run_search, self.repeat), searches)
+        self.record('registry.get_category', size, _time(run_category, self.repeat), searches)
+
+        queries = ['synthetic event', 'scale testing data', 'tag', 'glyph bcd']
+        text_searches = min(searches, 1000)
+        glyphs.text_index()
+
+        def run_search_text():
+            for i in range(text_searches):
+                glyphs.search_text(queries[i % len(queries)])
+
+        self.record('registry.search_text', size,
+                    _time(run_search_text, self.repeat), text_searches)
+
+        graph_probe = probe[:searches]
+        glyphs.graph()
+
+        def run_related():
+            for glyph_id in graph_probe:
+                glyphs.get_related(glyph_id, hops=2)
+
+        self.record('registry.get_related', size, _time(run_related, self.repeat), len(graph_probe))
+
+        def run_validate():
+            RegistryValidator(path, SCHEMA_PATH).validate(report=False)
+
+        self.record('validator.validate', size, _time(run_validate, self.repeat))
+
+    def bench_session(self, size: int):
+        """Rendering benchmarks for one session size."""
+        event_types = list(GlyphtrailSession.EVENT_GLYPH_MAP)
+        session = GlyphtrailSession(f"bench-{size}", "Benchmark")
+        start = time.time()
+        for i in range(size):
+            metadata = {'step': i} if i % 10 == 0 else None
+            session.add_event(event_types[i % len(event_types)], f"Event {i}",
+                              metadata, start + i * 0.01)
+
+        self.record('session.render_lineage', size,
+                    _time(lambda: session.render_lineage(), self.repeat), size)
+        self.record('session.render_timeline', size,
+                    _time(lambda: session.render_timeline(), self.repeat), size)
+        self.record('session.write_lineage', size,
+                    _time(lambda: session.write_lineage(_NullWriter()), self.repeat), size)
+
+
+class _NullWriter(io.TextIOBase):
+    """File-like sink that discards output, for streaming benchmarks."""
+
+    def write(self, s):
+        return len(s)
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        return subprocess.check_output(
+            ['git', 'rev-parse', 'HEAD'], cwd=BASE_PATH, stderr=subprocess.DEVNULL
+        ).decode().strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(old_path: Path, new_path: Path):
+    """Print per-benchmark speed ratios between two result files."""
+    with open(old_path, 'r') as f:
+        old = {(r['name'], r['size']): r for r in json.load(f)['results']}
+    with open(new_path, 'r') as f:
+        new = json.load(f)['results']
+
+    print(f"{'benchmark':<32} {'n':<10} {'old us/op':>12} {'new us/op':>12} {'speedup':>8}")
+    for result in new:
+        before = old.get((result['name'], result['size']))
+        if before is None:
+            continue
+        ratio = before['us_per_op'] / result['us_per_op'] if result['us_per_op'] else float('inf')
+        print(f"{result['name']:<32} {result['size']:<10} {before['us_per_op']:12.3f} "
+              f"{result['us_per_op']:12.3f} {ratio:7.2f}x")
+
+
+def main():
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description="Run BeaconGlyphs benchmarks.")
+    parser.add_argument('-o', '--output', type=Path, default=None,
+                        help='write JSON results here (default: stdout summary only)')
+    parser.add_argument('--max-glyphs', type=int, default=10 ** 6)
+    parser.add_argument('--max-events', type=int, default=10 ** 7)
+    parser.add_argument('--quick', action='store_true',
+                        help='small sizes only (up to 10^4 glyphs, 10^5 events)')
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--only', choices=['registry', 'session'], default=None)
+    parser.add_argument('--compare', nargs=2, type=Path, metavar=('OLD', 'NEW'),
+                        help='compare two result files instead of running')
+    args = parser.parse_args()
+
+    if args.compare:
+        compare(*args.compare)
+        return 0
+
+    max_glyphs = min(args.max_glyphs, 10 ** 4) if args.quick else args.max_glyphs
+    max_events = min(args.max_events, 10 ** 5) if args.quick else args.max_events
+
+    runner = BenchmarkRunner(repeat=args.repeat)
+
+    print("=" * 70)
+    print("BeaconGlyphs Benchmarks")
+    print("=" * 70)
+
+    if args.only in (None, 'registry'):
+        with tempfile.TemporaryDirectory() as workdir:
+            for size in _sizes(100, max_glyphs):
+                runner.bench_registry(size, Path(workdir))
+
+    if args.only in (None, 'session'):
+        for size in _sizes(1000, max_events):
+            runner.bench_session(size)
+
+    print("=" * 70)
+
+    report = {
+        'commit': _git_commit(),
+        'timestamp': datetime.now(timezone.utc).isoformat(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'repeat': args.repeat,
+        'results': runner.results,
+    }
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2)
+        print(f"Results written to {args.output}")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
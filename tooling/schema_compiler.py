@@ -0,0 +1,276 @@
+#!/usr/bin/env python3
+"""
+BeaconGlyphs Schema Compiler
+
+Compiles src/schema/glyph_schema.json into a plain Python validation
+function, with no runtime dependency on `jsonschema`. Each schema node is
+turned into a closure once: regexes are compiled up front, enums become
+frozensets, required fields become tuples and property paths are fixed,
+so validating a glyph is a walk over prebuilt closures rather than a
+re-interpretation of the schema.
+
+Supported keywords (the subset glyph_schema.json uses): type, required,
+properties, additionalProperties (boolean), items, enum, pattern,
+minLength, maxLength, minItems, maxItems. Annotations (title,
+description, ...) are ignored; any other keyword is rejected with a
+ValueError rather than silently not checked.
+
+Usage:
+    python tooling/schema_compiler.py --benchmark 100000
+"""
+
+import argparse
+import json
+import os
+import re
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Tuple
+
+
+# (path, keyword, message)
+Violation = Tuple[str, str, str]
+Validator = Callable[[Any, List[Violation]], None]
+
+_TYPES = {
+    'string': (str,),
+    'object': (dict,),
+    'array': (list,),
+    'boolean': (bool,),
+    'number': (int, float),
+    'integer': (int,),
+    'null': (type(None),),
+}
+
+
+_KEYWORDS = frozenset({
+    'type', 'required', 'properties', 'additionalProperties', 'items', 'enum', 'pattern',
+    'minLength', 'maxLength', 'minItems', 'maxItems',
+})
+
+# Keywords that never affect validation
+_ANNOTATIONS = frozenset({
+    '$schema', '$id', '$comment', 'title', 'description', 'default', 'examples',
+})
+
+
+def _join(path: str, key: str) -> str:
+    return f"{path}.{key}" if path else key
+
+
+def _compile_node(schema: Dict[str, Any], path: str) -> Validator:
+    """
+    Compile one schema node into a validator closure.
+
+    Paths are static and baked in at compile time; array items use
+    '[]' placeholders which are filled with the index only when an item
+    actually fails.
+
+    Raises:
+        ValueError: if the node uses a keyword (or keyword value) the
+            compiler does not support
+    """
+    label = path or 'value'
+    where = path or 'the root'
+    unsupported = sorted(set(schema) - _KEYWORDS - _ANNOTATIONS)
+    if unsupported:
+        raise ValueError(f"Unsupported schema keyword '{unsupported[0]}' at {where}")
+    if not isinstance(schema.get('additionalProperties', True), bool):
+        raise ValueError(f"Unsupported schema keyword 'additionalProperties' at {where}: "
+                         f"only true or false is supported")
+    type_name = schema.get('type')
+    if type_name is not None and (not isinstance(type_name, str) or type_name not in _TYPES):
+        raise ValueError(f"Unsupported schema type {type_name!r} at {where}")
+    expected = _TYPES[type_name] if type_name else None
+    is_numeric = type_name in ('number', 'integer')
+
+    allowed = frozenset(schema['enum']) if 'enum' in schema else None
+    allowed_list = ', '.join(str(v) for v in schema.get('enum', ()))
+
+    regex = re.compile(schema['pattern']) if 'pattern' in schema else None
+    pattern = schema.get('pattern')
+
+    min_length = schema.get('minLength')
+    max_length = schema.get('maxLength')
+    min_items = schema.get('minItems')
+    max_items = schema.get('maxItems')
+
+    required = tuple(schema.get('required', ()))
+    properties = {
+        name: _compile_node(subschema, _join(path, name))
+        for name, subschema in schema.get('properties', {}).items()
+    }
+    additional = schema.get('additionalProperties', True)
+    items = _compile_node(schema['items'], f"{path}[]") if 'items' in schema else None
+
+    def validate(value, out):
+        # bool is an int subclass but never a JSON number
+        if expected is not None and (
+            not isinstance(value, expected) or (is_numeric and isinstance(value, bool))
+        ):
+            out.append((path, 'type', f"{label} must be of type {type_name}"))
+            return
+
+        if allowed is not None:
+            try:
+                ok = value in allowed
+            except TypeError:
+                ok = False
+            if not ok:
+                out.append((path, 'enum', f"{label} must be one of: {allowed_list}"))
+
+        if isinstance(value, str):
+            if regex is not None and not regex.search(value):
+                out.append((path, 'pattern', f"{label} '{value}' does not match {pattern}"))
+            if min_length is not None and len(value) < min_length:
+                out.append((path, 'minLength', f"{label} is shorter than {min_length} characters"))
+            if max_length is not None and len(value) > max_length:
+                out.append((path, 'maxLength', f"{label} is longer than {max_length} characters"))
+
+        elif isinstance(value, dict):
+            for field in required:
+                if field not in value:
+                    out.append((path, 'required', f"missing required field: {_join(path, field)}"))
+            if properties or additional is False:
+                for key, item in value.items():
+                    validator = properties.get(key)
+                    if validator is not None:
+                        validator(item, out)
+                    elif additional is False:
+                        out.append((path, 'additionalProperties', f"unexpected field: {_join(path, key)}"))
+
+        elif isinstance(value, list):
+            if min_items is not None and len(value) < min_items:
+                out.append((path, 'minItems', f"{label} has fewer than {min_items} items"))
+            if max_items is not None and len(value) > max_items:
+                out.append((path, 'maxItems', f"{label} has more than {max_items} items"))
+            if items is not None:
+                for i, item in enumerate(value):
+                    start = len(out)
+                    items(item, out)
+                    # Fill in the concrete index for this item's violations
+                    for j in range(start, len(out)):
+                        item_path, keyword, message = out[j]
+                        out[j] = (
+                            item_path.replace('[]', f'[{i}]', 1), keyword,
+                            message.replace(f"{path}[]", f"{path}[{i}]", 1),
+                        )
+
+    return validate
+
+
+def compile_schema(schema: Dict[str, Any]) -> Callable[[Any], List[Violation]]:
+    """
+    Compile a JSON schema into a validation function.
+
+    Returns:
+        Function taking an instance and returning a list of
+        (path, keyword, message) violations (empty if valid)
+    """
+    root = _compile_node(schema, '')
+
+    def validate(instance):
+        out = []
+        root(instance, out)
+        return out
+
+    return validate
+
+
+_compiled_cache = {}
+
+
+def load_compiled_schema(schema_path: Path) -> Callable[[Any], List[Violation]]:
+    """Compile a schema file, reusing the result until the file changes."""
+    schema_path = Path(schema_path)
+    stat = os.stat(schema_path)
+    key = (str(schema_path.resolve()), stat.st_mtime_ns, stat.st_size)
+
+    validator = _compiled_cache.get(key)
+    if validator is None:
+        with open(schema_path, 'r') as f:
+            validator = compile_schema(json.load(f))
+        _compiled_cache[key] = validator
+    return validator
+
+
+def _synthetic_glyphs(template: List[Dict[str, Any]], count: int) -> List[Dict[str, Any]]:
+    """Repeat the shipped glyphs with unique IDs to reach `count` records."""
+    glyphs = []
+    for i in range(count):
+        glyph = json.loads(json.dumps(template[i % len(template)]))
+        suffix = ''.join(chr(ord('a') + int(d)) for d in str(i))
+        glyph['id'] = f"{glyph['category']}.g_{suffix}"
+        glyphs.append(glyph)
+    return glyphs
+
+
+def benchmark(schema_path: Path, registry_path: Path, count: int):
+    """Time the compiled validator (and jsonschema, if installed)."""
+    with open(schema_path, 'r') as f:
+        schema = json.load(f)
+    with open(registry_path, 'r') as f:
+        glyphs = _synthetic_glyphs(json.load(f)['glyphs'], count)
+
+    print(f"Validating {count} synthetic glyphs against {schema_path.name}")
+    print()
+
+    start = time.perf_counter()
+    validate = compile_schema(schema)
+    compile_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    violations = sum(len(validate(glyph)) for glyph in glyphs)
+    compiled_time = time.perf_counter() - start
+    print(f"  compiled:   {compiled_time:8.3f}s  ({compiled_time / count * 1e6:6.2f} us/glyph, "
+          f"compile {compile_time * 1e3:.2f} ms, {violations} violations)")
+
+    try:
+        import jsonschema
+    except ImportError:
+        print("  jsonschema: not installed, skipped")
+        return
+
+    validator = jsonschema.Draft7Validator(schema)
+    start = time.perf_counter()
+    violations = sum(1 for glyph in glyphs for _ in validator.iter_errors(glyph))
+    reference_time = time.perf_counter() - start
+    print(f"  jsonschema: {reference_time:8.3f}s  ({reference_time / count * 1e6:6.2f} us/glyph, "
+          f"{violations} violations)")
+    print(f"  speedup:    {reference_time / compiled_time:8.1f}x")
+
+
+def main():
+    """Main entry point."""
+    base_path = Path(__file__).parent.parent
+    default_schema = base_path / "src" / "schema" / "glyph_schema.json"
+    default_registry = base_path / "src" / "glyphs" / "registry.json"
+
+    parser = argparse.ArgumentParser(description="Compile and check the BeaconGlyphs schema.")
+    parser.add_argument('--schema', type=Path, default=default_schema)
+    parser.add_argument('--registry', type=Path, default=default_registry)
+    parser.add_argument('--benchmark', type=int, metavar='N', default=None,
+                        help='benchmark against jsonschema on N synthetic glyphs')
+    args = parser.parse_args()
+
+    if args.benchmark:
+        benchmark(args.schema, args.registry, args.benchmark)
+        return 0
+
+    validate = load_compiled_schema(args.schema)
+    with open(args.registry, 'r') as f:
+        glyphs = json.load(f).get('glyphs', [])
+
+    failed = 0
+    for glyph in glyphs:
+        for path, keyword, message in validate(glyph):
+            print(f"  ❌ {glyph.get('id', '<unknown>')}: {message}")
+            failed += 1
+
+    print(f"{len(glyphs)} glyphs checked, {failed} schema violations")
+    return 0 if failed == 0 else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,242 @@
+#!/usr/bin/env python3
+"""
+BeaconGlyphs SVG Linter
+
+Enforces the rules in tests/lint/svg_validation_notes.md on the artwork
+in assets/svg/:
+
+    errors      not well-formed, root is not an SVG-namespace <svg>,
+                missing/invalid viewBox, embedded raster images, scripts
+                or event handlers, file over the size budget
+    warnings    non-square viewBox, missing width/height, missing
+                <title>/<desc>, inline style attributes, hardcoded colors
+                instead of currentColor, stroke widths outside the
+                standard set, coordinates with more than 2 decimals
+
+Files are parsed concurrently across a process pool. Each result also
+reports the file's byte size and the bytes an optimization pass
+(rounding to 2 decimals, then minifying) would save.
+
+Usage:
+    python tooling/svg_lint.py [assets/svg] [--budget 5120] [-j N]
+"""
+
+import argparse
+import os
+import re
+import sys
+import xml.etree.ElementTree as ET
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, List, Sequence
+
+
+BASE_PATH = Path(__file__).parent.parent
+sys.path.insert(0, str(BASE_PATH / "examples"))
+
+from svg_assets import minify_svg  # noqa: E402
+
+
+DEFAULT_ASSETS_DIR = BASE_PATH / "assets" / "svg"
+
+SVG_NS = 'http://www.w3.org/2000/svg'
+DEFAULT_BUDGET = 5 * 1024
+DEFAULT_STROKE_WIDTHS = ('1', '2', '2.5')
+
+_RASTER_RE = re.compile(r'^data:image/(?!svg)|\.(png|jpe?g|gif|webp|bmp)(\?|#|$)', re.IGNORECASE)
+_PRECISE_RE = re.compile(r'-?\d+\.\d{3,}')
+_ATTR_VALUE_RE = re.compile(r'="([^"]*)"')
+_COLOR_OK = {'currentcolor', 'none', 'inherit', 'transparent'}
+
+
+def _local(name: str) -> str:
+    """Strip an ElementTree '{namespace}' prefix."""
+    return name.rsplit('}', 1)[-1]
+
+
+def _round(match) -> str:
+    return f"{float(match.group(0)):.2f}".rstrip('0').rstrip('.')
+
+
+def optimize_svg(svg: str) -> str:
+    """Round numbers in attribute values to 2 decimals, then minify."""
+    svg = _ATTR_VALUE_RE.sub(lambda m: '="' + _PRECISE_RE.sub(_round, m.group(1)) + '"', svg)
+    return minify_svg(svg)
+
+
+def lint_svg(path: str, budget: int = DEFAULT_BUDGET,
+             stroke_widths: Sequence[str] = DEFAULT_STROKE_WIDTHS) -> Dict[str, Any]:
+    """
+    Lint one SVG file.
+
+    Module-level and returning plain values so it can run in a process
+    pool worker.
+
+    Returns:
+        Dict with 'file', 'size', 'optimized_size' and 'findings', a list
+        of (severity, message) pairs
+    """
+    data = Path(path).read_bytes()
+    findings = []
+    result = {
+        'file': Path(path).name,
+        'size': len(data),
+        'optimized_size': len(data),
+        'findings': findings,
+    }
+
+    def error(message):
+        findings.append(('error', message))
+
+    def warn(message):
+        findings.append(('warning', message))
+
+    if len(data) > budget:
+        error(f"{len(data)} bytes exceeds the {budget} byte budget")
+
+    try:
+        text = data.decode('utf-8')
+        root = ET.fromstring(data)
+    except (UnicodeDecodeError, ET.ParseError) as e:
+        error(f"not well-formed: {e}")
+        return result
+
+    result['optimized_size'] = len(optimize_svg(text).encode('utf-8'))
+
+    if root.tag != f'{{{SVG_NS}}}svg':
+        error(f"root element must be <svg> in the {SVG_NS} namespace")
+
+    view_box = root.get('viewBox')
+    if view_box is None:
+        error("missing viewBox")
+    else:
+        try:
+            _, _, vb_width, vb_height = (float(v) for v in view_box.replace(',', ' ').split())
+        except ValueError:
+            error(f"invalid viewBox: {view_box!r}")
+        else:
+            if vb_width != vb_height:
+                warn(f"viewBox {view_box!r} is not square")
+
+    if root.get('width') is None or root.get('height') is None:
+        warn("missing width/height")
+
+    tags = set()
+    bad_widths = set()
+    bad_colors = set()
+    styled = False
+    precise = False
+    for element in root.iter():
+        tag = _local(element.tag) if isinstance(element.tag, str) else ''
+        tags.add(tag)
+
+        if tag == 'image':
+            error("embedded raster <image> element")
+        elif tag in ('script', 'foreignObject'):
+            error(f"<{tag}> is not allowed")
+
+        for name, value in element.attrib.items():
+            name = _local(name)
+            if name.startswith('on'):
+                error(f"event handler attribute {name!r} on <{tag}>")
+            elif name == 'href':
+                if value.strip().lower().startswith('javascript:'):
+                    error(f"javascript: link on <{tag}>")
+                elif _RASTER_RE.search(value):
+                    error(f"raster image reference on <{tag}>")
+            elif name == 'style':
+                styled = True
+            elif name == 'stroke-width' and value not in stroke_widths:
+                bad_widths.add(value)
+            elif name in ('fill', 'stroke') and value.lower() not in _COLOR_OK \
+                    and not value.startswith('url('):
+                bad_colors.add(value)
+            if _PRECISE_RE.search(value):
+                precise = True
+
+    if 'title' not in tags:
+        warn("missing <title>")
+    if 'desc' not in tags:
+        warn("missing <desc>")
+    if styled:
+        warn("inline style attributes (use presentation attributes and currentColor)")
+    if bad_colors:
+        warn(f"hardcoded colors {', '.join(sorted(bad_colors))} (use currentColor)")
+    if bad_widths:
+        warn(f"non-standard stroke-width {', '.join(sorted(bad_widths))} "
+             f"(expected {', '.join(stroke_widths)})")
+    if precise:
+        warn("coordinates with more than 2 decimal places")
+
+    return result
+
+
+def lint_assets(assets_dir: Path = DEFAULT_ASSETS_DIR, jobs: int = None,
+                budget: int = DEFAULT_BUDGET,
+                stroke_widths: Sequence[str] = DEFAULT_STROKE_WIDTHS) -> List[Dict[str, Any]]:
+    """
+    Lint every SVG in a directory across a process pool.
+
+    Returns:
+        One lint_svg() result per file, in file name order
+    """
+    paths = [str(p) for p in sorted(Path(assets_dir).glob('*.svg'))]
+    if jobs == 1 or len(paths) <= 1:
+        return [lint_svg(path, budget, stroke_widths) for path in paths]
+
+    workers = min(jobs or os.cpu_count() or 1, len(paths))
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        chunksize = max(1, len(paths) // (workers * 4))
+        return list(pool.map(
+            lint_svg, paths, [budget] * len(paths), [tuple(stroke_widths)] * len(paths),
+            chunksize=chunksize,
+        ))
+
+
+def print_size_report(results: List[Dict[str, Any]]):
+    """Print per-file byte sizes and optimization savings."""
+    total = optimized = 0
+    print(f"  {'file':<32} {'bytes':>7} {'optimized':>10} {'savings':>8}")
+    for result in results:
+        saved = result['size'] - result['optimized_size']
+        total += result['size']
+        optimized += result['optimized_size']
+        print(f"  {result['file']:<32} {result['size']:7d} {result['optimized_size']:10d} "
+              f"{100 * saved / result['size'] if result['size'] else 0:7.1f}%")
+    if total:
+        print(f"  {'total':<32} {total:7d} {optimized:10d} "
+              f"{100 * (total - optimized) / total:7.1f}%")
+
+
+def main():
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description="Lint BeaconGlyphs SVG assets.")
+    parser.add_argument('assets', nargs='?', type=Path, default=DEFAULT_ASSETS_DIR,
+                        help='directory of SVGs (default: assets/svg)')
+    parser.add_argument('--budget', type=int, default=DEFAULT_BUDGET,
+                        help=f'maximum file size in bytes (default: {DEFAULT_BUDGET})')
+    parser.add_argument('-j', '--jobs', type=int, default=None,
+                        help='worker processes (default: CPU count)')
+    args = parser.parse_args()
+
+    if not args.assets.is_dir():
+        print(f"Error: Assets directory not found at {args.assets}")
+        return 1
+
+    results = lint_assets(args.assets, args.jobs, args.budget)
+    errors = 0
+    for result in results:
+        for severity, message in result['findings']:
+            icon = "❌" if severity == 'error' else "⚠️ "
+            print(f"  {icon} {result['file']}: {message}")
+            errors += severity == 'error'
+    print()
+    print_size_report(results)
+    print()
+    print(f"{len(results)} files, {errors} errors, "
+          f"{sum(len(r['findings']) for r in results) - errors} warnings")
+    return 0 if errors == 0 else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
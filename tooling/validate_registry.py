@@ -3,56 +3,426 @@
 BeaconGlyphs Registry Validator
 
 Validates the glyph registry against the JSON schema and performs
-additional semantic checks to ensure consistency and quality.
+additional semantic checks to ensure consistency and quality. With
+--svg, the SVG artwork is linted as well (see svg_lint.py).
+
+With several registries, each one is validated in a worker process and
+its findings are output (or streamed with --format jsonl) when that
+registry is done, in input order. --fail-fast and --max-findings apply
+to the output as a whole: output stops at the limit, even part-way
+through a registry.
 """
 
+import argparse
+import glob
+import hashlib
 import json
+import marshal
+import os
+import re
 import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import Any, Callable, Dict, Iterator, List
+
+from schema_compiler import load_compiled_schema
+from svg_lint import DEFAULT_ASSETS_DIR, DEFAULT_BUDGET, lint_assets, print_size_report
+
+
+# Bump when check logic changes to invalidate incremental caches
+CACHE_VERSION = 5
+
+# Bytes of each per-glyph digest in the incremental cache
+GLYPH_DIGEST_SIZE = 16
+
+
+def default_cache_path(registry_path: Path) -> Path:
+    """Incremental cache location: a hidden file next to the registry."""
+    registry_path = Path(registry_path)
+    return registry_path.with_name(f".{registry_path.name}.validate-cache")
+
+
+class _StopValidation(Exception):
+    """Raised internally to end validation early (fail-fast / max findings)."""
 
 
 class RegistryValidator:
     """Validates BeaconGlyphs registry against schema and best practices."""
 
-    def __init__(self, registry_path: Path, schema_path: Path):
+    # Check names in report order
+    CHECKS = [
+        'registry_structure',
+        'glyph_ids',
+        'required_fields',
+        'categories',
+        'representations',
+        'duplicates',
+        'related_glyphs',
+        'accessibility',
+        'schema',
+        'svg_assets',
+    ]
+
+    # Schema violations already reported by the hand-written checks above
+    SCHEMA_COVERED = {
+        ('', 'required'),
+        ('id', 'pattern'),
+        ('representations', 'required'),
+        ('category', 'enum'),
+    }
+
+    REQUIRED_FIELDS = ['id', 'category', 'name', 'description', 'representations']
+
+    # Glyph-local checks reported before the duplicates check for each
+    # glyph (the rest come after it); keeps streamed findings in traversal
+    # order when they are replayed from the per-glyph cache
+    _BEFORE_DUPLICATES = frozenset({'required_fields', 'categories', 'representations'})
+
+    def __init__(self, registry_path: Path, schema_path: Path,
+                 on_finding: Callable[[Dict[str, Any]], None] = None,
+                 fail_fast: bool = False, max_findings: int = None,
+                 cache_path: Path = None, assets_dir: Path = None,
+                 svg_budget: int = DEFAULT_BUDGET, jobs: int = None):
+        """
+        Args:
+            registry_path: Registry JSON file to validate
+            schema_path: Glyph JSON schema
+            on_finding: Called with each finding dict as soon as it is
+                found. When set, findings are streamed instead of being
+                kept in `errors`/`warnings`, which stay empty.
+            fail_fast: Stop at the first error
+            max_findings: Stop after this many findings (errors + warnings)
+            cache_path: Enables incremental mode. Findings of the checks
+                that only look at one glyph are cached here per glyph,
+                keyed by a digest of its contents, and only glyphs
+                whose digest changed are checked again. Cross-glyph
+                checks (IDs, duplicates, related glyphs) always run. A
+                byte-identical registry is replayed without being parsed.
+            assets_dir: Also lint every SVG in this directory (parsed
+                across a process pool of `jobs` workers); per-file sizes
+                and savings are kept in `svg_results`
+            svg_budget: Maximum SVG file size in bytes
+        """
         self.registry_path = registry_path
         self.schema_path = schema_path
+        self.on_finding = on_finding
+        self.fail_fast = fail_fast
+        self.max_findings = max_findings
+        self.cache_path = cache_path
+        self.assets_dir = Path(assets_dir) if assets_dir is not None else None
+        self.svg_budget = svg_budget
+        self.jobs = jobs
+        self.svg_results = []
+        self.from_cache = False
+        self.revalidated = 0
+        self._captured = None
+        self._deferred = None
+        self._keys = None
+        self._glyph_cache = {}
+        self._glyph_results = {}
+        self._clean_cache = set()
+        self._clean_results = []
+        self._svg_cached = None
         self.errors = []
         self.warnings = []
+        self.error_count = 0
+        self.warning_count = 0
+        self.glyph_count = 0
+        self.stopped_early = False
 
         # Load files
-        with open(registry_path, 'r') as f:
-            self.registry = json.load(f)
+        with open(registry_path, 'rb') as f:
+            self._registry_bytes = f.read()
+        self._registry = None
+        if cache_path is None:
+            self._registry = json.loads(self._registry_bytes)
 
         with open(schema_path, 'r') as f:
             self.schema = json.load(f)
+        self._schema_validator = load_compiled_schema(schema_path)
 
-    def validate(self) -> bool:
+    @property
+    def registry(self) -> Dict[str, Any]:
+        """Parsed registry (deferred in incremental mode until needed)."""
+        if self._registry is None:
+            self._registry = json.loads(self._registry_bytes)
+        return self._registry
+
+    def validate(self, report: bool = True) -> bool:
         """Run all validation checks."""
-        print("=" * 70)
-        print("BeaconGlyphs Registry Validator")
-        print("=" * 70)
-        print()
+        if report:
+            print("=" * 70)
+            print("BeaconGlyphs Registry Validator")
+            print("=" * 70)
+            print()
 
-        print(f"Registry: {self.registry_path}")
-        print(f"Schema: {self.schema_path}")
-        print()
+            print(f"Registry: {self.registry_path}")
+            print(f"Schema: {self.schema_path}")
+            print()
 
-        # Run checks
-        self._check_registry_structure()
-        self._check_glyph_ids()
-        self._check_required_fields()
-        self._check_categories()
-        self._check_representations()
-        self._check_duplicates()
-        self._check_related_glyphs()
-        self._check_accessibility()
+        self.run_checks()
 
         # Report
-        self._print_report()
+        if report:
+            self._print_report()
+
+        return self.error_count == 0
+
+    def run_checks(self):
+        """
+        Run every check in a single traversal of the glyph list.
+
+        Findings are bucketed per check, so errors and warnings are
+        reported in the same order as running each check separately.
+        Streamed findings (on_finding) are emitted in traversal order.
+        """
+        self._findings = {check: ([], []) for check in self.CHECKS}
+        self.error_count = 0
+        self.warning_count = 0
+        self.stopped_early = False
+        self.from_cache = False
+        self.revalidated = 0
+
+        cached = self._load_cache() if self.cache_path else None
+        keys = self._cache_keys() if cached is not None else None
+        try:
+            if cached is not None and cached['registry'] == keys['registry'] and \
+                    cached['svg_key'] == keys['svg_key']:
+                self.from_cache = True
+                self.glyph_count = cached['glyphs']
+                self.svg_results = cached['svg']
+                for finding in cached['findings']:
+                    self._record(*finding)
+            else:
+                if cached is not None:
+                    self._glyph_cache = cached['per_glyph']
+                    clean, width = cached['clean'], 2 * GLYPH_DIGEST_SIZE
+                    self._clean_cache = {clean[k:k + width] for k in range(0, len(clean), width)}
+                    if keys['svg_key'] is not None and cached['svg_key'] == keys['svg_key']:
+                        self._svg_cached = cached['svg']
+                self._glyph_results = {}
+                self._clean_results = []
+                self._captured = [] if self.cache_path else None
+                self._run_checks()
+        except _StopValidation:
+            self.stopped_early = True
+        finally:
+            captured, self._captured = self._captured, None
+
+        if captured is not None and not self.stopped_early:
+            self._save_cache(captured)
+
+        self.errors = [
+            error for check in self.CHECKS for error in self._findings[check][0]
+        ]
+        self.warnings = [
+            warning for check in self.CHECKS for warning in self._findings[check][1]
+        ]
+
+    def _run_checks(self):
+        self._check_registry_structure()
+
+        valid_categories = frozenset(self.schema.get('properties', {}).get(
+            'category', {}
+        ).get('enum', []))
+        if not valid_categories:
+            self._warn('categories', "No category enum found in schema")
+
+        id_pattern = self.schema.get('properties', {}).get('id', {}).get('pattern')
+
+        state = {
+            'seen_ids': set(),
+            'all_ids': set(),
+            'unicode_map': {},
+            'text_map': {},
+            'related_refs': [],
+            'valid_categories': valid_categories,
+            'category_list': ', '.join(
+                self.schema['properties']['category']['enum']
+            ) if valid_categories else '',
+            'id_pattern': re.compile(id_pattern) if id_pattern else None,
+        }
+
+        glyphs = self.registry.get('glyphs', [])
+        if not isinstance(glyphs, list):
+            glyphs = []
+
+        self.glyph_count = len(glyphs)
+
+        before_duplicates = self._BEFORE_DUPLICATES
+        for i, glyph in enumerate(glyphs):
+            glyph_id = glyph.get('id', '<unknown>')
+            state['all_ids'].add(glyph.get('id'))
+
+            self._check_glyph_id(i, glyph, state)
+            findings = self._glyph_findings(glyph_id, glyph, state)
+            for check, severity, message in findings:
+                if check in before_duplicates:
+                    self._record(check, severity, message, glyph_id)
+            self._check_duplicates(glyph_id, glyph, state)
+
+            related = glyph.get('metadata', {}).get('relatedGlyphs', [])
+            if related:
+                state['related_refs'].append((glyph_id, related))
+
+            for check, severity, message in findings:
+                if check not in before_duplicates:
+                    self._record(check, severity, message, glyph_id)
+
+        # Cross-glyph checks that need the complete ID set
+        self._check_related_glyphs(state)
+
+        if self.assets_dir is not None:
+            self._check_svg_assets()
+
+    def _cache_keys(self) -> Dict[str, Any]:
+        """
+        Digests of what cached findings depend on.
+
+        'schema' covers the check logic and schema (every finding depends
+        on it), 'registry' the registry bytes and 'svg_key' the SVG assets
+        and budget (None without assets_dir).
+        """
+        if self._keys is None:
+            schema = hashlib.blake2b(digest_size=16)
+            schema.update(str(CACHE_VERSION).encode('ascii'))
+            schema.update(json.dumps(self.schema, sort_keys=True).encode('utf-8'))
+
+            svg_key = None
+            if self.assets_dir is not None:
+                svg = hashlib.blake2b(digest_size=16)
+                svg.update(f"svg|{self.svg_budget}".encode('ascii'))
+                for path in sorted(self.assets_dir.glob('*.svg')):
+                    svg.update(f"|{path.name}|".encode('utf-8'))
+                    svg.update(path.read_bytes())
+                svg_key = svg.hexdigest()
+
+            self._keys = {
+                'schema': schema.hexdigest(),
+                'registry': hashlib.blake2b(self._registry_bytes, digest_size=16).hexdigest(),
+                'svg_key': svg_key,
+            }
+        return self._keys
+
+    def _load_cache(self) -> Dict[str, Any]:
+        """Load the cache if it was written for the current schema and checks."""
+        try:
+            with open(self.cache_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        if not isinstance(data, dict) or data.get('version') != CACHE_VERSION or \
+                data.get('schema') != self._cache_keys()['schema']:
+            return None
+        return data
+
+    def _save_cache(self, findings: List[list]):
+        """Persist this run's findings for the next incremental run."""
+        keys = self._cache_keys()
+        data = {
+            'version': CACHE_VERSION,
+            'schema': keys['schema'],
+            'registry': keys['registry'],
+            'svg_key': keys['svg_key'],
+            'glyphs': self.glyph_count,
+            'findings': findings,
+            'svg': self.svg_results,
+            # Glyphs without findings (usually nearly all of them) are stored
+            # as one string of concatenated digests, which is much faster to
+            # write and read than a dict entry per glyph
+            'clean': ''.join(self._clean_results),
+            'per_glyph': self._glyph_results,
+        }
+        tmp_path = Path(str(self.cache_path) + '.tmp')
+        # dumps() takes the C encoder's fast path; dump() would not
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write(json.dumps(data, separators=(',', ':'), ensure_ascii=False))
+        os.replace(tmp_path, self.cache_path)
+
+    def _record(self, check: str, severity: str, message: str, glyph_id: str = None):
+        """Store or stream one finding, stopping early if configured to."""
+        if self._deferred is not None:
+            self._deferred.append([check, severity, message])
+            return
 
-        return len(self.errors) == 0
+        if self._captured is not None:
+            self._captured.append([check, severity, message, glyph_id])
+
+        if severity == 'error':
+            self.error_count += 1
+        else:
+            self.warning_count += 1
+
+        if self.on_finding is not None:
+            self.on_finding({
+                'registry': str(self.registry_path),
+                'check': check,
+                'severity': severity,
+                'glyph_id': glyph_id,
+                'message': message,
+            })
+        else:
+            bucket = 0 if severity == 'error' else 1
+            self._findings[check][bucket].append(message)
+
+        if self.fail_fast and severity == 'error':
+            raise _StopValidation()
+        if self.max_findings is not None and \
+                self.error_count + self.warning_count >= self.max_findings:
+            raise _StopValidation()
+
+    def _error(self, check: str, message: str, glyph_id: str = None):
+        self._record(check, 'error', message, glyph_id)
+
+    def _warn(self, check: str, message: str, glyph_id: str = None):
+        self._record(check, 'warning', message, glyph_id)
+
+    def _glyph_findings(self, glyph_id: str, glyph: Dict[str, Any],
+                        state: Dict[str, Any]) -> List[list]:
+        """
+        Run the checks that depend only on this glyph and the schema.
+
+        In incremental mode the [check, severity, message] results are
+        looked up by a digest of the glyph's contents, and the checks
+        only run for glyphs not seen in the last run.
+        """
+        digest = None
+        if self.cache_path is not None:
+            # Marshal format 2 has no back-references, so equal glyphs always
+            # serialize to the same bytes; it is several times faster than
+            # json.dumps(). Reordered keys give a new digest, which only
+            # costs a re-check.
+            digest = hashlib.blake2b(
+                marshal.dumps(glyph, 2), digest_size=GLYPH_DIGEST_SIZE
+            ).hexdigest()
+            if digest in self._clean_cache:
+                self._clean_results.append(digest)
+                return []
+            findings = self._glyph_cache.get(digest)
+            if findings is not None:
+                self._glyph_results[digest] = findings
+                return findings
+
+        self.revalidated += 1
+        self._deferred = findings = []
+        try:
+            self._check_required_fields(glyph_id, glyph)
+            if state['valid_categories']:
+                self._check_category(glyph_id, glyph, state)
+            self._check_representations(glyph_id, glyph)
+            self._check_accessibility(glyph_id, glyph)
+            self._check_schema(glyph_id, glyph)
+        finally:
+            self._deferred = None
+
+        if digest is not None:
+            if findings:
+                self._glyph_results[digest] = findings
+            else:
+                self._clean_results.append(digest)
+        return findings
 
     def _check_registry_structure(self):
         """Check top-level registry structure."""
@@ -60,176 +430,198 @@ class RegistryValidator:
 
         for field in required_fields:
             if field not in self.registry:
-                self.errors.append(f"Missing required field: {field}")
+                self._error('registry_structure', f"Missing required field: {field}")
 
         if 'glyphs' in self.registry:
             if not isinstance(self.registry['glyphs'], list):
-                self.errors.append("'glyphs' must be a list")
+                self._error('registry_structure', "'glyphs' must be a list")
             elif len(self.registry['glyphs']) == 0:
-                self.warnings.append("Registry contains no glyphs")
+                self._warn('registry_structure', "Registry contains no glyphs")
 
-    def _check_glyph_ids(self):
+    def _check_glyph_id(self, i: int, glyph: Dict[str, Any], state: Dict[str, Any]):
         """Check glyph ID format and uniqueness."""
-        seen_ids = set()
-
-        for i, glyph in enumerate(self.registry.get('glyphs', [])):
-            glyph_id = glyph.get('id')
-
-            if not glyph_id:
-                self.errors.append(f"Glyph at index {i} missing 'id' field")
-                continue
-
-            # Check format: category.name
-            if '.' not in glyph_id:
-                self.errors.append(
-                    f"Glyph ID '{glyph_id}' must be in 'category.name' format"
-                )
-
-            # Check lowercase
-            if glyph_id != glyph_id.lower():
-                self.errors.append(
-                    f"Glyph ID '{glyph_id}' must be lowercase"
-                )
-
-            # Check for duplicates
-            if glyph_id in seen_ids:
-                self.errors.append(f"Duplicate glyph ID: {glyph_id}")
-            else:
-                seen_ids.add(glyph_id)
-
-    def _check_required_fields(self):
-        """Check that all glyphs have required fields."""
-        required = ['id', 'category', 'name', 'description', 'representations']
-
-        for glyph in self.registry.get('glyphs', []):
-            glyph_id = glyph.get('id', '<unknown>')
-
-            for field in required:
-                if field not in glyph:
-                    self.errors.append(
-                        f"Glyph '{glyph_id}' missing required field: {field}"
-                    )
+        glyph_id = glyph.get('id')
 
-    def _check_categories(self):
-        """Validate category values."""
-        valid_categories = self.schema.get('properties', {}).get(
-            'category', {}
-        ).get('enum', [])
-
-        if not valid_categories:
-            self.warnings.append("No category enum found in schema")
+        if not glyph_id:
+            self._error('glyph_ids', f"Glyph at index {i} missing 'id' field")
             return
 
-        for glyph in self.registry.get('glyphs', []):
-            category = glyph.get('category')
-            glyph_id = glyph.get('id', '<unknown>')
-
-            if category and category not in valid_categories:
-                self.errors.append(
-                    f"Glyph '{glyph_id}' has invalid category: {category}. "
-                    f"Must be one of: {', '.join(valid_categories)}"
+        # Check format: category.name
+        if '.' not in glyph_id:
+            self._error(
+                'glyph_ids',
+                f"Glyph ID '{glyph_id}' must be in 'category.name' format",
+                glyph_id
+            )
+
+        # Check lowercase
+        if glyph_id != glyph_id.lower():
+            self._error('glyph_ids', f"Glyph ID '{glyph_id}' must be lowercase", glyph_id)
+
+        # Anything else the schema's ID pattern rejects
+        elif '.' in glyph_id and state['id_pattern'] and \
+                not state['id_pattern'].search(glyph_id):
+            self._error(
+                'glyph_ids',
+                f"Glyph ID '{glyph_id}' does not match {state['id_pattern'].pattern}",
+                glyph_id
+            )
+
+        # Check for duplicates
+        seen_ids = state['seen_ids']
+        if glyph_id in seen_ids:
+            self._error('glyph_ids', f"Duplicate glyph ID: {glyph_id}", glyph_id)
+        else:
+            seen_ids.add(glyph_id)
+
+    def _check_required_fields(self, glyph_id: str, glyph: Dict[str, Any]):
+        """Check that a glyph has all required fields."""
+        for field in self.REQUIRED_FIELDS:
+            if field not in glyph:
+                self._error(
+                    'required_fields',
+                    f"Glyph '{glyph_id}' missing required field: {field}",
+                    glyph_id
                 )
 
-            # Check that category matches ID prefix
-            if category and '.' in glyph_id:
-                id_category = glyph_id.split('.')[0]
-                if id_category != category:
-                    self.errors.append(
-                        f"Glyph '{glyph_id}' category mismatch: "
-                        f"category='{category}' but ID starts with '{id_category}'"
-                    )
+    def _check_category(self, glyph_id: str, glyph: Dict[str, Any], state: Dict[str, Any]):
+        """Validate a glyph's category value."""
+        category = glyph.get('category')
+
+        if category and category not in state['valid_categories']:
+            self._error(
+                'categories',
+                f"Glyph '{glyph_id}' has invalid category: {category}. "
+                f"Must be one of: {state['category_list']}",
+                glyph_id
+            )
+
+        # Check that category matches ID prefix
+        if category and '.' in glyph_id:
+            id_category = glyph_id.split('.')[0]
+            if id_category != category:
+                self._error(
+                    'categories',
+                    f"Glyph '{glyph_id}' category mismatch: "
+                    f"category='{category}' but ID starts with '{id_category}'",
+                    glyph_id
+                )
 
-    def _check_representations(self):
+    def _check_representations(self, glyph_id: str, glyph: Dict[str, Any]):
         """Check representation formats."""
-        for glyph in self.registry.get('glyphs', []):
-            glyph_id = glyph.get('id', '<unknown>')
-            reps = glyph.get('representations', {})
-
-            # Required representations
-            if 'unicode' not in reps:
-                self.errors.append(
-                    f"Glyph '{glyph_id}' missing 'unicode' representation"
+        reps = glyph.get('representations', {})
+
+        # Required representations
+        if 'unicode' not in reps:
+            self._error(
+                'representations',
+                f"Glyph '{glyph_id}' missing 'unicode' representation",
+                glyph_id
+            )
+
+        if 'text' not in reps:
+            self._error(
+                'representations',
+                f"Glyph '{glyph_id}' missing 'text' representation",
+                glyph_id
+            )
+
+        # Check text format: [KEYWORD]
+        text = reps.get('text', '')
+        if text:
+            if not text.startswith('[') or not text.endswith(']'):
+                self._warn(
+                    'representations',
+                    f"Glyph '{glyph_id}' text representation should be "
+                    f"in [KEYWORD] format, got: {text}",
+                    glyph_id
                 )
-
-            if 'text' not in reps:
-                self.errors.append(
-                    f"Glyph '{glyph_id}' missing 'text' representation"
+            if text.upper() != text:
+                self._warn(
+                    'representations',
+                    f"Glyph '{glyph_id}' text representation should be "
+                    f"uppercase: {text}",
+                    glyph_id
                 )
 
-            # Check text format: [KEYWORD]
-            text = reps.get('text', '')
-            if text:
-                if not text.startswith('[') or not text.endswith(']'):
-                    self.warnings.append(
-                        f"Glyph '{glyph_id}' text representation should be "
-                        f"in [KEYWORD] format, got: {text}"
-                    )
-                if text.upper() != text:
-                    self.warnings.append(
-                        f"Glyph '{glyph_id}' text representation should be "
-                        f"uppercase: {text}"
-                    )
-
-    def _check_duplicates(self):
+    def _check_duplicates(self, glyph_id: str, glyph: Dict[str, Any], state: Dict[str, Any]):
         """Check for duplicate representations."""
-        unicode_map = {}
-        text_map = {}
-
-        for glyph in self.registry.get('glyphs', []):
-            glyph_id = glyph.get('id', '<unknown>')
-            reps = glyph.get('representations', {})
-
-            # Check unicode duplicates
-            unicode = reps.get('unicode')
-            if unicode:
-                if unicode in unicode_map:
-                    self.warnings.append(
-                        f"Duplicate unicode representation '{unicode}': "
-                        f"used by '{glyph_id}' and '{unicode_map[unicode]}'"
-                    )
-                else:
-                    unicode_map[unicode] = glyph_id
-
-            # Check text duplicates
-            text = reps.get('text')
-            if text:
-                if text in text_map:
-                    self.errors.append(
-                        f"Duplicate text representation '{text}': "
-                        f"used by '{glyph_id}' and '{text_map[text]}'"
-                    )
-                else:
-                    text_map[text] = glyph_id
+        reps = glyph.get('representations', {})
+
+        # Check unicode duplicates
+        unicode = reps.get('unicode')
+        if unicode:
+            unicode_map = state['unicode_map']
+            if unicode in unicode_map:
+                self._warn(
+                    'duplicates',
+                    f"Duplicate unicode representation '{unicode}': "
+                    f"used by '{glyph_id}' and '{unicode_map[unicode]}'",
+                    glyph_id
+                )
+            else:
+                unicode_map[unicode] = glyph_id
+
+        # Check text duplicates
+        text = reps.get('text')
+        if text:
+            text_map = state['text_map']
+            if text in text_map:
+                self._error(
+                    'duplicates',
+                    f"Duplicate text representation '{text}': "
+                    f"used by '{glyph_id}' and '{text_map[text]}'",
+                    glyph_id
+                )
+            else:
+                text_map[text] = glyph_id
 
-    def _check_related_glyphs(self):
+    def _check_related_glyphs(self, state: Dict[str, Any]):
         """Validate related glyph references."""
-        all_ids = {g.get('id') for g in self.registry.get('glyphs', [])}
-
-        for glyph in self.registry.get('glyphs', []):
-            glyph_id = glyph.get('id', '<unknown>')
-            related = glyph.get('metadata', {}).get('relatedGlyphs', [])
+        all_ids = state['all_ids']
 
+        for glyph_id, related in state['related_refs']:
             for related_id in related:
                 if related_id not in all_ids:
-                    self.errors.append(
+                    self._error(
+                        'related_glyphs',
                         f"Glyph '{glyph_id}' references non-existent "
-                        f"related glyph: {related_id}"
+                        f"related glyph: {related_id}",
+                        glyph_id
                     )
 
-    def _check_accessibility(self):
+    def _check_accessibility(self, glyph_id: str, glyph: Dict[str, Any]):
         """Check accessibility descriptions."""
-        for glyph in self.registry.get('glyphs', []):
-            glyph_id = glyph.get('id', '<unknown>')
-            accessibility = glyph.get('metadata', {}).get('accessibility')
-
-            if not accessibility:
-                self.warnings.append(
-                    f"Glyph '{glyph_id}' missing accessibility description"
-                )
-            elif len(accessibility) < 10:
-                self.warnings.append(
-                    f"Glyph '{glyph_id}' accessibility description is too short"
-                )
+        accessibility = glyph.get('metadata', {}).get('accessibility')
+
+        if not accessibility:
+            self._warn(
+                'accessibility',
+                f"Glyph '{glyph_id}' missing accessibility description",
+                glyph_id
+            )
+        elif len(accessibility) < 10:
+            self._warn(
+                'accessibility',
+                f"Glyph '{glyph_id}' accessibility description is too short",
+                glyph_id
+            )
+
+    def _check_schema(self, glyph_id: str, glyph: Dict[str, Any]):
+        """Check the glyph against the compiled JSON schema."""
+        for path, keyword, message in self._schema_validator(glyph):
+            if (path, keyword) not in self.SCHEMA_COVERED:
+                self._error('schema', f"Glyph '{glyph_id}' schema violation: {message}", glyph_id)
+
+    def _check_svg_assets(self):
+        """Lint the SVG artwork (viewBox, size budget, rasters, scripts, strokes)."""
+        if self._svg_cached is not None:
+            self.svg_results = self._svg_cached
+        else:
+            self.svg_results = lint_assets(self.assets_dir, self.jobs, self.svg_budget)
+        for result in self.svg_results:
+            for severity, message in result['findings']:
+                self._record('svg_assets', severity, f"{result['file']}: {message}")
 
     def _print_report(self):
         """Print validation report."""
@@ -238,10 +630,19 @@ class RegistryValidator:
         print("=" * 70)
         print()
 
-        glyph_count = len(self.registry.get('glyphs', []))
-        print(f"Total glyphs: {glyph_count}")
+        print(f"Total glyphs: {self.glyph_count}")
+        if self.from_cache:
+            print("Incremental: registry unchanged, findings replayed from cache")
+        elif self.cache_path is not None:
+            print(f"Incremental: {self.revalidated} new or changed glyphs re-checked, "
+                  f"cross-glyph checks run on all")
         print()
 
+        if self.svg_results:
+            print(f"SVG ASSETS ({len(self.svg_results)} files, budget {self.svg_budget} bytes):")
+            print_size_report(self.svg_results)
+            print()
+
         if self.errors:
             print(f"ERRORS ({len(self.errors)}):")
             for error in self.errors:
@@ -254,32 +655,328 @@ class RegistryValidator:
                 print(f"  ⚠️  {warning}")
             print()
 
-        if not self.errors and not self.warnings:
+        if self.stopped_early:
+            print(
+                f"Stopped early after {self.error_count + self.warning_count} "
+                f"findings (--fail-fast / --max-findings)."
+            )
+            print()
+        elif not self.errors and not self.warnings:
             print("✅ All checks passed! Registry is valid.")
             print()
 
         print("=" * 70)
 
 
+def validate_file(registry_path: str, schema_path: str, stream: bool = False,
+                  fail_fast: bool = False, max_findings: int = None,
+                  incremental: bool = False) -> Dict[str, Any]:
+    """
+    Validate one registry file without printing.
+
+    Used as the process pool worker in multi-registry mode, so it only
+    takes and returns plain picklable values. With `stream`, findings are
+    returned as structured dicts under 'findings' instead of message lists.
+    """
+    result = {
+        'registry': str(registry_path),
+        'glyphs': 0,
+        'errors': [],
+        'warnings': [],
+        'findings': [],
+        'error_count': 0,
+        'warning_count': 0,
+        'stopped_early': False,
+    }
+
+    try:
+        validator = RegistryValidator(
+            Path(registry_path), Path(schema_path),
+            on_finding=result['findings'].append if stream else None,
+            fail_fast=fail_fast, max_findings=max_findings,
+            cache_path=default_cache_path(registry_path) if incremental else None,
+        )
+        validator.validate(report=False)
+    except (OSError, ValueError) as e:
+        message = f"Could not load registry: {e}"
+        result['errors'].append(message)
+        result['error_count'] = 1
+        if stream:
+            result['findings'].append({
+                'registry': str(registry_path),
+                'check': 'load',
+                'severity': 'error',
+                'glyph_id': None,
+                'message': message,
+            })
+        return result
+
+    result['glyphs'] = validator.glyph_count
+    result['errors'] = validator.errors
+    result['warnings'] = validator.warnings
+    result['error_count'] = validator.error_count
+    result['warning_count'] = validator.warning_count
+    result['stopped_early'] = validator.stopped_early
+    return result
+
+
+def validate_assets(assets_dir: str, budget: int = DEFAULT_BUDGET, jobs: int = None,
+                    stream: bool = False) -> Dict[str, Any]:
+    """
+    Lint the SVG artwork on its own, returning a validate_file()-shaped result.
+
+    Multi-registry mode lints the shared assets once with this instead
+    of once per registry.
+    """
+    result = {
+        'registry': str(assets_dir),
+        'glyphs': 0,
+        'errors': [],
+        'warnings': [],
+        'findings': [],
+        'error_count': 0,
+        'warning_count': 0,
+        'stopped_early': False,
+    }
+
+    result['svg'] = lint_assets(Path(assets_dir), jobs, budget)
+    for svg in result['svg']:
+        for severity, message in svg['findings']:
+            message = f"{svg['file']}: {message}"
+            if stream:
+                result['findings'].append({
+                    'registry': str(assets_dir),
+                    'check': 'svg_assets',
+                    'severity': severity,
+                    'glyph_id': None,
+                    'message': message,
+                })
+            else:
+                result['errors' if severity == 'error' else 'warnings'].append(message)
+            result['error_count' if severity == 'error' else 'warning_count'] += 1
+    return result
+
+
+def _limit_findings(result: Dict[str, Any], remaining: int):
+    """Trim a validate_file() result to at most `remaining` findings."""
+    if result['error_count'] + result['warning_count'] <= remaining:
+        return
+    if result['findings']:
+        kept = result['findings'] = result['findings'][:remaining]
+        result['error_count'] = sum(1 for f in kept if f['severity'] == 'error')
+        result['warning_count'] = len(kept) - result['error_count']
+    else:
+        result['errors'] = result['errors'][:remaining]
+        result['warnings'] = result['warnings'][:remaining - len(result['errors'])]
+        result['error_count'] = len(result['errors'])
+        result['warning_count'] = len(result['warnings'])
+    result['stopped_early'] = True
+
+
+def expand_registry_args(patterns: List[str]) -> List[str]:
+    """Expand registry paths and glob patterns, dropping duplicates."""
+    paths = []
+    seen = set()
+
+    for pattern in patterns:
+        matches = sorted(glob.glob(pattern, recursive=True)) if glob.has_magic(pattern) else [pattern]
+        for match in matches:
+            if match not in seen:
+                seen.add(match)
+                paths.append(match)
+
+    return paths
+
+
+def iter_validate_many(registry_paths: List[str], schema_path: Path, jobs: int = None,
+                       **options) -> Iterator[Dict[str, Any]]:
+    """
+    Validate many registries across a process pool.
+
+    Results are yielded in input order as soon as each one is ready.
+    Closing the generator early cancels registries not yet started.
+    Extra keyword options are passed through to validate_file().
+    """
+    if jobs == 1 or len(registry_paths) == 1:
+        for path in registry_paths:
+            yield validate_file(path, str(schema_path), **options)
+        return
+
+    pool = ProcessPoolExecutor(max_workers=jobs or os.cpu_count() or 1)
+    futures = [
+        pool.submit(validate_file, path, str(schema_path), **options)
+        for path in registry_paths
+    ]
+    try:
+        for future in futures:
+            yield future.result()
+    finally:
+        for future in futures:
+            future.cancel()
+        pool.shutdown()
+
+
+def validate_many(registry_paths: List[str], schema_path: Path, jobs: int = None,
+                  **options) -> List[Dict[str, Any]]:
+    """Validate many registries across a process pool, preserving input order."""
+    return list(iter_validate_many(registry_paths, schema_path, jobs, **options))
+
+
+def _emit_jsonl(record: Dict[str, Any]):
+    """Write one JSON Lines record and flush so consumers see it immediately."""
+    sys.stdout.write(json.dumps(record, ensure_ascii=False) + '\n')
+    sys.stdout.flush()
+
+
+def print_aggregate_report(results: List[Dict[str, Any]], elapsed: float):
+    """Print a combined report for multi-registry validation."""
+    print("=" * 70)
+    print("BeaconGlyphs Registry Validator - Aggregated Report")
+    print("=" * 70)
+    print()
+
+    failed = 0
+    for result in results:
+        errors = result['errors']
+        status = "❌" if result['error_count'] else ("⚠️ " if result['warning_count'] else "✅")
+        count = f"{len(result['svg'])} SVG files" if 'svg' in result else f"{result['glyphs']} glyphs"
+        print(
+            f"  {status} {result['registry']}: {count}, "
+            f"{result['error_count']} errors, {result['warning_count']} warnings"
+            + (" (stopped early)" if result['stopped_early'] else "")
+        )
+        for error in errors:
+            print(f"       ❌ {error}")
+        if result['error_count']:
+            failed += 1
+    print()
+
+    total_glyphs = sum(r['glyphs'] for r in results)
+    print(f"Registries: {len(results)} ({failed} failed)")
+    print(f"Total glyphs: {total_glyphs}")
+    print(f"Total errors: {sum(r['error_count'] for r in results)}")
+    print(f"Total warnings: {sum(r['warning_count'] for r in results)}")
+    print(f"Elapsed: {elapsed:.2f}s")
+    print()
+    print("=" * 70)
+
+
 def main():
     """Main entry point."""
     # Determine paths
     base_path = Path(__file__).parent.parent
-    registry_path = base_path / "src" / "glyphs" / "registry.json"
-    schema_path = base_path / "src" / "schema" / "glyph_schema.json"
-
-    # Check files exist
-    if not registry_path.exists():
-        print(f"Error: Registry not found at {registry_path}")
-        return 1
+    default_registry = base_path / "src" / "glyphs" / "registry.json"
+    default_schema = base_path / "src" / "schema" / "glyph_schema.json"
+
+    parser = argparse.ArgumentParser(description="Validate BeaconGlyphs registries.")
+    parser.add_argument('registries', nargs='*',
+                        help='registry files or glob patterns (default: src/glyphs/registry.json)')
+    parser.add_argument('--schema', type=Path, default=default_schema,
+                        help='glyph schema (default: src/schema/glyph_schema.json)')
+    parser.add_argument('-j', '--jobs', type=int, default=None,
+                        help='worker processes for multi-registry mode (default: CPU count)')
+    parser.add_argument('--format', choices=['text', 'jsonl'], default='text',
+                        help='text report, or one JSON object per finding streamed as found')
+    parser.add_argument('--fail-fast', action='store_true',
+                        help='stop at the first error')
+    parser.add_argument('--max-findings', type=int, default=None, metavar='N',
+                        help='stop after N findings (errors + warnings) in total')
+    parser.add_argument('--incremental', action='store_true',
+                        help='re-check only glyphs changed since the last run, reusing '
+                             'cached findings for the rest (cached next to each registry)')
+    parser.add_argument('--svg', type=Path, nargs='?', const=DEFAULT_ASSETS_DIR, default=None,
+                        metavar='DIR',
+                        help='also lint the SVG artwork in DIR (default: assets/svg)')
+    parser.add_argument('--svg-budget', type=int, default=DEFAULT_BUDGET, metavar='BYTES',
+                        help=f'maximum SVG file size (default: {DEFAULT_BUDGET})')
+    args = parser.parse_args()
+
+    schema_path = args.schema
+    registry_paths = expand_registry_args(args.registries) if args.registries else [str(default_registry)]
+    jsonl = args.format == 'jsonl'
 
     if not schema_path.exists():
         print(f"Error: Schema not found at {schema_path}")
         return 1
 
-    # Validate
-    validator = RegistryValidator(registry_path, schema_path)
-    is_valid = validator.validate()
+    if not registry_paths:
+        print("Error: No registries matched")
+        return 1
+
+    if args.svg is not None and not args.svg.is_dir():
+        print(f"Error: Assets directory not found at {args.svg}")
+        return 1
+
+    # Single registry: full report (or findings streamed as they are found)
+    if len(registry_paths) == 1:
+        registry_path = Path(registry_paths[0])
+        if not registry_path.exists():
+            print(f"Error: Registry not found at {registry_path}")
+            return 1
+
+        validator = RegistryValidator(
+            registry_path, schema_path,
+            on_finding=(lambda f: _emit_jsonl({'type': 'finding', **f})) if jsonl else None,
+            fail_fast=args.fail_fast, max_findings=args.max_findings,
+            cache_path=default_cache_path(registry_path) if args.incremental else None,
+            assets_dir=args.svg, svg_budget=args.svg_budget, jobs=args.jobs,
+        )
+        is_valid = validator.validate(report=not jsonl)
+
+        if jsonl:
+            _emit_jsonl({
+                'type': 'summary',
+                'registries': 1,
+                'errors': validator.error_count,
+                'warnings': validator.warning_count,
+                'stopped_early': validator.stopped_early,
+                'valid': is_valid,
+            })
+
+        return 0 if is_valid else 1
+
+    start = time.perf_counter()
+    results = []
+    findings = 0
+    stopped_early = False
+    for result in iter_validate_many(registry_paths, schema_path, args.jobs, stream=jsonl,
+                                     fail_fast=args.fail_fast, max_findings=args.max_findings,
+                                     incremental=args.incremental):
+        # Each registry stops at the limit on its own; cut the total to it
+        if args.max_findings is not None:
+            _limit_findings(result, args.max_findings - findings)
+        results.append(result)
+        if jsonl:
+            for finding in result['findings']:
+                _emit_jsonl({'type': 'finding', **finding})
+        stopped_early = stopped_early or result['stopped_early']
+
+        findings += result['error_count'] + result['warning_count']
+        if (args.fail_fast and result['error_count']) or \
+                (args.max_findings is not None and findings >= args.max_findings):
+            stopped_early = True
+            break
+
+    if args.svg is not None and not stopped_early:
+        result = validate_assets(args.svg, args.svg_budget, args.jobs, stream=jsonl)
+        results.append(result)
+        if jsonl:
+            for finding in result['findings']:
+                _emit_jsonl({'type': 'finding', **finding})
+
+    is_valid = all(not r['error_count'] for r in results)
+
+    if jsonl:
+        _emit_jsonl({
+            'type': 'summary',
+            'registries': len(results),
+            'errors': sum(r['error_count'] for r in results),
+            'warnings': sum(r['warning_count'] for r in results),
+            'stopped_early': stopped_early,
+            'valid': is_valid,
+        })
+    else:
+        print_aggregate_report(results, time.perf_counter() - start)
 
     return 0 if is_valid else 1
 